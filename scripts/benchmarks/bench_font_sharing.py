@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Measure per-worker memory of forked PDF render workers, with and without
+shared font data.
+
+For each mode a fresh parent process prepares itself, forks --workers
+processes (as ProcessPoolExecutor does on Linux) and each worker renders
+the example resume --renders times. Once every worker has rendered, all of
+them read /proc/self/smaps_rollup at the same time, so shared pages are
+split between the live processes:
+
+- cold:    nothing loaded before fork (a plain pool, e.g. build_resume.py)
+- warm:    fpdf2 imported and font metrics loaded before fork
+           (render_server.py before share_font_data)
+- shared:  share_font_data() before fork: metrics loaded, font file mapped
+           read-only, loaded objects frozen (render_server.py now)
+
+Reported per worker: RSS, PSS (shared pages divided among the processes
+using them) and USS (pages private to the worker), plus total PSS of the
+parent and all workers. The rendered PDFs must be identical in every mode
+(creation date and file ID aside).
+
+Linux only (reads /proc). No large CJK font is needed: --synthetic builds
+a TrueType font with that many CJK glyphs.
+
+Usage:
+    python bench_font_sharing.py                        # current font (see candidate_font_paths)
+    python bench_font_sharing.py --synthetic 30000      # synthetic ~9MB CJK font
+    python bench_font_sharing.py --workers 4 --renders 3 --json results.json
+"""
+
+import json
+import argparse
+import hashlib
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+BENCH_DIR = Path(__file__).resolve().parent           # scripts/benchmarks/
+SCRIPTS_DIR = BENCH_DIR.parent / 'current'            # scripts/current/
+EXAMPLES_DIR = BENCH_DIR.parent.parent / 'examples'
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+MODES = ['cold', 'warm', 'shared']
+SYNTHETIC_OUTLINES = 64     # Distinct glyph outlines, reused across the synthetic font
+
+
+def build_synthetic_font(path: Path, glyphs: int, points: int = 60) -> None:
+    """Write a TrueType font with printable ASCII plus `glyphs` CJK glyphs from U+4E00."""
+    import copy
+    import random
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    rng = random.Random(0)
+    outlines = []
+    for _ in range(SYNTHETIC_OUTLINES):
+        pen = TTGlyphPen(None)
+        for _ in range(4):
+            pen.moveTo((rng.randint(0, 900), rng.randint(-100, 900)))
+            for _ in range(points // 4):
+                pen.lineTo((rng.randint(0, 900), rng.randint(-100, 900)))
+            pen.closePath()
+        outlines.append(pen.glyph())
+
+    cmap = {0x20: 'space'}
+    cmap.update({cp: f"uni{cp:04X}" for cp in range(0x21, 0x7F)})
+    cmap.update({cp: f"uni{cp:04X}" for cp in range(0x4E00, 0x4E00 + glyphs)})
+    glyph_order = ['.notdef'] + list(cmap.values())
+    glyf = {name: copy.deepcopy(outlines[i % SYNTHETIC_OUTLINES]) for i, name in enumerate(glyph_order)}
+    glyf['space'] = TTGlyphPen(None).glyph()
+
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder(glyph_order)
+    fb.setupCharacterMap(cmap)
+    fb.setupGlyf(glyf)
+    fb.setupHorizontalMetrics({name: (250 if name == 'space' else 1000, 0) for name in glyph_order})
+    fb.setupHorizontalHeader(ascent=880, descent=-120)
+    fb.setupNameTable({'familyName': 'SyntheticCJK', 'styleName': 'Regular'})
+    fb.setupOS2(sTypoAscender=880, sTypoDescender=-120, usWinAscent=880, usWinDescent=120)
+    fb.setupPost()
+    fb.save(str(path))
+
+
+def _memory() -> dict:
+    """RSS, PSS and USS of this process in bytes, from /proc/self/smaps_rollup."""
+    values = {}
+    with open('/proc/self/smaps_rollup', 'r') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                values[parts[0].rstrip(':')] = int(parts[1]) * 1024
+    return {
+        'rss': values['Rss'],
+        'pss': values['Pss'],
+        'uss': values['Private_Clean'] + values['Private_Dirty'],
+    }
+
+
+def _normalized_digest(content: bytes) -> str:
+    """Digest of a PDF without its creation date and file ID."""
+    return hashlib.sha1(re.sub(rb'/(CreationDate|ID) [^\n]*', b'', content)).hexdigest()
+
+
+def _worker(data: dict, renders: int, rendered, measured, results) -> None:
+    from create_pdf_resume import render_pdf_resume
+
+    times = []
+    for _ in range(renders):
+        start = time.perf_counter()
+        content = render_pdf_resume(data)
+        times.append(time.perf_counter() - start)
+    rendered.wait()         # Measure only while every worker is alive
+    memory = _memory()
+    results.put({**memory, 'render_s': times, 'digest': _normalized_digest(content)})
+    measured.wait()
+
+
+def run_mode(mode: str, workers: int, renders: int, data_path: str) -> dict:
+    """Prepare this process for `mode`, fork the workers and collect their measurements."""
+    import multiprocessing
+    import create_pdf_resume
+
+    if mode == 'warm':
+        create_pdf_resume._require_fpdf()
+        create_pdf_resume.ResumePDF()
+    elif mode == 'shared':
+        create_pdf_resume.share_font_data()
+
+    with open(data_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    ctx = multiprocessing.get_context('fork')
+    rendered = ctx.Barrier(workers + 1)
+    measured = ctx.Barrier(workers + 1)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(data, renders, rendered, measured, results))
+             for _ in range(workers)]
+    for proc in procs:
+        proc.start()
+    rendered.wait()
+    parent = _memory()
+    samples = [results.get() for _ in procs]
+    measured.wait()
+    for proc in procs:
+        proc.join()
+
+    return {
+        'mode': mode,
+        'parent': parent,
+        'workers': [{key: s[key] for key in ('rss', 'pss', 'uss')} for s in samples],
+        'render_ms': round(sum(sum(s['render_s']) for s in samples) / (workers * renders) * 1000, 1),
+        'digests': sorted({s['digest'] for s in samples}),
+    }
+
+
+def measure(mode: str, args, env: dict) -> dict:
+    """Run one mode in a fresh interpreter."""
+    cmd = [sys.executable, __file__, '--run-mode', mode, '--workers', str(args.workers),
+           '--renders', str(args.renders), '--data', args.data]
+    proc = subprocess.run(cmd, capture_output=True, text=True, env=env)
+    if proc.returncode != 0:
+        output = (proc.stdout + proc.stderr).strip().splitlines()
+        return {'mode': mode, 'error': output[-1] if output else f"exit code {proc.returncode}"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _mb(value: float) -> str:
+    return f"{value / 1024 / 1024:.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure per-worker memory with shared font data")
+    parser.add_argument("--workers", "-j", type=int, default=3, help="Forked workers (default: 3)")
+    parser.add_argument("--renders", "-n", type=int, default=2, help="Renders per worker (default: 2)")
+    parser.add_argument("--font", default=None, help="Font to render with (default: the generator's font)")
+    parser.add_argument("--synthetic", type=int, default=None, metavar='GLYPHS',
+                        help="Build and use a synthetic font with this many CJK glyphs")
+    parser.add_argument("--data", default=str(EXAMPLES_DIR / 'experienced_example.json'),
+                        help="Resume JSON to render (default: examples/experienced_example.json)")
+    parser.add_argument("--modes", type=lambda v: [m.strip() for m in v.split(',') if m.strip()],
+                        default=MODES, help="Comma-separated modes (default: cold,warm,shared)")
+    parser.add_argument("--json", default=None, help="Write results to this JSON file")
+    parser.add_argument("--run-mode", choices=MODES, default=None, help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.run_mode:
+        print(json.dumps(run_mode(args.run_mode, args.workers, args.renders, args.data)))
+        return
+
+    if not Path('/proc/self/smaps_rollup').exists():
+        print("Error: /proc/self/smaps_rollup not available (Linux 4.14+ required)")
+        sys.exit(1)
+    unknown = [m for m in args.modes if m not in MODES]
+    if unknown:
+        print(f"Error: Unknown mode(s): {', '.join(unknown)} (choose from {', '.join(MODES)})")
+        sys.exit(1)
+    if args.workers < 1 or args.renders < 1:
+        print("Error: --workers and --renders must be at least 1")
+        sys.exit(1)
+    if not Path(args.data).exists():
+        print(f"Error: Data file not found: {args.data}")
+        sys.exit(1)
+    if args.font and not Path(args.font).exists():
+        print(f"Error: Font not found: {args.font}")
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory(prefix='resume-font-sharing-') as tmp:
+        env = dict(os.environ, RESUME_FONT_CACHE_DIR=str(Path(tmp) / 'font-cache'))
+        font = args.font
+        if args.synthetic:
+            font = str(Path(tmp) / 'SyntheticCJK.ttf')
+            start = time.perf_counter()
+            build_synthetic_font(Path(font), args.synthetic)
+            print(f"🔤 Synthetic font: {args.synthetic} CJK glyphs, "
+                  f"{Path(font).stat().st_size / 1024 / 1024:.1f} MB ({time.perf_counter() - start:.1f}s)")
+        if font:
+            # Ahead of the bundled font, which would otherwise win
+            env['RESUME_FONT_PATH'] = font
+        os.environ.update(env)
+
+        from create_pdf_resume import candidate_font_paths, load_font_metrics
+        resolved = next((p for p in candidate_font_paths() if p and Path(p).exists()), None)
+        if font and resolved and Path(resolved).resolve() != Path(font).resolve():
+            print("Error: The bundled font takes priority over --font/--synthetic; "
+                  "remove assets/fonts/NotoSansSC.ttf to benchmark another font")
+            sys.exit(1)
+        font = resolved
+        if font is None:
+            print("Error: No font found; use --font or --synthetic GLYPHS")
+            sys.exit(1)
+        # Every mode reads the metrics from the disk cache, as after the first run
+        load_font_metrics(font)
+
+        print(f"📄 Font: {font} ({Path(font).stat().st_size / 1024 / 1024:.1f} MB), "
+              f"{args.workers} workers x {args.renders} renders")
+        results = [measure(mode, args, env) for mode in args.modes]
+
+    print(f"\n{'mode':<8} {'RSS MB':>8} {'PSS MB':>8} {'USS MB':>8} {'total PSS MB':>13} {'render ms':>10}")
+    failures = 0
+    for r in results:
+        if 'error' in r:
+            failures += 1
+            print(f"❌ {r['mode']:<6} {r['error']}")
+            continue
+        n = len(r['workers'])
+        mean = {key: sum(w[key] for w in r['workers']) / n for key in ('rss', 'pss', 'uss')}
+        r['total_pss'] = r['parent']['pss'] + sum(w['pss'] for w in r['workers'])
+        print(f"{r['mode']:<8} {_mb(mean['rss']):>8} {_mb(mean['pss']):>8} {_mb(mean['uss']):>8} "
+              f"{_mb(r['total_pss']):>13} {r['render_ms']:>10.1f}")
+
+    digests = {d for r in results if 'error' not in r for d in r['digests']}
+    if len(digests) > 1:
+        failures += 1
+        print("\n❌ Rendered PDFs differ between modes")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'font': font, 'workers': args.workers, 'renders': args.renders,
+                       'results': results}, f, indent=2)
+        print(f"📋 Results: {args.json}")
+
+    if failures:
+        sys.exit(1)
+    print("\n✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
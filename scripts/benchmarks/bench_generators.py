@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Benchmark the HTML, PDF, DOCX and growth tracker generators on synthetic
+inputs scaled from the bundled examples.
+
+Resumes are built from examples/experienced_example.json with the
+experience, project, education, skill and other lists repeated `scale`
+times (so bullets grow with the entries); growth plans are built from
+examples/growth_plan_example.json with `scale` times as many phases, each
+with the example's tasks. Input size grows linearly with the scale.
+`tracker_update` times updating a tracker to a slightly revised plan (one
+task added, one milestone reworded) instead of rebuilding it.
+`pdf_layout` times the layout-only dry run (layout_pdf_resume) on the
+same resumes as `pdf`.
+
+Each generator is run `--warmup` times untimed, then `--reps` times timed,
+in this process.
+
+Usage:
+    python bench_generators.py                          # 1x, 10x, 100x, all generators
+    python bench_generators.py --scales 1,10 --reps 5 --json results.json
+    python bench_generators.py --compare baseline.json  # fail on regressions
+"""
+
+import io
+import copy
+import json
+import argparse
+import contextlib
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+BENCH_DIR = Path(__file__).resolve().parent           # scripts/benchmarks/
+SCRIPTS_DIR = BENCH_DIR.parent / 'current'            # scripts/current/
+ROOT_DIR = BENCH_DIR.parent.parent
+RESUME_EXAMPLE = ROOT_DIR / 'examples' / 'experienced_example.json'
+GROWTH_EXAMPLE = ROOT_DIR / 'examples' / 'growth_plan_example.json'
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+GENERATORS = ['html', 'pdf', 'pdf_layout', 'docx', 'tracker', 'tracker_streaming', 'tracker_update']
+DEFAULT_SCALES = [1, 10, 100]
+
+
+# ========== Synthetic Inputs ==========
+
+def _repeat(items: list, scale: int) -> list:
+    """Repeat a list `scale` times, tagging copies so the text is not identical."""
+    result = []
+    for n in range(scale):
+        for item in items:
+            if n and isinstance(item, str):
+                item = f"{item}（{n + 1}）"
+            result.append(copy.deepcopy(item))
+    return result
+
+
+def make_resume(scale: int = 1) -> dict:
+    """Resume data with `scale` times the entries (and bullets), projects and skills of the example."""
+    with open(RESUME_EXAMPLE, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    for key in ('experience', 'projects', 'education', 'skills', 'other'):
+        data[key] = _repeat(data.get(key, []), scale)
+    return data
+
+
+def make_growth_plan(scale: int = 1) -> dict:
+    """Growth plan with `scale` times the phases (and tasks) of the example."""
+    with open(GROWTH_EXAMPLE, 'r', encoding='utf-8') as f:
+        plan = json.load(f)
+
+    phases = []
+    for n in range(scale):
+        for phase in plan['phases']:
+            phase = copy.deepcopy(phase)
+            phase['title'] = f"{phase.get('title', '')}（{n + 1}）"
+            phases.append(phase)
+    plan['phases'] = phases
+    plan['timeline'] = f"{len(phases) * 2}个月"
+    return plan
+
+
+# ========== Runners ==========
+
+def _run_html(data: dict, output_path: str) -> None:
+    from create_web_resume import render_template, get_template_path
+    with open(get_template_path('modern'), 'r', encoding='utf-8') as f:
+        template = f.read()
+    html_content = render_template(template, data)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(html_content)
+
+
+def _run_pdf(data: dict, output_path: str) -> None:
+    from create_pdf_resume import create_pdf_resume
+    create_pdf_resume(data, output_path)
+
+
+def _run_pdf_layout(data: dict, output_path: str) -> None:
+    """Layout-only PDF dry run (writes the layout report instead of a PDF)."""
+    from create_pdf_resume import layout_pdf_resume
+    report = layout_pdf_resume(data)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False)
+
+
+def _run_docx(data: dict, output_path: str) -> None:
+    from create_docx_resume import create_resume_docx
+    create_resume_docx(data, output_path)
+
+
+def _run_tracker(plan: dict, output_path: str) -> None:
+    from create_growth_tracker import create_growth_tracker
+    create_growth_tracker(plan, output_path)
+
+
+def _run_tracker_streaming(plan: dict, output_path: str) -> None:
+    from create_growth_tracker import create_growth_tracker
+    create_growth_tracker(plan, output_path, streaming=True)
+
+
+def _revise_plan(plan: dict) -> dict:
+    """A small plan revision: one task added to the first phase and one milestone reworded."""
+    plan = copy.deepcopy(plan)
+    phases = plan['phases']
+    phases[0]['tasks'].insert(1, {'task': '学习Kafka消息队列', 'deadline': '第3周',
+                                  'resources': ['《Kafka权威指南》']})
+    phases[-1]['milestone'] = f"{phases[-1].get('milestone', '')}（修订）"
+    return plan
+
+
+def _run_tracker_update(plan: dict, output_path: str) -> None:
+    """Update a tracker built from `plan` to a revised plan (the timing includes copying the tracker)."""
+    from create_growth_tracker import create_growth_tracker
+    from tracker_update import update_growth_tracker
+    base_path = f"{output_path}.base.xlsx"
+    if not Path(base_path).exists():
+        create_growth_tracker(plan, base_path)
+    shutil.copyfile(base_path, output_path)
+    update_growth_tracker(_revise_plan(plan), output_path)
+
+
+RUNNERS = {
+    'html': (_run_html, make_resume, '.html'),
+    'pdf': (_run_pdf, make_resume, '.pdf'),
+    'pdf_layout': (_run_pdf_layout, make_resume, '.json'),
+    'docx': (_run_docx, make_resume, '.docx'),
+    'tracker': (_run_tracker, make_growth_plan, '.xlsx'),
+    'tracker_streaming': (_run_tracker_streaming, make_growth_plan, '.xlsx'),
+    'tracker_update': (_run_tracker_update, make_growth_plan, '.xlsx'),
+}
+
+
+def bench(generator: str, scale: int, reps: int, warmup: int, work_dir: Path) -> dict:
+    """
+    Time one generator at one scale.
+
+    Returns:
+        Result dictionary with timings in seconds (or an error)
+    """
+    run, make_input, suffix = RUNNERS[generator]
+    data = make_input(scale)
+    output_path = str(work_dir / f"{generator}_{scale}x{suffix}")
+    result = {
+        'generator': generator,
+        'scale': scale,
+        'input_bytes': len(json.dumps(data, ensure_ascii=False).encode('utf-8')),
+        'warmup': warmup,
+        'reps': reps,
+    }
+
+    times = []
+    try:
+        # Renderer progress messages are not part of the measurement output
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(warmup):
+                run(copy.deepcopy(data), output_path)
+            for _ in range(reps):
+                sample = copy.deepcopy(data)
+                start = time.perf_counter()
+                run(sample, output_path)
+                times.append(time.perf_counter() - start)
+    except (Exception, SystemExit) as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+        return result
+
+    result.update({
+        'min_s': round(min(times), 6),
+        'median_s': round(statistics.median(times), 6),
+        'mean_s': round(statistics.mean(times), 6),
+        'max_s': round(max(times), 6),
+        'output_bytes': Path(output_path).stat().st_size,
+    })
+    return result
+
+
+def _library_versions() -> dict:
+    from output_cache import library_version
+    return {name: library_version(name) for name in ('fpdf2', 'python-docx', 'openpyxl', 'fonttools')}
+
+
+def compare(results: list, baseline_path: str, tolerance: float) -> list:
+    """
+    Compare median times with a previous --json run.
+
+    Returns:
+        List of regression messages (median slower than baseline * tolerance)
+    """
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {(r['generator'], r['scale']): r for r in json.load(f)['results']}
+
+    regressions = []
+    for result in results:
+        before = baseline.get((result['generator'], result['scale']))
+        if not before or 'median_s' not in before or 'median_s' not in result:
+            continue
+        ratio = result['median_s'] / before['median_s'] if before['median_s'] else 0
+        result['baseline_median_s'] = before['median_s']
+        result['ratio'] = round(ratio, 3)
+        if ratio > tolerance:
+            regressions.append(f"{result['generator']} {result['scale']}x: "
+                               f"{before['median_s']:.4f}s -> {result['median_s']:.4f}s ({ratio:.2f}x)")
+    return regressions
+
+
+def parse_list(value: str) -> list:
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark resume and growth tracker generators")
+    parser.add_argument("--generators", "-g", type=parse_list, default=GENERATORS,
+                        help=f"Comma-separated generators (default: {','.join(GENERATORS)})")
+    parser.add_argument("--scales", "-s", type=lambda v: [int(x) for x in parse_list(v)],
+                        default=DEFAULT_SCALES, help="Comma-separated input scales (default: 1,10,100)")
+    parser.add_argument("--reps", "-n", type=int, default=3, help="Timed repetitions (default: 3)")
+    parser.add_argument("--warmup", "-w", type=int, default=1, help="Untimed warmup runs (default: 1)")
+    parser.add_argument("--json", default=None, help="Write results to this JSON file")
+    parser.add_argument("--compare", default=None, help="Baseline JSON from a previous --json run")
+    parser.add_argument("--tolerance", type=float, default=1.5,
+                        help="Allowed median slowdown vs. baseline (default: 1.5x)")
+
+    args = parser.parse_args()
+
+    unknown = [g for g in args.generators if g not in RUNNERS]
+    if unknown:
+        print(f"Error: Unknown generator(s): {', '.join(unknown)} (choose from {', '.join(GENERATORS)})")
+        sys.exit(1)
+
+    results = []
+    print(f"{'generator':<9} {'scale':>6} {'input KB':>9} {'median s':>10} {'min s':>10} {'output KB':>10}")
+    with tempfile.TemporaryDirectory(prefix='resume-bench-') as tmp:
+        for generator in args.generators:
+            for scale in args.scales:
+                result = bench(generator, scale, args.reps, args.warmup, Path(tmp))
+                results.append(result)
+                if 'error' in result:
+                    print(f"❌ {generator:<7} {scale:>5}x  {result['error']}")
+                    continue
+                print(f"{generator:<9} {scale:>5}x {result['input_bytes'] / 1024:>9.1f} "
+                      f"{result['median_s']:>10.4f} {result['min_s']:>10.4f} "
+                      f"{result['output_bytes'] / 1024:>10.1f}")
+
+    regressions = compare(results, args.compare, args.tolerance) if args.compare else []
+
+    if args.json:
+        report = {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'libraries': _library_versions(),
+            'config': {'reps': args.reps, 'warmup': args.warmup, 'scales': args.scales},
+            'results': results,
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"📋 Results: {args.json}")
+
+    failed = [r for r in results if 'error' in r]
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) over {args.tolerance}x baseline:")
+        for message in regressions:
+            print(f"   {message}")
+    if failed or regressions:
+        sys.exit(1)
+    print("\n✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
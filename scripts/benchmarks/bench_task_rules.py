@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch classification of growth plan tasks with the task rule table.
+
+Task names are drawn from examples/growth_plan_example.json plus names that
+fall into every rule category (and none), each tagged with a number so no
+two are identical. For each batch size this times:
+
+- compile:    loading and compiling the rule table
+- classify:   TaskRules.classify on every task (one precompiled alternation)
+- break_down: TaskRules.break_down on every task (cached templates)
+- scan:       a reference keyword-by-keyword substring scan in table order
+
+and checks that classify and the reference scan agree on every task.
+
+Usage:
+    python bench_task_rules.py                          # 1000, 10000, 100000 tasks
+    python bench_task_rules.py --counts 5000 --reps 5 --json results.json
+    python bench_task_rules.py --rules my_rules.json
+"""
+
+import json
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+BENCH_DIR = Path(__file__).resolve().parent           # scripts/benchmarks/
+SCRIPTS_DIR = BENCH_DIR.parent / 'current'            # scripts/current/
+GROWTH_EXAMPLE = BENCH_DIR.parent.parent / 'examples' / 'growth_plan_example.json'
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+DEFAULT_COUNTS = [1000, 10000, 100000]
+EXTRA_TASKS = [
+    'Learn Rust ownership', '构建个人博客', 'Build a REST API', '研读Kafka文档', 'Read the SRE book',
+    'LeetCode刷题100道', '整理面试题目', '准备简历', '参加技术分享', '优化系统性能', '写技术博客',
+]
+
+
+def make_tasks(count: int, seed: int = 0) -> list:
+    """`count` distinct task names drawn from the example plan and EXTRA_TASKS."""
+    with open(GROWTH_EXAMPLE, 'r', encoding='utf-8') as f:
+        plan = json.load(f)
+    names = [t.get('task', t.get('name', '')) for p in plan['phases'] for t in p.get('tasks', [])]
+    names += EXTRA_TASKS
+    rng = random.Random(seed)
+    return [f"{rng.choice(names)}（{n}）" for n in range(count)]
+
+
+def scan(rule_table: dict, task_name: str) -> int:
+    """Reference classification: substring test of every keyword, category by category."""
+    task_lower = task_name.lower()
+    categories = rule_table.get('categories', [])
+    for index, category in enumerate(categories):
+        if any(kw.lower() in task_lower for kw in category['keywords']):
+            return index
+    return len(categories)
+
+
+def _time(func, reps: int) -> list:
+    times = []
+    for _ in range(reps):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def bench(count: int, reps: int, rules_path: str, weeks: int) -> dict:
+    """
+    Time classification of `count` tasks.
+
+    Returns:
+        Result dictionary with median times in seconds (or an error)
+    """
+    from growth_schedule import TaskRules, load_task_rules, TASK_RULES_FILE
+
+    path = rules_path or TASK_RULES_FILE
+    rules = load_task_rules(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        rule_table = json.load(f)
+    tasks = make_tasks(count)
+
+    compile_s = statistics.median(_time(lambda: TaskRules(rule_table), reps))
+    categories = [rules.classify(name) for name in tasks]
+    mismatches = sum(1 for name, category in zip(tasks, categories) if scan(rule_table, name) != category)
+
+    result = {
+        'tasks': count,
+        'reps': reps,
+        'compile_s': round(compile_s, 6),
+        'classify_s': round(statistics.median(_time(lambda: [rules.classify(n) for n in tasks], reps)), 6),
+        'break_down_s': round(statistics.median(
+            _time(lambda: [rules.break_down(n, weeks) for n in tasks], reps)), 6),
+        'scan_s': round(statistics.median(_time(lambda: [scan(rule_table, n) for n in tasks], reps)), 6),
+        'categories': {rules.names[i]: categories.count(i) for i in range(len(rules.names))},
+    }
+    if mismatches:
+        result['error'] = f"{mismatches} task(s) classified differently from the reference scan"
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch task classification")
+    parser.add_argument("--counts", "-c", type=lambda v: [int(x) for x in v.split(',') if x.strip()],
+                        default=DEFAULT_COUNTS, help="Comma-separated batch sizes (default: 1000,10000,100000)")
+    parser.add_argument("--reps", "-n", type=int, default=3, help="Timed repetitions (default: 3)")
+    parser.add_argument("--weeks", type=int, default=3, help="Weeks available per task (default: 3)")
+    parser.add_argument("--rules", default=None, help="Rule table JSON (default: the bundled table)")
+    parser.add_argument("--json", default=None, help="Write results to this JSON file")
+
+    args = parser.parse_args()
+
+    if args.rules and not Path(args.rules).exists():
+        print(f"Error: Rule table not found: {args.rules}")
+        sys.exit(1)
+
+    results = []
+    print(f"{'tasks':>8} {'compile ms':>11} {'classify µs':>12} {'break_down µs':>14} {'scan µs':>9}")
+    for count in args.counts:
+        try:
+            result = bench(count, args.reps, args.rules, args.weeks)
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot load task rules: {e}")
+            sys.exit(1)
+        results.append(result)
+        us = {key: result[key] / count * 1e6 for key in ('classify_s', 'break_down_s', 'scan_s')}
+        print(f"{count:>8} {result['compile_s'] * 1000:>11.3f} {us['classify_s']:>12.2f} "
+              f"{us['break_down_s']:>14.2f} {us['scan_s']:>9.2f}")
+        if 'error' in result:
+            print(f"❌ {result['error']}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'results': results}, f, ensure_ascii=False, indent=2)
+        print(f"📋 Results: {args.json}")
+
+    if any('error' in r for r in results):
+        sys.exit(1)
+    print("\n✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
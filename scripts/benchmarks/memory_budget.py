@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Measure and enforce peak memory budgets of the generators.
+
+Each generator renders every bundled example in a fresh interpreter with
+`--memory`, which reports:
+
+- peak_bytes:     peak Python allocation traced by tracemalloc
+- rss_peak_bytes: resident set size high-water mark of the process
+
+Every run starts with an empty font cache, so PDF numbers include parsing
+the font (the first render in a fresh container).
+
+A scenario fails when either number exceeds its budget in memory_budget.json.
+PDF memory depends heavily on the font that is loaded, so PDF budgets are
+kept per font: one for the bundled NotoSansSC.ttf and one for rendering
+without a font file ("helvetica"). The budget of the font the renderer would
+load here is enforced; `--record` only replaces that font's budgets.
+
+Usage:
+    python memory_budget.py                  # check against memory_budget.json
+    python memory_budget.py --record         # re-record budgets from this machine
+    python memory_budget.py --json out.json  # also write the measurements
+"""
+
+import json
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+
+BENCH_DIR = Path(__file__).resolve().parent           # scripts/benchmarks/
+SCRIPTS_DIR = BENCH_DIR.parent / 'current'            # scripts/current/
+EXAMPLES_DIR = BENCH_DIR.parent.parent / 'examples'
+BUDGET_FILE = BENCH_DIR / 'memory_budget.json'
+
+RESUME_EXAMPLES = ['resume_data_example', 'fresh_graduate_example', 'experienced_example']
+GROWTH_EXAMPLES = ['growth_plan_example']
+
+
+def _commands(work_dir: Path) -> dict:
+    """script -> scenario -> command line arguments (output goes to work_dir)."""
+    scenarios = {
+        'create_pdf_resume.py': {},
+        'create_docx_resume.py': {},
+        'create_web_resume.py': {},
+        'create_growth_tracker.py': {},
+    }
+    for example in RESUME_EXAMPLES:
+        data = str(EXAMPLES_DIR / f"{example}.json")
+        scenarios['create_pdf_resume.py'][example] = [
+            '--data', data, '--output', str(work_dir / 'out.pdf'), '--no-cache']
+        scenarios['create_docx_resume.py'][example] = [
+            str(work_dir / 'out.docx'), '--data', data, '--no-cache']
+        scenarios['create_web_resume.py'][example] = [
+            '--data', data, '--output', str(work_dir / 'out.html'), '--no-cache']
+    for example in GROWTH_EXAMPLES:
+        scenarios['create_growth_tracker.py'][example] = [
+            '--plan', str(EXAMPLES_DIR / f"{example}.json"), '--output', str(work_dir / 'out.xlsx')]
+    return scenarios
+
+
+def current_font() -> str:
+    """File name of the main font the PDF generator would load ('helvetica' if there is none)."""
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    from font_resolver import pdf_fonts
+    fonts = pdf_fonts()
+    return Path(fonts[0]['path']).name if fonts else 'helvetica'
+
+
+def budget_limit(budget: dict, script: str, scenario: str, font: str) -> dict:
+    """Budget of one scenario (PDF budgets are looked up for `font`), or None."""
+    limit = budget.get(script, {}).get(scenario)
+    if limit and 'fonts' in limit:
+        return limit['fonts'].get(font)
+    return limit
+
+
+def measure(script: str, args: list, work_dir: Path) -> dict:
+    """Render one scenario with --memory and return its memory report."""
+    report_path = work_dir / 'memory.json'
+    cmd = [sys.executable, str(SCRIPTS_DIR / script)] + args + ['--memory', str(report_path)]
+    env = dict(os.environ, RESUME_FONT_CACHE_DIR=tempfile.mkdtemp(prefix='font-cache-', dir=work_dir))
+    proc = subprocess.run(cmd, capture_output=True, text=True, cwd=work_dir, env=env)
+    if proc.returncode != 0 or not report_path.exists():
+        output = (proc.stdout + proc.stderr).strip().splitlines()
+        return {'error': output[-1] if output else f"exit code {proc.returncode}"}
+    with open(report_path, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    report_path.unlink()
+    return {
+        'peak_bytes': report['peak_bytes'],
+        'rss_peak_bytes': report['rss_peak_bytes'],
+        'top_allocations': report['top_allocations'][:3],
+    }
+
+
+def _mb(value) -> str:
+    return '-' if value is None else f"{value / 1024 / 1024:.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure and enforce generator peak memory budgets")
+    parser.add_argument("--record", action="store_true",
+                        help="Write current measurements (times --headroom) as the new budget")
+    parser.add_argument("--headroom", type=float, default=1.5,
+                        help="Budget multiplier when recording (default: 1.5)")
+    parser.add_argument("--budget", default=str(BUDGET_FILE), help="Budget JSON file")
+    parser.add_argument("--json", default=None, help="Write measurements to this JSON file")
+
+    args = parser.parse_args()
+
+    font = current_font()
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='resume-memory-') as tmp:
+        for script, scenarios in _commands(Path(tmp)).items():
+            results[script] = {}
+            for scenario, script_args in scenarios.items():
+                results[script][scenario] = measure(script, script_args, Path(tmp))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'font': font, 'results': results}, f, indent=2)
+
+    if args.record:
+        try:
+            with open(args.budget, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+        except (OSError, ValueError):
+            previous = {}
+        budget = {}
+        for script, scenarios in results.items():
+            budget[script] = {}
+            for scenario, r in scenarios.items():
+                if 'error' in r:
+                    continue
+                entry = {
+                    'peak_bytes': int(r['peak_bytes'] * args.headroom),
+                    'rss_peak_bytes': int(r['rss_peak_bytes'] * args.headroom) if r['rss_peak_bytes'] else None,
+                }
+                if script == 'create_pdf_resume.py':
+                    # Keep the budgets recorded with other fonts
+                    fonts = dict(previous.get(script, {}).get(scenario, {}).get('fonts', {}))
+                    fonts[font] = entry
+                    entry = {'fonts': dict(sorted(fonts.items()))}
+                budget[script][scenario] = entry
+        with open(args.budget, 'w', encoding='utf-8') as f:
+            json.dump(budget, f, indent=2)
+            f.write('\n')
+        print(f"✅ Budget recorded: {args.budget}")
+
+    with open(args.budget, 'r', encoding='utf-8') as f:
+        budget = json.load(f)
+
+    failures = 0
+    print(f"{'script':<26} {'scenario':<24} {'peak MB':>14} {'RSS MB':>14}")
+    for script, scenarios in results.items():
+        for scenario, r in scenarios.items():
+            if 'error' in r:
+                failures += 1
+                print(f"❌ {script:<24} {scenario:<24} {r['error']}")
+                continue
+            limit = budget_limit(budget, script, scenario, font)
+            problems = []
+            enforced = bool(limit)
+            if enforced:
+                if r['peak_bytes'] > limit['peak_bytes']:
+                    problems.append('peak')
+                if limit.get('rss_peak_bytes') and r['rss_peak_bytes'] and \
+                        r['rss_peak_bytes'] > limit['rss_peak_bytes']:
+                    problems.append('rss')
+            peak = f"{_mb(r['peak_bytes'])}/{_mb(limit['peak_bytes']) if limit else '-'}"
+            rss = f"{_mb(r['rss_peak_bytes'])}/{_mb(limit.get('rss_peak_bytes')) if limit else '-'}"
+            mark = '❌' if problems else ('✅' if enforced else '⚠️ ')
+            print(f"{mark} {script:<24} {scenario:<24} {peak:>14} {rss:>14}")
+            if not enforced:
+                fonts = budget.get(script, {}).get(scenario, {}).get('fonts')
+                if fonts:
+                    print(f"   not enforced: no budget for font {font} (budgets: {', '.join(fonts)})")
+                else:
+                    print("   not enforced: no budget for this scenario")
+            if problems:
+                failures += 1
+                print(f"   over budget: {', '.join(problems)}")
+                for site in r['top_allocations']:
+                    print(f"     {site['size_bytes'] / 1024:>10.1f} KB  {site['site']}")
+
+    if failures:
+        print(f"\n❌ {failures} scenario(s) over budget")
+        sys.exit(1)
+    print("\n✅ All generators within memory budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Measure and enforce the cold-start budget of every script entry point.
+
+Each scenario starts a fresh interpreter with `python -X importtime`, so the
+numbers include interpreter startup and all imports, just like an agent
+calling the script in a short-lived subprocess. Two numbers are recorded:
+
+- wall_ms:   wall time of the whole subprocess (best of N runs)
+- import_ms: total import time reported by -X importtime (best of N runs)
+
+Scenarios cover `--help`, a missing input file and, for scripts that read
+resume or plan JSON, a malformed one. None of them should load fpdf2,
+python-docx or openpyxl (checked via the `forbid` list): input is parsed
+before the renderer library is imported. Scenarios run in a temporary
+directory that holds the malformed file.
+
+Usage:
+    python startup_budget.py                 # check against startup_budget.json
+    python startup_budget.py --record        # re-record budgets from this machine
+    python startup_budget.py --json out.json # also write the measurements
+"""
+
+import json
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+BENCH_DIR = Path(__file__).resolve().parent           # scripts/benchmarks/
+SCRIPTS_DIR = BENCH_DIR.parent / 'current'            # scripts/current/
+BUDGET_FILE = BENCH_DIR / 'startup_budget.json'
+
+MISSING = 'does-not-exist.json'
+INVALID = 'invalid.json'
+INVALID_CONTENT = '{"name": "张三", "skills": ['  # truncated JSON
+HEAVY = ['fpdf', 'docx', 'openpyxl']
+
+# script -> scenario -> command line arguments
+SCENARIOS = {
+    'create_pdf_resume.py': {
+        'help': ['--help'],
+        'missing_input': ['--data', MISSING],
+        'invalid_json': ['--data', INVALID],
+    },
+    'create_docx_resume.py': {
+        'help': ['--help'],
+        'missing_input': ['out.docx', '--data', MISSING],
+        'invalid_json': ['out.docx', '--data', INVALID],
+    },
+    'create_growth_tracker.py': {
+        'help': ['--help'],
+        'missing_input': ['--plan', MISSING],
+        'invalid_json': ['--plan', INVALID],
+    },
+    'create_web_resume.py': {
+        'help': ['--help'],
+        'missing_input': ['--data', MISSING],
+        'invalid_json': ['--data', INVALID],
+    },
+    'build_resume.py': {
+        'help': ['--help'],
+        'missing_input': ['--data', MISSING],
+        'invalid_json': ['--data', INVALID],
+    },
+    'validate_data.py': {
+        'help': ['--help'],
+        'missing_input': [MISSING],
+        'invalid_json': [INVALID],
+    },
+    'growth_schedule.py': {
+        'help': ['--help'],
+        'missing_input': ['--plan', MISSING],
+        'invalid_json': ['--plan', INVALID],
+    },
+    'tracker_progress.py': {
+        'help': ['--help'],
+        'missing_input': [MISSING],
+    },
+    'render_server.py': {
+        'help': ['--help'],
+    },
+    'font_resolver.py': {
+        'help': ['--help'],
+    },
+    'render_client.py': {
+        'help': ['--help'],
+        'missing_input': ['--health', '--server', f"unix:///{MISSING}.sock"],
+    },
+}
+
+
+def parse_importtime(stderr: str) -> tuple:
+    """
+    Parse `-X importtime` output.
+
+    Returns:
+        (total import time in ms, set of imported top-level package names)
+    """
+    total_us = 0
+    modules = set()
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        try:
+            _, cumulative, name = line[len('import time:'):].split('|', 2)
+        except ValueError:
+            continue
+        modules.add(name.strip().split('.')[0])
+        # Only top-level imports (no indentation) add up to the total
+        if not name[1:].startswith(' '):
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+def measure(script: str, args: list, runs: int, work_dir: str) -> dict:
+    """Run one scenario `runs` times in work_dir and keep the best wall/import times."""
+    cmd = [sys.executable, '-X', 'importtime', str(SCRIPTS_DIR / script)] + args
+    wall, imports, modules = [], [], set()
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run(cmd, capture_output=True, text=True, cwd=work_dir)
+        wall.append((time.perf_counter() - start) * 1000)
+        import_ms, seen = parse_importtime(proc.stderr)
+        imports.append(import_ms)
+        modules |= seen
+    return {
+        'wall_ms': round(min(wall), 1),
+        'import_ms': round(min(imports), 1),
+        'heavy_imports': sorted(m for m in HEAVY if m in modules),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure and enforce script cold-start budgets")
+    parser.add_argument("--runs", "-n", type=int, default=5, help="Runs per scenario (best is kept)")
+    parser.add_argument("--record", action="store_true",
+                        help="Write current measurements (times --headroom) as the new budget")
+    parser.add_argument("--headroom", type=float, default=2.0,
+                        help="Budget multiplier when recording (default: 2.0)")
+    parser.add_argument("--budget", default=str(BUDGET_FILE), help="Budget JSON file")
+    parser.add_argument("--json", default=None, help="Write measurements to this JSON file")
+
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        Path(work_dir, INVALID).write_text(INVALID_CONTENT, encoding='utf-8')
+        for script, scenarios in SCENARIOS.items():
+            results[script] = {}
+            for scenario, script_args in scenarios.items():
+                results[script][scenario] = measure(script, script_args, args.runs, work_dir)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if args.record:
+        budget = {
+            script: {
+                scenario: {
+                    'wall_ms': round(r['wall_ms'] * args.headroom, 1),
+                    'import_ms': round(r['import_ms'] * args.headroom, 1),
+                    'forbid': HEAVY,
+                }
+                for scenario, r in scenarios.items()
+            }
+            for script, scenarios in results.items()
+        }
+        with open(args.budget, 'w', encoding='utf-8') as f:
+            json.dump(budget, f, indent=2)
+            f.write('\n')
+        print(f"✅ Budget recorded: {args.budget}")
+
+    with open(args.budget, 'r', encoding='utf-8') as f:
+        budget = json.load(f)
+
+    failures = 0
+    print(f"{'script':<26} {'scenario':<14} {'wall ms':>14} {'import ms':>14}  heavy imports")
+    for script, scenarios in results.items():
+        for scenario, r in scenarios.items():
+            limit = budget.get(script, {}).get(scenario)
+            problems = []
+            if limit:
+                if r['wall_ms'] > limit['wall_ms']:
+                    problems.append('wall')
+                if r['import_ms'] > limit['import_ms']:
+                    problems.append('import')
+                if set(r['heavy_imports']) & set(limit.get('forbid', [])):
+                    problems.append('forbidden import')
+            wall = f"{r['wall_ms']}/{limit['wall_ms']}" if limit else f"{r['wall_ms']}/-"
+            imports = f"{r['import_ms']}/{limit['import_ms']}" if limit else f"{r['import_ms']}/-"
+            mark = '❌' if problems else '✅'
+            print(f"{mark} {script:<24} {scenario:<14} {wall:>14} {imports:>14}  "
+                  f"{', '.join(r['heavy_imports']) or '-'}")
+            if problems:
+                failures += 1
+                print(f"   over budget: {', '.join(problems)}")
+
+    if failures:
+        print(f"\n❌ {failures} scenario(s) over budget")
+        sys.exit(1)
+    print("\n✅ All scripts within startup budget")
+
+
+if __name__ == "__main__":
+    main()
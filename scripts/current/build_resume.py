@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Build a resume in several formats from one JSON file in a single command.
+
+Usage:
+    python build_resume.py --data resume_data.json --formats html,pdf,docx --output-dir out/
+
+The JSON is parsed and checked once, then the renderers run concurrently:
+PDF and DOCX rendering is CPU-bound pure Python, so each runs in its own
+worker process; HTML rendering is fast and runs in the main process while
+the workers are busy. Per-format wall time is reported at the end.
+"""
+
+import io
+import json
+import argparse
+import contextlib
+import sys
+import time
+from pathlib import Path
+
+
+FORMAT_EXTENSIONS = {
+    'html': '.html',
+    'pdf': '.pdf',
+    'docx': '.docx',
+}
+
+# Formats rendered in worker processes (the rest run in the main process)
+PROCESS_FORMATS = {'pdf', 'docx'}
+
+
+def validate_resume_data(data) -> list:
+    """
+    Check the data against the resume schema (see validate_data.py).
+
+    Returns:
+        List of 'path: message' error strings (empty if the data is usable)
+    """
+    from validate_data import validate, format_errors
+    return format_errors(validate(data, 'resume'))
+
+
+def render_format(fmt: str, data, output_path: str, options: dict = None) -> dict:
+    """
+    Render one format and time it. Renderer output is captured, and errors
+    (including the renderers' sys.exit on failure) are returned, not raised.
+
+    Args:
+        fmt: 'html', 'pdf' or 'docx'
+        data: Resume data dictionary or Resume model
+        output_path: Output file path
+        options: Extra renderer options: 'subset' (PDF font subsetting),
+            'cache' (use the output cache), 'cache_dir'
+
+    Returns:
+        Result dictionary with format, output, status, seconds and log/error
+    """
+    options = options or {}
+    log = io.StringIO()
+    cached = False
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(log):
+            output_cache = None
+            if options.get('cache'):
+                from output_cache import OutputCache
+                output_cache = OutputCache(options.get('cache_dir'))
+
+            if fmt == 'html':
+                from create_web_resume import create_web_resume
+                cached = create_web_resume(data, output_path, output_cache=output_cache)
+            elif fmt == 'pdf':
+                from create_pdf_resume import create_pdf_resume
+                cached = create_pdf_resume(data, output_path, subset=options.get('subset', False),
+                                           output_cache=output_cache)['cached']
+            elif fmt == 'docx':
+                from create_docx_resume import create_resume_docx
+                cached = create_resume_docx(data, output_path, output_cache=output_cache)
+            else:
+                raise ValueError(f"Unknown format: {fmt}")
+        status, error = 'ok', None
+    except SystemExit:
+        status = 'error'
+        lines = [line for line in log.getvalue().splitlines() if line.strip()]
+        error = lines[-1] if lines else 'renderer exited with an error'
+    except Exception as e:
+        status, error = 'error', f"{type(e).__name__}: {e}"
+
+    result = {
+        'format': fmt,
+        'output': output_path,
+        'status': status,
+        'seconds': round(time.perf_counter() - start, 4),
+        'cached': bool(cached),
+    }
+    if error:
+        result['error'] = error
+    return result
+
+
+def build_resume(data: dict, output_dir: str, formats: list, basename: str = 'resume',
+                 options: dict = None) -> list:
+    """
+    Render the requested formats concurrently.
+
+    Args:
+        data: Parsed resume data (dictionary or Resume model)
+        output_dir: Directory for the generated files
+        formats: Formats to render ('html', 'pdf', 'docx')
+        basename: Output file name without extension
+        options: Extra renderer options passed to render_format()
+
+    Returns:
+        Per-format results in the requested order
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from resume_model import Resume
+
+    # Normalize once; the model is shared by (and pickled to) every renderer
+    data = Resume.from_dict(data)
+
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    outputs = {fmt: str(out_dir / f"{basename}{FORMAT_EXTENSIONS[fmt]}") for fmt in formats}
+
+    results = {}
+    process_formats = [fmt for fmt in formats if fmt in PROCESS_FORMATS]
+    local_formats = [fmt for fmt in formats if fmt not in PROCESS_FORMATS]
+
+    if process_formats:
+        with ProcessPoolExecutor(max_workers=len(process_formats)) as pool:
+            futures = {
+                fmt: pool.submit(render_format, fmt, data, outputs[fmt], options)
+                for fmt in process_formats
+            }
+            # Render the cheap formats while the workers are busy
+            for fmt in local_formats:
+                results[fmt] = render_format(fmt, data, outputs[fmt], options)
+            for fmt, future in futures.items():
+                results[fmt] = future.result()
+    else:
+        for fmt in local_formats:
+            results[fmt] = render_format(fmt, data, outputs[fmt], options)
+
+    return [results[fmt] for fmt in formats]
+
+
+def parse_formats(value: str) -> list:
+    """Parse a comma-separated format list, keeping order and dropping duplicates."""
+    formats = []
+    for fmt in value.split(','):
+        fmt = fmt.strip().lower()
+        if not fmt:
+            continue
+        if fmt not in FORMAT_EXTENSIONS:
+            raise argparse.ArgumentTypeError(
+                f"unknown format '{fmt}' (choose from {', '.join(FORMAT_EXTENSIONS)})")
+        if fmt not in formats:
+            formats.append(fmt)
+    if not formats:
+        raise argparse.ArgumentTypeError("no formats given")
+    return formats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build HTML/PDF/DOCX resumes from one JSON file")
+    parser.add_argument("--data", "-d", required=True, help="JSON file with resume data")
+    parser.add_argument("--formats", "-f", type=parse_formats, default=['html', 'pdf', 'docx'],
+                        help="Comma-separated formats: html,pdf,docx (default: all)")
+    parser.add_argument("--output-dir", "-o", default=".", help="Output directory (default: .)")
+    parser.add_argument("--basename", "-n", default="resume",
+                        help="Output file name without extension (default: resume)")
+    parser.add_argument("--subset-fonts", action="store_true",
+                        help="PDF: embed only the glyphs used")
+    parser.add_argument("--report", default=None, help="Write per-format results as JSON to this file")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Output cache directory (default: $RESUME_OUTPUT_CACHE_DIR or ~/.cache/resume-assistant/outputs)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always render, bypassing the output cache")
+
+    args = parser.parse_args()
+
+    # Load and check data once for all renderers
+    data_path = Path(args.data)
+    if not data_path.exists():
+        print(f"Error: Data file not found: {args.data}")
+        sys.exit(1)
+
+    with open(data_path, 'r', encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            print(f"Error: Invalid JSON in {args.data}: {e}")
+            sys.exit(1)
+
+    errors = validate_resume_data(data)
+    if errors:
+        print(f"Error: Invalid resume data in {args.data}:")
+        for error in errors:
+            print(f"  - {error}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    results = build_resume(data, args.output_dir, args.formats, args.basename,
+                           {'subset': args.subset_fonts, 'cache': not args.no_cache,
+                            'cache_dir': args.cache_dir})
+    total = time.perf_counter() - start
+
+    for result in results:
+        if result['status'] == 'ok':
+            cached = ' (cached)' if result['cached'] else ''
+            print(f"✅ {result['format'].upper():<5} {result['seconds']:.3f}s  {result['output']}{cached}")
+        else:
+            print(f"❌ {result['format'].upper():<5} {result['seconds']:.3f}s  {result['error']}")
+    print(f"⏱️  Total wall time: {total:.3f}s")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({'total_seconds': round(total, 4), 'results': results}, f,
+                      ensure_ascii=False, indent=2)
+
+    if any(result['status'] != 'ok' for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
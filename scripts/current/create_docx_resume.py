@@ -4,52 +4,99 @@ Generate DOCX resume from structured data - v2.0.3 Enhanced Version
 
 Key improvements:
 - Unified font sizing across all elements
-- Explicit Chinese font settings (Microsoft YaHei/SimHei)
+- Explicit Chinese font settings (Microsoft YaHei, or $RESUME_DOCX_FONT)
 - Consistent spacing and formatting
 - Better visual hierarchy
 
 Usage:
     python create_docx_resume.py output.docx --data resume_data.json
+    python create_docx_resume.py - --data resume_data.json > output.docx
 
 Dependencies:
     pip install python-docx
 """
 
+import io
+import os
 import sys
 import json
 import argparse
+import contextlib
+from functools import lru_cache
 from pathlib import Path
 
-try:
-    from docx import Document
-    from docx.shared import Inches, Pt, RGBColor, Cm
-    from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
-    from docx.oxml.ns import qn  # For setting Chinese font explicitly
-    from docx.oxml import OxmlElement
-except ImportError:
-    print("Error: python-docx is required. Install with: pip install python-docx")
-    sys.exit(1)
+import font_resolver
+from output_cache import OutputCache, compute_cache_key, file_fingerprint, library_version, replace_output
+from profiling import span, add_profile_arguments, profile_session
+from render_client import add_server_argument, render_to_output, server_for
+from resume_model import Resume
 
+FONT_NAME = "Microsoft YaHei"  # Windows: 微软雅黑; available where the document is opened
 
-# ========== Font Size Constants (Unified) ==========
-FONT_NAME = "Microsoft YaHei"  # Windows: 微软雅黑, can fallback to SimHei
-FONT_SIZE_NAME = Pt(16)        # Name (二号字 equivalent)
-FONT_SIZE_SECTION = Pt(14)     # Section titles (小二号字)
-FONT_SIZE_SUBTITLE = Pt(11)    # Company/Project names (五号字)
-FONT_SIZE_BODY = Pt(10.5)      # Body text (五号字)
-FONT_SIZE_AUXILIARY = Pt(9)    # Contact info, dates (小五号字)
 
-# ========== Color Constants ==========
-COLOR_PRIMARY = RGBColor(44, 62, 80)      # Dark blue-gray
-COLOR_SECONDARY = RGBColor(102, 102, 102) # Medium gray
-COLOR_TERTIARY = RGBColor(136, 136, 136)  # Light gray
+def _require_docx() -> None:
+    """
+    Import python-docx on first use and define the style constants.
+
+    python-docx is slow to import, so it is not loaded for --help or when the
+    data file is missing or invalid. Populates the module-level names below.
+    """
+    global docx, Document, Inches, Pt, RGBColor, Cm
+    global WD_ALIGN_PARAGRAPH, WD_LINE_SPACING, qn, OxmlElement
+    global FONT_SIZE_NAME, FONT_SIZE_SECTION, FONT_SIZE_SUBTITLE, FONT_SIZE_BODY, FONT_SIZE_AUXILIARY
+    global COLOR_PRIMARY, COLOR_SECONDARY, COLOR_TERTIARY
+    if 'docx' in globals():
+        return
+    try:
+        import docx
+        from docx import Document
+        from docx.shared import Inches, Pt, RGBColor, Cm
+        from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+        from docx.oxml.ns import qn  # For setting Chinese font explicitly
+        from docx.oxml import OxmlElement
+    except ImportError:
+        print("Error: python-docx is required. Install with: pip install python-docx")
+        sys.exit(1)
+
+    # ========== Font Size Constants (Unified) ==========
+    FONT_SIZE_NAME = Pt(16)        # Name (二号字 equivalent)
+    FONT_SIZE_SECTION = Pt(14)     # Section titles (小二号字)
+    FONT_SIZE_SUBTITLE = Pt(11)    # Company/Project names (五号字)
+    FONT_SIZE_BODY = Pt(10.5)      # Body text (五号字)
+    FONT_SIZE_AUXILIARY = Pt(9)    # Contact info, dates (小五号字)
+
+    # ========== Color Constants ==========
+    COLOR_PRIMARY = RGBColor(44, 62, 80)      # Dark blue-gray
+    COLOR_SECONDARY = RGBColor(102, 102, 102) # Medium gray
+    COLOR_TERTIARY = RGBColor(136, 136, 136)  # Light gray
+
+
+def get_font_name() -> str:
+    """
+    Document font declared for Chinese text.
+
+    The document is opened on the recipient's machine, so the default is
+    FONT_NAME rather than whatever is installed here. $RESUME_DOCX_FONT
+    overrides it with a family name, or with 'local' for the first CJK font
+    installed on this machine (see font_resolver).
+    """
+    font_name = os.getenv('RESUME_DOCX_FONT') or FONT_NAME
+    if font_name == 'local':
+        return _local_font_name()
+    return font_name
 
 
-def set_chinese_font(run, font_name: str = FONT_NAME):
+@lru_cache(maxsize=None)
+def _local_font_name() -> str:
+    return font_resolver.preferred_family(default=FONT_NAME)
+
+
+def set_chinese_font(run, font_name: str = None):
     """
     Explicitly set Chinese font for a Run object.
     This ensures consistent Chinese character rendering.
     """
+    font_name = font_name or get_font_name()
     run.font.name = font_name
     # Set East Asian font explicitly for Chinese characters
     run._element.rPr.rFonts.set(qn('w:eastAsia'), font_name)
@@ -69,139 +116,187 @@ def add_bullet_point(paragraph):
     pPr.append(numPr)
 
 
-def create_resume_docx(data: dict, output_path: str) -> None:
-    """
-    Create a professional DOCX resume with unified font sizing.
+def _build_docx(resume: Resume) -> 'Document':
+    """Build the resume document in memory (python-docx must already be imported)."""
+    with span("setup"):
+        doc = Document()
 
-    Args:
-        data: Resume data dictionary
-        output_path: Output DOCX file path
-    """
-    doc = Document()
-
-    # Set document margins
-    for section in doc.sections:
-        section.top_margin = Inches(0.6)
-        section.bottom_margin = Inches(0.6)
-        section.left_margin = Inches(0.75)
-        section.right_margin = Inches(0.75)
+        # Set document margins
+        for section in doc.sections:
+            section.top_margin = Inches(0.6)
+            section.bottom_margin = Inches(0.6)
+            section.left_margin = Inches(0.75)
+            section.right_margin = Inches(0.75)
 
     # ========== Header: Name ==========
-    name_para = doc.add_paragraph()
-    name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    name_para.paragraph_format.space_after = Pt(6)
-
-    name_run = name_para.add_run(data.get("name", "姓名"))
-    name_run.bold = True
-    name_run.font.size = FONT_SIZE_NAME
-    name_run.font.color.rgb = COLOR_PRIMARY
-    set_chinese_font(name_run)
-
-    # ========== Header: Contact Info ==========
-    contact_parts = []
-    if data.get("phone"):
-        contact_parts.append(data["phone"])
-    if data.get("email"):
-        contact_parts.append(data["email"])
-    if data.get("linkedin"):
-        contact_parts.append(data["linkedin"])
-    if data.get("github"):
-        contact_parts.append(data["github"])
-
-    if contact_parts:
-        contact_para = doc.add_paragraph()
-        contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        contact_para.paragraph_format.space_after = Pt(12)
-
-        contact_run = contact_para.add_run(" | ".join(contact_parts))
-        contact_run.font.size = FONT_SIZE_AUXILIARY
-        contact_run.font.color.rgb = COLOR_SECONDARY
-        set_chinese_font(contact_run)
+    with span("layout/header"):
+        name_para = doc.add_paragraph()
+        name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        name_para.paragraph_format.space_after = Pt(6)
+
+        name_run = name_para.add_run(resume.name or "姓名")
+        name_run.bold = True
+        name_run.font.size = FONT_SIZE_NAME
+        name_run.font.color.rgb = COLOR_PRIMARY
+        set_chinese_font(name_run)
+
+        # ========== Header: Contact Info ==========
+        contact_line = resume.contact_line(("phone", "email", "linkedin", "github"))
+
+        if contact_line:
+            contact_para = doc.add_paragraph()
+            contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            contact_para.paragraph_format.space_after = Pt(12)
+
+            contact_run = contact_para.add_run(contact_line)
+            contact_run.font.size = FONT_SIZE_AUXILIARY
+            contact_run.font.color.rgb = COLOR_SECONDARY
+            set_chinese_font(contact_run)
 
     # ========== Personal Summary ==========
-    if data.get("summary"):
-        add_section_title(doc, "个人简介")
-        summary_para = doc.add_paragraph()
-        summary_para.paragraph_format.space_after = Pt(12)
-        summary_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.ONE_POINT_FIVE
-
-        summary_run = summary_para.add_run(data["summary"])
-        summary_run.font.size = FONT_SIZE_BODY
-        set_chinese_font(summary_run)
-
-    # ========== Determine Section Order ==========
-    is_fresh_graduate = data.get("is_fresh_graduate", False)
-
-    if is_fresh_graduate:
-        # Fresh graduates: Education → Work Experience → Projects
-        if data.get("education"):
-            add_section_title(doc, "教育背景")
-            for edu in data["education"]:
-                add_education_entry(doc, edu)
-
-        if data.get("experience"):
-            add_section_title(doc, "工作经历")
-            for exp in data["experience"]:
-                add_experience_entry(doc, exp)
-
-        if data.get("projects"):
-            add_section_title(doc, "项目经验")
-            for proj in data["projects"]:
-                add_project_entry(doc, proj)
-    else:
-        # Experienced professionals: Work Experience → Projects → Education
-        if data.get("experience"):
-            add_section_title(doc, "工作经历")
-            for exp in data["experience"]:
-                add_experience_entry(doc, exp)
-
-        if data.get("projects"):
-            add_section_title(doc, "项目经验")
-            for proj in data["projects"]:
-                add_project_entry(doc, proj)
-
-        if data.get("education"):
-            add_section_title(doc, "教育背景")
-            for edu in data["education"]:
-                add_education_entry(doc, edu)
+    if resume.summary:
+        with span("layout/summary"):
+            add_section_title(doc, "个人简介")
+            summary_para = doc.add_paragraph()
+            summary_para.paragraph_format.space_after = Pt(12)
+            summary_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.ONE_POINT_FIVE
+
+            summary_run = summary_para.add_run(resume.summary)
+            summary_run.font.size = FONT_SIZE_BODY
+            set_chinese_font(summary_run)
+
+    # ========== Sections in User-Status Order ==========
+    # Fresh graduates: Education → Work Experience → Projects
+    # Experienced professionals: Work Experience → Projects → Education
+    for section_key in resume.section_order:
+        if section_key == "education" and resume.education:
+            with span("layout/education"):
+                add_section_title(doc, "教育背景")
+                for edu in resume.education:
+                    add_education_entry(doc, edu)
+        elif section_key == "experience" and resume.experience:
+            with span("layout/experience"):
+                add_section_title(doc, "工作经历")
+                for exp in resume.experience:
+                    add_experience_entry(doc, exp)
+        elif section_key == "projects" and resume.projects:
+            with span("layout/projects"):
+                add_section_title(doc, "项目经验")
+                for proj in resume.projects:
+                    add_project_entry(doc, proj)
 
     # ========== Skills ==========
-    if data.get("skills"):
-        add_section_title(doc, "技能清单")
-        for skill in data["skills"]:
-            skill_para = doc.add_paragraph()
-            skill_para.paragraph_format.space_after = Pt(4)
-            skill_para.paragraph_format.left_indent = Inches(0.15)
-
-            # Category (bold)
-            category_run = skill_para.add_run(f"{skill['category']}：")
-            category_run.bold = True
-            category_run.font.size = FONT_SIZE_BODY
-            set_chinese_font(category_run)
-
-            # Items
-            items_run = skill_para.add_run(skill["items"])
-            items_run.font.size = FONT_SIZE_BODY
-            set_chinese_font(items_run)
+    if resume.skills:
+        with span("layout/skills"):
+            add_section_title(doc, "技能清单")
+            for skill in resume.skills:
+                skill_para = doc.add_paragraph()
+                skill_para.paragraph_format.space_after = Pt(4)
+                skill_para.paragraph_format.left_indent = Inches(0.15)
+
+                # Category (bold)
+                category_run = skill_para.add_run(f"{skill.category}：")
+                category_run.bold = True
+                category_run.font.size = FONT_SIZE_BODY
+                set_chinese_font(category_run)
+
+                # Items
+                items_run = skill_para.add_run(skill.items)
+                items_run.font.size = FONT_SIZE_BODY
+                set_chinese_font(items_run)
 
     # ========== Other Information ==========
-    if data.get("other"):
-        add_section_title(doc, "其他")
-        for item in data["other"]:
-            para = doc.add_paragraph()
-            para.paragraph_format.left_indent = Inches(0.25)
-            para.paragraph_format.space_after = Pt(4)
-
-            # Add bullet manually using • symbol
-            run = para.add_run(f"• {item}")
-            run.font.size = FONT_SIZE_BODY
-            set_chinese_font(run)
-
-    doc.save(output_path)
+    if resume.other:
+        with span("layout/other"):
+            add_section_title(doc, "其他")
+            for item in resume.other:
+                para = doc.add_paragraph()
+                para.paragraph_format.left_indent = Inches(0.25)
+                para.paragraph_format.space_after = Pt(4)
+
+                # Add bullet manually using • symbol
+                run = para.add_run(f"• {item}")
+                run.font.size = FONT_SIZE_BODY
+                set_chinese_font(run)
+
+    return doc
+
+
+def write_docx_resume(data, stream) -> None:
+    """
+    Render a DOCX resume into a binary stream, without touching the filesystem.
+
+    Args:
+        data: Resume data dictionary or Resume model
+        stream: Writable binary file object (e.g. io.BytesIO, sys.stdout.buffer)
+    """
+    resume = Resume.from_dict(data)
+    with span("import"):
+        _require_docx()
+    doc = _build_docx(resume)
+
+    with span("write"):
+        if stream.seekable():
+            doc.save(stream)
+        else:
+            # Pipes cannot seek back to finish zip entries; assemble the file in memory first
+            buffer = io.BytesIO()
+            doc.save(buffer)
+            stream.write(buffer.getbuffer())
+
+
+def render_docx_resume(data) -> bytes:
+    """
+    Render a DOCX resume to bytes (see write_docx_resume).
+
+    Returns:
+        DOCX file contents
+    """
+    buffer = io.BytesIO()
+    write_docx_resume(data, buffer)
+    return buffer.getvalue()
+
+
+def create_resume_docx(data, output_path: str, output_cache: OutputCache = None) -> bool:
+    """
+    Create a professional DOCX resume with unified font sizing.
+
+    Args:
+        data: Resume data dictionary or Resume model
+        output_path: Output DOCX file path
+        output_cache: Reuse a previously rendered file for identical input
+
+    Returns:
+        True if the file was served from the output cache
+    """
+    resume = Resume.from_dict(data)
+
+    cache_key = None
+    if output_cache is not None:
+        with span("cache"):
+            version = (f"{file_fingerprint(__file__, font_resolver.__file__)}:"
+                       f"{library_version('python-docx')}:{get_font_name()}")
+            cache_key = compute_cache_key(resume.data, 'docx', version)
+            hit = output_cache.get(cache_key, output_path)
+        if hit:
+            print(f"✅ DOCX resume generated: {output_path} (cached)")
+            return True
+
+    with span("import"):
+        _require_docx()
+
+    doc = _build_docx(resume)
+
+    with span("write"), replace_output(output_path) as tmp_path:
+        doc.save(str(tmp_path))
+    if cache_key is not None:
+        with span("cache"):
+            output_cache.put(cache_key, output_path)
     print(f"✅ DOCX resume generated: {output_path}")
+    return False
 
 
-def add_section_title(doc: Document, title: str) -> None:
+def add_section_title(doc: 'Document', title: str) -> None:
     """
     Add a section title with consistent formatting and underline.
     """
@@ -220,7 +315,7 @@ def add_section_title(doc: Document, title: str) -> None:
     para.paragraph_format.border_bottom = True
 
 
-def add_experience_entry(doc: Document, exp: dict) -> None:
+def add_experience_entry(doc: 'Document', exp: 'Experience') -> None:
     """
     Add a work experience entry with unified font sizing.
     """
@@ -229,44 +324,42 @@ def add_experience_entry(doc: Document, exp: dict) -> None:
     header.paragraph_format.space_after = Pt(4)
 
     # Company name (bold, subtitle size)
-    company_run = header.add_run(exp.get("company", ""))
+    company_run = header.add_run(exp.company)
     company_run.bold = True
     company_run.font.size = FONT_SIZE_SUBTITLE
     set_chinese_font(company_run)
 
     # Position
-    if exp.get("position"):
+    if exp.position:
         sep_run = header.add_run(" | ")
         sep_run.font.size = FONT_SIZE_BODY
         set_chinese_font(sep_run)
 
-        position_run = header.add_run(exp["position"])
+        position_run = header.add_run(exp.position)
         position_run.font.size = FONT_SIZE_BODY
         set_chinese_font(position_run)
 
     # Date (right-aligned using tab)
-    if exp.get("startDate") or exp.get("endDate"):
+    if exp.date_range:
         tab_run = header.add_run("\t")
-        date_text = f"{exp.get('startDate', '')} - {exp.get('endDate', '')}"
-        date_run = header.add_run(date_text)
+        date_run = header.add_run(exp.date_range)
         date_run.font.size = FONT_SIZE_AUXILIARY
         date_run.font.color.rgb = COLOR_TERTIARY
         set_chinese_font(date_run)
 
     # ========== Achievements (bullet points) ==========
-    if exp.get("achievements"):
-        for achievement in exp["achievements"]:
-            para = doc.add_paragraph()
-            para.paragraph_format.left_indent = Inches(0.25)
-            para.paragraph_format.space_after = Pt(2)
+    for achievement in exp.achievements:
+        para = doc.add_paragraph()
+        para.paragraph_format.left_indent = Inches(0.25)
+        para.paragraph_format.space_after = Pt(2)
 
-            # Use bullet symbol
-            run = para.add_run(f"• {achievement}")
-            run.font.size = FONT_SIZE_BODY
-            set_chinese_font(run)
+        # Use bullet symbol
+        run = para.add_run(f"• {achievement}")
+        run.font.size = FONT_SIZE_BODY
+        set_chinese_font(run)
 
 
-def add_project_entry(doc: Document, proj: dict) -> None:
+def add_project_entry(doc: 'Document', proj: 'Project') -> None:
     """
     Add a project entry with unified font sizing.
     """
@@ -275,32 +368,32 @@ def add_project_entry(doc: Document, proj: dict) -> None:
     header.paragraph_format.space_after = Pt(4)
 
     # Project name (bold, subtitle size)
-    name_run = header.add_run(proj.get("name", ""))
+    name_run = header.add_run(proj.name)
     name_run.bold = True
     name_run.font.size = FONT_SIZE_SUBTITLE
     set_chinese_font(name_run)
 
     # Role
-    if proj.get("role"):
+    if proj.role:
         sep_run = header.add_run(" | ")
         sep_run.font.size = FONT_SIZE_BODY
         set_chinese_font(sep_run)
 
-        role_run = header.add_run(proj["role"])
+        role_run = header.add_run(proj.role)
         role_run.font.size = FONT_SIZE_BODY
         role_run.font.color.rgb = COLOR_SECONDARY
         set_chinese_font(role_run)
 
     # Date
-    if proj.get("date"):
+    if proj.date:
         tab_run = header.add_run("\t")
-        date_run = header.add_run(proj["date"])
+        date_run = header.add_run(proj.date)
         date_run.font.size = FONT_SIZE_AUXILIARY
         date_run.font.color.rgb = COLOR_TERTIARY
         set_chinese_font(date_run)
 
     # ========== Tech Stack ==========
-    if proj.get("tech"):
+    if proj.tech:
         tech_para = doc.add_paragraph()
         tech_para.paragraph_format.space_after = Pt(4)
         tech_para.paragraph_format.left_indent = Inches(0.1)
@@ -310,25 +403,23 @@ def add_project_entry(doc: Document, proj: dict) -> None:
         label_run.bold = True
         set_chinese_font(label_run)
 
-        tech_text = proj["tech"] if isinstance(proj["tech"], str) else ", ".join(proj["tech"])
-        tech_run = tech_para.add_run(tech_text)
+        tech_run = tech_para.add_run(proj.tech_text)
         tech_run.font.size = FONT_SIZE_BODY
         tech_run.font.color.rgb = COLOR_SECONDARY
         set_chinese_font(tech_run)
 
     # ========== Project Details (bullet points) ==========
-    if proj.get("details"):
-        for detail in proj["details"]:
-            para = doc.add_paragraph()
-            para.paragraph_format.left_indent = Inches(0.25)
-            para.paragraph_format.space_after = Pt(2)
+    for detail in proj.details:
+        para = doc.add_paragraph()
+        para.paragraph_format.left_indent = Inches(0.25)
+        para.paragraph_format.space_after = Pt(2)
 
-            run = para.add_run(f"• {detail}")
-            run.font.size = FONT_SIZE_BODY
-            set_chinese_font(run)
+        run = para.add_run(f"• {detail}")
+        run.font.size = FONT_SIZE_BODY
+        set_chinese_font(run)
 
 
-def add_education_entry(doc: Document, edu: dict) -> None:
+def add_education_entry(doc: 'Document', edu: 'Education') -> None:
     """
     Add an education entry with unified font sizing.
     """
@@ -337,39 +428,37 @@ def add_education_entry(doc: Document, edu: dict) -> None:
     header.paragraph_format.space_after = Pt(4)
 
     # School name (bold, subtitle size)
-    school_run = header.add_run(edu.get("school", ""))
+    school_run = header.add_run(edu.school)
     school_run.bold = True
     school_run.font.size = FONT_SIZE_SUBTITLE
     set_chinese_font(school_run)
 
     # Degree and Major
-    if edu.get("degree") or edu.get("major"):
+    if edu.degree or edu.major:
         sep_run = header.add_run(" | ")
         sep_run.font.size = FONT_SIZE_BODY
         set_chinese_font(sep_run)
 
-        degree_text = f"{edu.get('degree', '')} · {edu.get('major', '')}"
-        degree_run = header.add_run(degree_text)
+        degree_run = header.add_run(f"{edu.degree} · {edu.major}")
         degree_run.font.size = FONT_SIZE_BODY
         degree_run.font.color.rgb = COLOR_SECONDARY
         set_chinese_font(degree_run)
 
     # Date
-    if edu.get("startDate") or edu.get("endDate"):
+    if edu.date_range:
         tab_run = header.add_run("\t")
-        date_text = f"{edu.get('startDate', '')} - {edu.get('endDate', '')}"
-        date_run = header.add_run(date_text)
+        date_run = header.add_run(edu.date_range)
         date_run.font.size = FONT_SIZE_AUXILIARY
         date_run.font.color.rgb = COLOR_TERTIARY
         set_chinese_font(date_run)
 
     # ========== GPA ==========
-    if edu.get("gpa"):
+    if edu.gpa:
         gpa_para = doc.add_paragraph()
         gpa_para.paragraph_format.left_indent = Inches(0.25)
         gpa_para.paragraph_format.space_after = Pt(4)
 
-        gpa_run = gpa_para.add_run(f"GPA: {edu['gpa']}")
+        gpa_run = gpa_para.add_run(f"GPA: {edu.gpa}")
         gpa_run.font.size = FONT_SIZE_BODY
         gpa_run.font.color.rgb = COLOR_SECONDARY
         set_chinese_font(gpa_run)
@@ -377,8 +466,14 @@ def add_education_entry(doc: Document, edu: dict) -> None:
 
 def main():
     parser = argparse.ArgumentParser(description="Generate DOCX resume from JSON data")
-    parser.add_argument("output", help="Output DOCX file path")
+    parser.add_argument("output", help="Output DOCX file path ('-' for stdout)")
     parser.add_argument("--data", "-d", required=True, help="JSON file with resume data")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Output cache directory (default: $RESUME_OUTPUT_CACHE_DIR or ~/.cache/resume-assistant/outputs)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always render, bypassing the output cache")
+    add_server_argument(parser)
+    add_profile_arguments(parser)
 
     args = parser.parse_args()
 
@@ -389,9 +484,30 @@ def main():
         sys.exit(1)
 
     with open(data_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    create_resume_docx(data, args.output)
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            print(f"Error: Invalid JSON in {args.data}: {e}")
+            sys.exit(1)
+
+    server = server_for(args)
+    if server and render_to_output('docx', data, {}, args.output, server) is not None:
+        if args.output != "-":
+            print(f"✅ DOCX resume generated: {args.output} (render server)")
+        return
+
+    if args.output == "-":
+        # The document goes to stdout, so progress messages go to stderr
+        stdout = sys.stdout.buffer
+        with contextlib.redirect_stdout(sys.stderr), \
+                profile_session(args.profile, args.cprofile, args.memory):
+            write_docx_resume(data, stdout)
+            stdout.flush()
+        return
+
+    output_cache = None if args.no_cache else OutputCache(args.cache_dir)
+    with profile_session(args.profile, args.cprofile, args.memory):
+        create_resume_docx(data, args.output, output_cache=output_cache)
 
 
 if __name__ == "__main__":
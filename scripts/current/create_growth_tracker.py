@@ -4,6 +4,10 @@ Generate growth tracking spreadsheet from ability improvement plan.
 
 Usage:
     python create_growth_tracker.py --plan growth_plan.json --output tracker.xlsx
+    python create_growth_tracker.py --plan revised_plan.json --output tracker.xlsx --update
+    python create_growth_tracker.py --plan growth_plan.json --output - > tracker.xlsx
+    python create_growth_tracker.py --batch plans/ --output-dir trackers/ --workers 8
+    python create_growth_tracker.py --batch plans.jsonl --cohort cohort.xlsx
 
 Generates an Excel spreadsheet with:
 - Weekly task checklist
@@ -12,472 +16,722 @@ Generates an Excel spreadsheet with:
 - Resource links
 """
 
+import io
 import json
 import argparse
+import contextlib
+import os
+import re
 import sys
+import weakref
+from copy import copy
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime
 
-try:
-    import openpyxl
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.utils import get_column_letter
-except ImportError:
-    print("Error: openpyxl is required. Install with: pip install openpyxl")
-    sys.exit(1)
+from growth_schedule import Schedule, build_schedule, default_task_rules
+from profiling import span, add_profile_arguments, profile_session
+from render_client import add_server_argument, render_to_output, server_for
+from validate_data import validate, format_errors
 
 
-def create_growth_tracker(plan_data: dict, output_path: str) -> None:
+def _require_openpyxl() -> None:
+    """
+    Import openpyxl on first use.
+
+    openpyxl is slow to import, so it is not loaded for --help or when the
+    plan file is missing or invalid. Populates the module-level names below.
+    """
+    global openpyxl, Font, PatternFill, Alignment, Border, Side, WriteOnlyCell, get_column_letter
+    if 'openpyxl' in globals():
+        return
+    try:
+        import openpyxl
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+        from openpyxl.utils import get_column_letter
+    except ImportError:
+        print("Error: openpyxl is required. Install with: pip install openpyxl")
+        sys.exit(1)
+
+
+def create_growth_tracker(plan_data: dict, output_path: str, streaming: bool = False,
+                          start_date: date = None) -> None:
     """
     Create an Excel tracking spreadsheet from growth plan data.
 
     Args:
         plan_data: Growth plan dictionary
         output_path: Output Excel file path
+        streaming: Use openpyxl's write-only workbook: rows are written to the
+            file as they are generated, so memory stays bounded for large plans
+            (and the workbook is written about 20% faster)
+        start_date: First day of the plan, used for deadline dates (default: today)
+    """
+    # Week ranges, action items and deadline dates are computed once for all sheets
+    with span('schedule'):
+        schedule = build_schedule(plan_data, start_date)
+
+    _write_tracker(plan_data, schedule, output_path, streaming)
+    print(f"✅ Growth tracker created: {output_path}")
+    print(f"📊 Includes: Overview, Weekly Tasks, Milestones, Resources")
+    print(f"💡 Open in Excel/WPS/Numbers to start tracking!")
+
+
+def write_growth_tracker(plan_data: dict, stream, streaming: bool = False, start_date: date = None) -> None:
+    """
+    Write a growth tracker into a binary stream, without touching the filesystem.
+
+    Args:
+        plan_data: Growth plan dictionary
+        stream: Writable binary file object (e.g. io.BytesIO, sys.stdout.buffer)
+        streaming: Use openpyxl's write-only workbook (see create_growth_tracker)
+        start_date: First day of the plan, used for deadline dates (default: today)
+    """
+    with span('schedule'):
+        schedule = build_schedule(plan_data, start_date)
+
+    if stream.seekable():
+        _write_tracker(plan_data, schedule, stream, streaming)
+    else:
+        # Pipes cannot seek back to finish zip entries; assemble the file in memory first
+        buffer = io.BytesIO()
+        _write_tracker(plan_data, schedule, buffer, streaming)
+        stream.write(buffer.getbuffer())
+
+
+def render_growth_tracker(plan_data: dict, streaming: bool = False, start_date: date = None) -> bytes:
+    """
+    Render a growth tracker to bytes (see write_growth_tracker).
+
+    Returns:
+        XLSX file contents
     """
-    wb = openpyxl.Workbook()
+    buffer = io.BytesIO()
+    write_growth_tracker(plan_data, buffer, streaming, start_date)
+    return buffer.getvalue()
+
 
-    # Remove default sheet
+def _write_tracker(plan_data: dict, schedule: Schedule, output, streaming: bool = False) -> None:
+    """Build the tracker workbook for a computed schedule and save it to a path or binary stream."""
+    with span('import'):
+        _require_openpyxl()
+    wb = openpyxl.Workbook(write_only=streaming)
+
+    # Remove default sheet (write-only workbooks start without one)
     if 'Sheet' in wb.sheetnames:
         wb.remove(wb['Sheet'])
 
     # Create sheets
-    create_overview_sheet(wb, plan_data)
-    create_weekly_tracker_sheet(wb, plan_data)
-    create_milestones_sheet(wb, plan_data)
-    create_resources_sheet(wb, plan_data)
+    with span('sheet/overview'):
+        create_overview_sheet(wb, plan_data, schedule)
+    with span('sheet/weekly'):
+        create_weekly_tracker_sheet(wb, plan_data, schedule)
+    with span('sheet/milestones'):
+        create_milestones_sheet(wb, plan_data, schedule)
+    with span('sheet/resources'):
+        create_resources_sheet(wb, plan_data, schedule)
 
     # Save workbook
-    wb.save(output_path)
-    print(f"✅ Growth tracker created: {output_path}")
-    print(f"📊 Includes: Overview, Weekly Tasks, Milestones, Resources")
-    print(f"💡 Open in Excel/WPS/Numbers to start tracking!")
+    with span('write'):
+        wb.save(output)
+
+
+# ========== Shared Styles and Sheet Writer ==========
+# Sheets are generated as rows of cells; a cell is a plain value or a
+# (value, style key) tuple. Each style combination is registered with the
+# workbook once and copied to cells, instead of building Font/Border objects
+# per sheet or per cell.
+
+@lru_cache(maxsize=None)
+def _style_definitions() -> dict:
+    """Style key -> cell attributes (font, fill, border, alignment), built once and shared by all workbooks."""
+    thin = Side(style='thin')
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    center = Alignment(horizontal='center', vertical='center')
+
+    def solid(color):
+        return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+    return {
+        'title': {'font': Font(size=16, bold=True)},
+        'label': {'font': Font(size=12, bold=True)},
+        'bold': {'font': Font(bold=True)},
+        'cell': {'border': border},
+        'phase': {'border': border, 'fill': solid("D9E1F2")},
+        'task': {'border': border, 'fill': solid("E7E6E6")},
+        'header_blue': {'font': Font(color="FFFFFF", bold=True), 'fill': solid("4472C4"),
+                        'alignment': center, 'border': border},
+        'header_green': {'font': Font(color="FFFFFF", bold=True), 'fill': solid("70AD47"),
+                         'alignment': center, 'border': border},
+        'header_gold': {'font': Font(bold=True), 'fill': solid("FFC000"),
+                        'alignment': center, 'border': border},
+    }
+
+
+_WORKBOOK_STYLES = weakref.WeakKeyDictionary()
+
+
+def _workbook_styles(ws) -> dict:
+    """Style key -> registered style array for the worksheet's workbook (built once per workbook)."""
+    wb = ws.parent
+    styles = _WORKBOOK_STYLES.get(wb)
+    if styles is None:
+        styles = {}
+        for key, attributes in _style_definitions().items():
+            template = WriteOnlyCell(ws)
+            for name, value in attributes.items():
+                setattr(template, name, value)
+            styles[key] = template._style
+        _WORKBOOK_STYLES[wb] = styles
+    return styles
+
+
+def _new_sheet(wb: 'openpyxl.Workbook', title: str, widths: dict, merged=()):
+    """
+    Add a sheet with its column widths and merged ranges.
+
+    Write-only sheets require these before the first row is appended.
 
+    Args:
+        wb: Workbook to add the sheet to
+        title: Sheet title
+        widths: Column letter -> width
+        merged: Cell ranges to merge, e.g. ('A1:E1',)
+    """
+    ws = wb.create_sheet(title)
+    for letter, width in widths.items():
+        ws.column_dimensions[letter].width = width
+    for cell_range in merged:
+        ws.merged_cells.add(cell_range)
+    return ws
+
+
+def _append_rows(ws, rows) -> None:
+    """
+    Append generated rows to a sheet (regular or write-only).
+
+    Args:
+        ws: Worksheet from _new_sheet
+        rows: Iterable of rows (lists of values or (value, style key) tuples)
+    """
+    styles = _workbook_styles(ws)
+
+    if ws.parent.write_only:
+        # One cell per (style key, column), reused for every row: ws.append()
+        # writes a row out before the next one is appended. The sheet's row
+        # converter is replaced so these cells are written as they are;
+        # openpyxl's own tries each value as a plain value first and builds a
+        # new cell after every styled one.
+        def values_to_row(cells, row_idx):
+            for cell in cells:
+                cell.row = row_idx
+                yield cell
+
+        ws._values_to_row = values_to_row
+        reused = {}
+        for row in rows:
+            cells = []
+            for col_idx, item in enumerate(row, 1):
+                value, key = item if isinstance(item, tuple) else (item, None)
+                if value is None and key is None:
+                    continue
+                cell = reused.get((key, col_idx))
+                if cell is None:
+                    cell = reused[key, col_idx] = WriteOnlyCell(ws)
+                    cell.column = col_idx
+                    if key is not None:
+                        cell._style = copy(styles[key])
+                cell.value = value
+                cells.append(cell)
+            ws.append(cells)
+        return
+
+    for row in rows:
+        ws.append([item[0] if isinstance(item, tuple) else item for item in row])
+        row_idx = ws._current_row
+        for col_idx, item in enumerate(row, 1):
+            if isinstance(item, tuple):
+                ws.cell(row=row_idx, column=col_idx)._style = copy(styles[item[1]])
+
+
+def _write_sheet(wb: 'openpyxl.Workbook', title: str, widths: dict, rows, merged=()) -> None:
+    """
+    Write generated rows to a new sheet.
+
+    Args:
+        wb: Workbook to add the sheet to
+        title: Sheet title
+        widths: Column letter -> width
+        rows: Iterable of rows (lists of values or (value, style key) tuples)
+        merged: Cell ranges to merge, e.g. ('A1:E1',)
+    """
+    _append_rows(_new_sheet(wb, title, widths, merged), rows)
+
+
+# Sheet title -> (column widths, merged ranges), in workbook order
+SHEET_LAYOUT = {
+    "总览": ({'A': 15, 'B': 40, 'C': 15}, ('A1:E1',)),
+    "每周任务": ({'A': 10, 'B': 18, 'C': 30, 'D': 45, 'E': 10, 'F': 16, 'G': 12, 'H': 10, 'I': 30}, ()),
+    "里程碑": ({'A': 16, 'B': 30, 'C': 50, 'D': 12, 'E': 15}, ()),
+    "学习资源": ({'A': 20, 'B': 50, 'C': 50, 'D': 12, 'E': 10}, ()),
+}
+
+
+def sheet_rows(schedule: Schedule) -> dict:
+    """Sheet title -> generated rows (as passed to _write_sheet), in workbook order."""
+    return {
+        "总览": _overview_rows(schedule),
+        "每周任务": _weekly_rows(schedule),
+        "里程碑": _milestone_rows(schedule),
+        "学习资源": _resource_rows(schedule),
+    }
 
-def create_overview_sheet(wb: openpyxl.Workbook, plan_data: dict):
+
+def create_overview_sheet(wb: 'openpyxl.Workbook', plan_data: dict, schedule: Schedule = None):
     """Create overview sheet with plan summary."""
-    ws = wb.create_sheet("总览", 0)
+    _require_openpyxl()
+    schedule = schedule or build_schedule(plan_data)
+    widths, merged = SHEET_LAYOUT["总览"]
+    _write_sheet(wb, "总览", widths, _overview_rows(schedule), merged)
 
-    # Styles
-    title_font = Font(size=16, bold=True)
-    header_font = Font(size=12, bold=True)
-    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-    header_font_white = Font(color="FFFFFF", bold=True)
 
+def _overview_rows(schedule: Schedule):
     # Title
-    ws['A1'] = '能力提升计划 - 总览'
-    ws['A1'].font = title_font
-    ws.merge_cells('A1:E1')
-
-    # Parse timeline (支持"3个月"、"12周"等格式)
-    timeline = plan_data.get('timeline', '')
-    duration_weeks = 12  # default
-    if '个月' in timeline:
-        months = int(''.join(filter(str.isdigit, timeline)))
-        duration_weeks = months * 4
-    elif '周' in timeline:
-        duration_weeks = int(''.join(filter(str.isdigit, timeline)))
+    yield [('能力提升计划 - 总览', 'title')]
+    yield []
 
     # Basic info
-    row = 3
-    ws[f'A{row}'] = '目标职位'
-    ws[f'B{row}'] = plan_data.get('target_position', '')
-    ws[f'A{row}'].font = header_font
-    row += 1
-
-    ws[f'A{row}'] = '计划时长'
-    ws[f'B{row}'] = f"{duration_weeks} 周"
-    ws[f'A{row}'].font = header_font
-    row += 1
-
-    ws[f'A{row}'] = '开始日期'
-    ws[f'B{row}'] = datetime.now().strftime('%Y-%m-%d')
-    ws[f'A{row}'].font = header_font
-    row += 2
+    yield [('目标职位', 'label'), schedule.target_position]
+    yield [('计划时长', 'label'), f"{schedule.duration_weeks} 周"]
+    yield [('开始日期', 'label'), schedule.start_date.strftime('%Y-%m-%d')]
+    yield []
 
     # Current match rate
-    ws[f'A{row}'] = '当前匹配度'
-    ws[f'B{row}'] = f"0/10"
-    ws[f'A{row}'].font = header_font
-    row += 1
-
-    ws[f'A{row}'] = '目标匹配度'
-    ws[f'B{row}'] = f"8/10"
-    ws[f'A{row}'].font = header_font
-    row += 2
+    yield [('当前匹配度', 'label'), "0/10"]
+    yield [('目标匹配度', 'label'), "8/10"]
+    yield []
 
     # Phases
-    ws[f'A{row}'] = '阶段规划'
-    ws[f'A{row}'].font = header_font
-    row += 1
-
-    phases = plan_data.get('phases', [])
-    for i, phase in enumerate(phases, 1):
-        ws[f'A{row}'] = f"阶段{i}"
-        # 支持新格式的phase/title字段
-        phase_name = phase.get('title', phase.get('phase', ''))
-        ws[f'B{row}'] = phase_name
-        # 根据阶段数量计算周数
-        weeks_per_phase = duration_weeks // len(phases) if phases else 4
-        start_week = (i-1) * weeks_per_phase + 1
-        end_week = i * weeks_per_phase
-        ws[f'C{row}'] = f"第{start_week}-{end_week}周"
-        row += 1
-
-    # Set column widths
-    ws.column_dimensions['A'].width = 15
-    ws.column_dimensions['B'].width = 40
-    ws.column_dimensions['C'].width = 15
-
-
-def create_weekly_tracker_sheet(wb: openpyxl.Workbook, plan_data: dict):
+    yield [('阶段规划', 'label')]
+
+    for phase in schedule.phases:
+        yield [f"阶段{phase.index}", phase.name, f"第{phase.start_week}-{phase.end_week}周"]
+
+
+def create_weekly_tracker_sheet(wb: 'openpyxl.Workbook', plan_data: dict, schedule: Schedule = None):
     """Create weekly task tracking sheet with detailed daily breakdowns."""
-    ws = wb.create_sheet("每周任务")
-
-    # Styles
-    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-    header_font = Font(color="FFFFFF", bold=True)
-    phase_fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-    task_fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+    _require_openpyxl()
+    schedule = schedule or build_schedule(plan_data)
+    widths, merged = SHEET_LAYOUT["每周任务"]
+    _write_sheet(wb, "每周任务", widths, _weekly_rows(schedule), merged)
+
+
+def _deadline_text(subtask) -> str:
+    """Deadline cell: calendar date plus the relative text, e.g. "03/07（本周五）"."""
+    if subtask.due_date is None:
+        return subtask.deadline
+    return f"{subtask.due_date:%m/%d}（{subtask.deadline}）"
+
 
+def _weekly_rows(schedule: Schedule):
     # Headers
     headers = ['周次', '阶段', '主任务', '具体行动项', '预计工时', '截止日期', '完成状态', '实际用时', '备注']
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-        cell.border = border
+    yield [(header, 'header_blue') for header in headers]
 
     # Tasks
-    row = 2
-    phases = plan_data.get('phases', [])
-
-    # Parse timeline for week calculation
-    timeline = plan_data.get('timeline', '12周')
-    duration_weeks = 12
-    if '个月' in timeline:
-        months = int(''.join(filter(str.isdigit, timeline)))
-        duration_weeks = months * 4
-    elif '周' in timeline:
-        duration_weeks = int(''.join(filter(str.isdigit, timeline)))
-
-    weeks_per_phase = duration_weeks // len(phases) if phases else 4
-
-    for phase_idx, phase in enumerate(phases, 1):
-        # 支持新格式
-        phase_name = phase.get('title', phase.get('phase', ''))
-        start_week = (phase_idx-1) * weeks_per_phase + 1
-        end_week = phase_idx * weeks_per_phase
-
-        # 支持新格式的tasks
-        for task in phase.get('tasks', []):
-            task_name = task.get('task', task.get('name', ''))
-            deadline = task.get('deadline', '')
-
-            # 分解任务为具体行动项
-            subtasks = _break_down_task(task_name, weeks_per_phase)
-
-            for week_offset, subtask_info in enumerate(subtasks):
-                current_week = start_week + week_offset
-                if current_week > end_week:
-                    break
-
-                ws.cell(row=row, column=1, value=f"第{current_week}周")
-                ws.cell(row=row, column=2, value=phase_name if week_offset == 0 else '')
-                ws.cell(row=row, column=3, value=task_name if week_offset == 0 else '')
-                ws.cell(row=row, column=4, value=subtask_info['action'])
-                ws.cell(row=row, column=5, value=subtask_info['hours'])
-                ws.cell(row=row, column=6, value=subtask_info['deadline'])
-                ws.cell(row=row, column=7, value='☐ 未完成')
-                ws.cell(row=row, column=8, value='')
-                ws.cell(row=row, column=9, value='')
-
-                # Apply styling
-                if week_offset == 0:
-                    ws.cell(row=row, column=2).fill = phase_fill
-                    ws.cell(row=row, column=3).fill = task_fill
-
-                # Apply borders
-                for col in range(1, 10):
-                    ws.cell(row=row, column=col).border = border
-
-                row += 1
+    for phase in schedule.phases:
+        for task in phase.tasks:
+            for week_offset, subtask in enumerate(task.subtasks):
+                first = week_offset == 0
+                yield [
+                    (f"第{subtask.week}周", 'cell'),
+                    (phase.name if first else '', 'phase' if first else 'cell'),
+                    (task.name if first else '', 'task' if first else 'cell'),
+                    (subtask.action, 'cell'),
+                    (subtask.hours, 'cell'),
+                    (_deadline_text(subtask), 'cell'),
+                    ('☐ 未完成', 'cell'),
+                    ('', 'cell'),
+                    ('', 'cell'),
+                ]
 
             # 添加空行分隔不同任务
-            row += 1
-
-    # Set column widths
-    ws.column_dimensions['A'].width = 10
-    ws.column_dimensions['B'].width = 18
-    ws.column_dimensions['C'].width = 30
-    ws.column_dimensions['D'].width = 45
-    ws.column_dimensions['E'].width = 10
-    ws.column_dimensions['F'].width = 12
-    ws.column_dimensions['G'].width = 12
-    ws.column_dimensions['H'].width = 10
-    ws.column_dimensions['I'].width = 30
+            yield []
 
     # Add instructions
-    row += 2
-    ws.cell(row=row, column=1, value='使用说明：')
-    ws.cell(row=row, column=1).font = Font(bold=True)
-    row += 1
-    ws.cell(row=row, column=1, value='1. 每天完成具体行动项后，在"完成状态"列改为 ✓ 已完成，并记录实际用时')
-    row += 1
-    ws.cell(row=row, column=1, value='2. 在"备注"列记录学习要点、遇到的问题、解决方案')
-    row += 1
-    ws.cell(row=row, column=1, value='3. 预计工时仅供参考，根据实际情况调整')
-    row += 1
-    ws.cell(row=row, column=1, value='4. 建议每周日回顾本周进度，规划下周任务')
-
-
-def _break_down_task(task_name: str, weeks_available: int) -> list:
-    """
-    将主任务分解为具体的周度行动项。
-
-    Args:
-        task_name: 主任务名称
-        weeks_available: 可用的周数
-
-    Returns:
-        包含具体行动项的列表，每项包含action、hours、deadline
-    """
-    subtasks = []
-
-    # 根据任务类型进行智能分解
-    task_lower = task_name.lower()
-
-    # 学习类任务
-    if any(kw in task_lower for kw in ['学习', '掌握', '了解', '课程', 'learn']):
-        if weeks_available >= 3:
-            subtasks = [
-                {'action': '📚 理论学习：观看课程前1/3内容，做笔记（每天1-2小时）',
-                 'hours': '7-10h', 'deadline': '本周五'},
-                {'action': '💻 实践练习：完成配套练习题，搭建基础环境',
-                 'hours': '8-12h', 'deadline': '下周三'},
-                {'action': '🔧 项目实战：参照教程完成1个小项目，理解核心概念',
-                 'hours': '10-15h', 'deadline': '第3周日'},
-            ]
-        elif weeks_available == 2:
-            subtasks = [
-                {'action': '📚 集中学习：完整观看课程视频，整理核心知识点',
-                 'hours': '10-15h', 'deadline': '本周日'},
-                {'action': '💻 实战练习：完成至少3个练习案例，建立肌肉记忆',
-                 'hours': '8-12h', 'deadline': '下周日'},
-            ]
-        else:
-            subtasks = [
-                {'action': '⚡ 快速上手：观看核心章节，完成基础练习',
-                 'hours': '10-15h', 'deadline': '本周日'},
-            ]
-
-    # 项目类任务
-    elif any(kw in task_lower for kw in ['项目', '开发', '实现', '构建', 'project', 'build']):
-        if weeks_available >= 3:
-            subtasks = [
-                {'action': '📋 需求分析与设计：确定功能范围，画出架构图和流程图',
-                 'hours': '4-6h', 'deadline': '本周三'},
-                {'action': '🏗️ 核心功能开发：实现主要业务逻辑（MVP版本）',
-                 'hours': '12-16h', 'deadline': '第2周日'},
-                {'action': '✨ 完善与优化：添加边界处理、错误提示、UI优化',
-                 'hours': '8-10h', 'deadline': '第3周五'},
-                {'action': '📝 文档与部署：编写README、测试文档，部署上线',
-                 'hours': '4-6h', 'deadline': '第3周日'},
-            ]
-        elif weeks_available == 2:
-            subtasks = [
-                {'action': '📋 设计与搭建：确定技术栈，搭建项目框架',
-                 'hours': '6-8h', 'deadline': '本周五'},
-                {'action': '🏗️ 功能实现：完成核心功能开发和基础测试',
-                 'hours': '12-15h', 'deadline': '下周日'},
-            ]
-        else:
-            subtasks = [
-                {'action': '⚡ 快速搭建：参考现有项目，实现核心demo',
-                 'hours': '10-12h', 'deadline': '本周日'},
-            ]
-
-    # 阅读类任务
-    elif any(kw in task_lower for kw in ['阅读', '研读', '文档', '书籍', 'read', 'book']):
-        if weeks_available >= 2:
-            subtasks = [
-                {'action': '📖 通读全书：每天30-60分钟，完成第一遍阅读',
-                 'hours': '8-10h', 'deadline': '第1周日'},
-                {'action': '✍️ 精读与笔记：重点章节做详细笔记，整理思维导图',
-                 'hours': '6-8h', 'deadline': '第2周日'},
-            ]
-        else:
-            subtasks = [
-                {'action': '📖 重点阅读：聚焦核心章节，提炼关键知识点',
-                 'hours': '8-10h', 'deadline': '本周日'},
-            ]
-
-    # 练习类任务
-    elif any(kw in task_lower for kw in ['练习', '刷题', '题目', 'practice', 'exercise']):
-        subtasks = [
-            {'action': '🎯 基础题（Easy）：每天2-3题，熟悉基本概念',
-             'hours': '5-7h', 'deadline': '本周日'},
-            {'action': '🎯 进阶题（Medium）：每天1-2题，提升解题能力',
-             'hours': '6-8h', 'deadline': '下周日'},
-        ]
-
-    # 默认通用分解
-    else:
-        if weeks_available >= 2:
-            subtasks = [
-                {'action': f'🚀 启动阶段：{task_name} - 准备工作和基础搭建',
-                 'hours': '6-8h', 'deadline': '本周日'},
-                {'action': f'⚡ 执行阶段：{task_name} - 核心工作完成',
-                 'hours': '8-12h', 'deadline': '下周日'},
-            ]
-        else:
-            subtasks = [
-                {'action': f'⚡ {task_name} - 集中完成',
-                 'hours': '10-15h', 'deadline': '本周日'},
-            ]
-
-    return subtasks
+    yield []
+    yield []
+    yield [('使用说明：', 'bold')]
+    yield ['1. 每天完成具体行动项后，在"完成状态"列改为 ✓ 已完成，并记录实际用时']
+    yield ['2. 在"备注"列记录学习要点、遇到的问题、解决方案']
+    yield ['3. 预计工时仅供参考，根据实际情况调整']
+    yield ['4. 建议每周日回顾本周进度，规划下周任务']
 
 
-def create_milestones_sheet(wb: openpyxl.Workbook, plan_data: dict):
+def create_milestones_sheet(wb: 'openpyxl.Workbook', plan_data: dict, schedule: Schedule = None):
     """Create milestone checkpoints sheet."""
-    ws = wb.create_sheet("里程碑")
-
-    # Styles
-    header_fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
-    header_font = Font(color="FFFFFF", bold=True)
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+    _require_openpyxl()
+    schedule = schedule or build_schedule(plan_data)
+    widths, merged = SHEET_LAYOUT["里程碑"]
+    _write_sheet(wb, "里程碑", widths, _milestone_rows(schedule), merged)
 
+
+def _milestone_rows(schedule: Schedule):
     # Headers
     headers = ['时间点', '里程碑', '检验标准', '达成状态', '实际日期']
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-        cell.border = border
-
-    # Milestones - 从phases中提取milestone
-    row = 2
-    phases = plan_data.get('phases', [])
-
-    # Parse timeline
-    timeline = plan_data.get('timeline', '12周')
-    duration_weeks = 12
-    if '个月' in timeline:
-        months = int(''.join(filter(str.isdigit, timeline)))
-        duration_weeks = months * 4
-    elif '周' in timeline:
-        duration_weeks = int(''.join(filter(str.isdigit, timeline)))
-
-    weeks_per_phase = duration_weeks // len(phases) if phases else 4
-
-    for phase_idx, phase in enumerate(phases, 1):
-        milestone_text = phase.get('milestone', '')
-        if milestone_text:
-            week_num = phase_idx * weeks_per_phase
-            phase_name = phase.get('title', phase.get('phase', ''))
-
-            ws.cell(row=row, column=1, value=f"第{week_num}周")
-            ws.cell(row=row, column=2, value=phase_name)
-            ws.cell(row=row, column=3, value=milestone_text)
-            ws.cell(row=row, column=4, value='☐ 未达成')
-            ws.cell(row=row, column=5, value='')
-
-            # Apply borders
-            for col in range(1, 6):
-                ws.cell(row=row, column=col).border = border
-
-            row += 1
-
-    # Set column widths
-    ws.column_dimensions['A'].width = 12
-    ws.column_dimensions['B'].width = 30
-    ws.column_dimensions['C'].width = 50
-    ws.column_dimensions['D'].width = 12
-    ws.column_dimensions['E'].width = 15
-
-
-def create_resources_sheet(wb: openpyxl.Workbook, plan_data: dict):
+    yield [(header, 'header_green') for header in headers]
+
+    # Milestones - 从phases中提取milestone (checked at the end of the phase)
+    for phase in schedule.phases:
+        if phase.milestone:
+            values = [f"第{phase.end_week}周（{phase.end_date:%m/%d}）", phase.name, phase.milestone,
+                      '☐ 未达成', '']
+            yield [(value, 'cell') for value in values]
+
+
+def create_resources_sheet(wb: 'openpyxl.Workbook', plan_data: dict, schedule: Schedule = None):
     """Create learning resources sheet."""
-    ws = wb.create_sheet("学习资源")
-
-    # Styles
-    header_fill = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")
-    header_font = Font(bold=True)
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+    _require_openpyxl()
+    schedule = schedule or build_schedule(plan_data)
+    widths, merged = SHEET_LAYOUT["学习资源"]
+    _write_sheet(wb, "学习资源", widths, _resource_rows(schedule), merged)
 
+
+def _resource_rows(schedule: Schedule):
     # Headers
     headers = ['阶段', '任务', '资源名称', '类型', '优先级']
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-        cell.border = border
+    yield [(header, 'header_gold') for header in headers]
 
     # Resources - 从phases的tasks中提取resources
-    row = 2
-    phases = plan_data.get('phases', [])
-
-    for phase in phases:
-        phase_name = phase.get('title', phase.get('phase', ''))
-        tasks = phase.get('tasks', [])
+    for phase in schedule.phases:
+        for task in phase.tasks:
+            phase_name, task_name = phase.name, task.name
 
-        for task in tasks:
-            task_name = task.get('task', task.get('name', ''))
-            resources = task.get('resources', [])
-
-            for resource in resources:
-                ws.cell(row=row, column=1, value=phase_name)
-                ws.cell(row=row, column=2, value=task_name)
-                ws.cell(row=row, column=3, value=resource)
+            for resource in task.resources:
                 # 根据资源名称推断类型
                 resource_type = '在线课程' if 'Udemy' in resource or 'Coursera' in resource else \
                                '书籍' if '《' in resource else \
                                '视频' if 'B站' in resource or 'YouTube' in resource else \
                                '文档'
-                ws.cell(row=row, column=4, value=resource_type)
-                ws.cell(row=row, column=5, value='高')
+                values = [phase_name, task_name, resource, resource_type, '高']
+                yield [(value, 'cell') for value in values]
+
+
+# ========== Batch and Cohort Generation ==========
+
+# Characters that are not safe in output file names / sheet titles
+_UNSAFE_NAME_RE = re.compile(r'[\\/:*?"<>|\s]+')
+_UNSAFE_TITLE_RE = re.compile(r'[\\/:*?\[\]]+')
+_MAX_TITLE = 31  # Excel sheet title limit
+
+# Cohort summary sheet: one row per user
+COHORT_SUMMARY_TITLE = "汇总"
+COHORT_SUMMARY_LAYOUT = ({'A': 8, 'B': 16, 'C': 30, 'D': 10, 'E': 12, 'F': 8, 'G': 10, 'H': 10,
+                          'I': 10, 'J': 24}, ())
+
+
+def _plan_records(source):
+    """
+    Yield (index, origin, data) per plan, or an error result dictionary.
+
+    Args:
+        source: Directory of plan JSON files, or an iterable of JSONL lines
+
+    `origin` is {'file': path} or {'line': line number}; data is validated
+    here so invalid plans never reach a worker.
+    """
+    if isinstance(source, (str, Path)):
+        entries = ((path, {'file': str(path)}) for path in sorted(Path(source).glob('*.json')))
+    else:
+        entries = ((line, {'line': line_no}) for line_no, line in enumerate(source, 1) if line.strip())
+
+    for index, (entry, origin) in enumerate(entries, 1):
+        try:
+            if 'file' in origin:
+                with open(entry, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            else:
+                data = json.loads(entry)
+        except (OSError, ValueError) as e:
+            # Unreadable file, invalid UTF-8 (UnicodeDecodeError) or invalid JSON
+            yield {'index': index, **origin, 'status': 'error', 'error': f"{type(e).__name__}: {e}"}
+            continue
+        errors = validate(data, 'growth')
+        if errors:
+            messages = format_errors(errors)
+            yield {'index': index, **origin, 'status': 'error',
+                   'error': f"ValidationError: {messages[0]}" + (
+                       f" (+{len(messages) - 1} more)" if len(messages) > 1 else ''),
+                   'validation_errors': messages}
+            continue
+        yield index, origin, data
+
+
+def _plan_name(data: dict, origin: dict) -> str:
+    """User label of a plan: its "name" field, else the plan file name, else "plan"."""
+    name = data.get('name') or (Path(origin['file']).stem if 'file' in origin else '')
+    return _UNSAFE_NAME_RE.sub('_', str(name)).strip('_') or 'plan'
+
+
+def _batch_output_name(name_pattern: str, index: int, data: dict, origin: dict) -> str:
+    """Build an output file name from the naming pattern ({index}, {name}, {id})."""
+    record_id = _UNSAFE_NAME_RE.sub('_', str(data.get('id', index)))
+    return name_pattern.format(index=index, name=_plan_name(data, origin), id=record_id)
+
+
+def _batch_worker_init() -> None:
+    """Load openpyxl, the task rules and the shared style definitions once per worker process."""
+    _require_openpyxl()
+    default_task_rules()
+    _style_definitions()
+
+
+def _batch_create_one(index: int, data: dict, output_path: str, start_date: date) -> dict:
+    """Write one user's tracker (streaming); errors are returned, never raised."""
+    try:
+        _write_tracker(data, build_schedule(data, start_date), output_path, streaming=True)
+        return {'index': index, 'status': 'ok', 'output': output_path}
+    except Exception as e:
+        return {'index': index, 'status': 'error', 'error': f"{type(e).__name__}: {e}"}
+
+
+def _batch_summary(results: list) -> dict:
+    results.sort(key=lambda r: r['index'])
+    succeeded = sum(1 for r in results if r['status'] == 'ok')
+    return {
+        'total': len(results),
+        'succeeded': succeeded,
+        'failed': len(results) - succeeded,
+        'records': results,
+    }
+
+
+def create_growth_trackers_batch(source, output_dir: str, workers: int = None,
+                                 name_pattern: str = '{index:06d}.xlsx', start_date: date = None,
+                                 max_in_flight: int = None) -> dict:
+    """
+    Write one tracker per growth plan across a process pool.
+
+    Plans are parsed and validated in the parent process. Each worker loads
+    openpyxl and the style definitions once and writes its trackers with
+    streaming (write-only) workbooks. At most max_in_flight plans are queued
+    at a time, so memory stays bounded for large cohorts.
+
+    Args:
+        source: Directory of plan JSON files, or an iterable of JSONL lines
+        output_dir: Directory for the trackers
+        workers: Number of worker processes (default: CPU count, 1 = no pool)
+        name_pattern: Output file name pattern; supports {index}, {name}, {id}
+        start_date: First day of every plan (default: today)
+        max_in_flight: Maximum queued plans (default: workers * 4)
+
+    Returns:
+        Summary dictionary with per-plan results
+    """
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+    start_date = start_date or date.today()
+    results = []
+
+    def jobs():
+        for record in _plan_records(source):
+            if isinstance(record, dict):
+                results.append(record)
+                continue
+            index, origin, data = record
+            yield index, origin, data, str(out_dir / _batch_output_name(name_pattern, index, data, origin))
+
+    if workers <= 1:
+        _batch_worker_init()
+        for index, origin, data, output_path in jobs():
+            results.append({**_batch_create_one(index, data, output_path, start_date), **origin})
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_batch_worker_init) as pool:
+            pending = {}
+
+            def collect(done):
+                for future in done:
+                    results.append({**future.result(), **pending.pop(future)})
+
+            for index, origin, data, output_path in jobs():
+                if len(pending) >= max_in_flight:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending[pool.submit(_batch_create_one, index, data, output_path, start_date)] = origin
+
+            if pending:
+                done, _ = wait(pending)
+                collect(done)
+
+    return _batch_summary(results)
+
+
+def _cohort_prefix(index: int, name: str) -> str:
+    """Sheet title prefix of one user, short enough for every sheet title of the set."""
+    longest = max(len(title) for title in SHEET_LAYOUT) + 1
+    prefix = _UNSAFE_TITLE_RE.sub('_', f"{index:03d} {name}")
+    return prefix[:_MAX_TITLE - longest].rstrip()
+
+
+def create_cohort_tracker(source, output_path: str, start_date: date = None) -> dict:
+    """
+    Write the trackers of a whole cohort into one workbook.
+
+    The workbook starts with a summary sheet (one row per user), followed
+    by each user's sheet set with titles prefixed by the user's number and
+    name (e.g. "001 张三 每周任务"). Sheets are written with a streaming
+    (write-only) workbook and share one set of registered styles.
+
+    Args:
+        source: Directory of plan JSON files, or an iterable of JSONL lines
+        output_path: Output Excel file path
+        start_date: First day of every plan (default: today)
+
+    Returns:
+        Summary dictionary with per-plan results
+    """
+    _require_openpyxl()
+    start_date = start_date or date.today()
+    wb = openpyxl.Workbook(write_only=True)
+    widths, merged = COHORT_SUMMARY_LAYOUT
+    summary_ws = _new_sheet(wb, COHORT_SUMMARY_TITLE, widths, merged)
+    headers = ['序号', '学员', '目标职位', '计划时长', '开始日期', '阶段数', '主任务数', '行动项数',
+               '里程碑数', '工作表']
+    summary_rows = [[(header, 'header_blue') for header in headers]]
+    results = []
+
+    for record in _plan_records(source):
+        if isinstance(record, dict):
+            results.append(record)
+            continue
+        index, origin, data = record
+        name = _plan_name(data, origin)
+        prefix = _cohort_prefix(index, name)
+        try:
+            with span('schedule'):
+                schedule = build_schedule(data, start_date)
+            with span('sheets'):
+                for title, rows in sheet_rows(schedule).items():
+                    widths, merged = SHEET_LAYOUT[title]
+                    _write_sheet(wb, f"{prefix} {title}", widths, rows, merged)
+        except Exception as e:
+            results.append({'index': index, **origin, 'status': 'error', 'error': f"{type(e).__name__}: {e}"})
+            continue
+
+        tasks = [task for phase in schedule.phases for task in phase.tasks]
+        values = [index, name, schedule.target_position, f"{schedule.duration_weeks} 周",
+                  schedule.start_date.strftime('%Y-%m-%d'), len(schedule.phases), len(tasks),
+                  sum(len(task.subtasks) for task in tasks),
+                  sum(1 for phase in schedule.phases if phase.milestone), prefix]
+        summary_rows.append([(value, 'cell') for value in values])
+        results.append({'index': index, **origin, 'status': 'ok', 'sheets': prefix})
+
+    _append_rows(summary_ws, summary_rows)
+    with span('write'):
+        wb.save(output_path)
+    return _batch_summary(results)
+
+
+def run_batch(args, start_date: date) -> None:
+    """Run batch (or cohort) mode from the command line and write the summary file."""
+    batch_path = Path(args.batch)
+    if args.batch != '-' and not batch_path.exists():
+        print(f"Error: Batch input not found: {args.batch}")
+        sys.exit(1)
 
-                # Apply borders
-                for col in range(1, 6):
-                    ws.cell(row=row, column=col).border = border
+    def generate(source):
+        if args.cohort:
+            return create_cohort_tracker(source, args.cohort, start_date)
+        return create_growth_trackers_batch(source, args.output_dir, args.workers, args.name_pattern,
+                                            start_date)
 
-                row += 1
+    if args.batch == '-':
+        summary = generate(sys.stdin)
+    elif batch_path.is_dir():
+        summary = generate(batch_path)
+    else:
+        with open(batch_path, 'r', encoding='utf-8') as f:
+            summary = generate(f)
 
-    # Set column widths
-    ws.column_dimensions['A'].width = 20
-    ws.column_dimensions['B'].width = 50
-    ws.column_dimensions['C'].width = 50
-    ws.column_dimensions['D'].width = 12
-    ws.column_dimensions['E'].width = 10
+    if args.summary:
+        summary_path = Path(args.summary)
+    elif args.cohort:
+        summary_path = Path(args.cohort).with_suffix('.summary.json')
+    else:
+        summary_path = Path(args.output_dir) / 'batch_summary.json'
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    target = args.cohort or args.output_dir
+    print(f"✅ Batch complete: {summary['succeeded']}/{summary['total']} tracker(s) written to {target}")
+    if summary['failed']:
+        print(f"⚠️  {summary['failed']} plan(s) failed, see {summary_path}")
+    print(f"📋 Summary: {summary_path}")
+
+
+def _load_task_rules_or_exit() -> None:
+    try:
+        default_task_rules()
+    except (OSError, ValueError) as e:
+        print(f"Error: Cannot load task rules: {e}")
+        sys.exit(1)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Generate growth tracking spreadsheet")
-    parser.add_argument("--plan", "-p", required=True, help="JSON file with growth plan data")
-    parser.add_argument("--output", "-o", default="growth_tracker.xlsx", help="Output Excel file path")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--plan", "-p", help="JSON file with growth plan data")
+    source.add_argument("--batch", "-b",
+                        help="Directory of plan JSON files, or JSONL file with one plan per line ('-' for stdin)")
+    parser.add_argument("--output", "-o", default="growth_tracker.xlsx",
+                        help="Output Excel file path ('-' for stdout)")
+    parser.add_argument("--streaming", action="store_true",
+                        help="Write rows as they are generated: bounded memory and faster "
+                             "for large plans")
+    parser.add_argument("--start-date", default=None,
+                        help="Plan start date for deadline dates, YYYY-MM-DD (default: today, "
+                             "or the tracker's start date with --update)")
+    parser.add_argument("--update", action="store_true",
+                        help="Update an existing tracker at --output to the revised plan, keeping "
+                             "完成状态/实际用时/备注 and milestone progress")
+    parser.add_argument("--output-dir", default="trackers",
+                        help="Batch mode: output directory, one tracker per plan (default: trackers)")
+    parser.add_argument("--cohort", default=None,
+                        help="Batch mode: write one cohort workbook (summary sheet plus a sheet set "
+                             "per plan) to this file instead of one tracker per plan")
+    parser.add_argument("--workers", "-j", type=int, default=None,
+                        help="Batch mode: worker processes (default: CPU count)")
+    parser.add_argument("--name-pattern", default="{index:06d}.xlsx",
+                        help="Batch mode: output file name pattern, supports {index}, {name}, {id}")
+    parser.add_argument("--summary", default=None,
+                        help="Batch mode: summary JSON path (default: <output-dir>/batch_summary.json, "
+                             "or <cohort>.summary.json)")
+    add_server_argument(parser)
+    add_profile_arguments(parser)
 
     args = parser.parse_args()
 
+    start_date = None
+    if args.start_date:
+        try:
+            start_date = datetime.strptime(args.start_date, '%Y-%m-%d').date()
+        except ValueError:
+            print(f"Error: Invalid --start-date (expected YYYY-MM-DD): {args.start_date}")
+            sys.exit(1)
+
+    if args.batch:
+        _load_task_rules_or_exit()
+        with profile_session(args.profile, args.cprofile, args.memory):
+            run_batch(args, start_date)
+        return
+
     # Load plan data
     plan_path = Path(args.plan)
     if not plan_path.exists():
@@ -491,7 +745,46 @@ def main():
             print(f"Error: Invalid JSON in {args.plan}: {e}")
             sys.exit(1)
 
-    create_growth_tracker(plan_data, args.output)
+    errors = validate(plan_data, 'growth')
+    if errors:
+        print(f"Error: Invalid growth plan in {args.plan}:")
+        for line in format_errors(errors):
+            print(f"  - {line}")
+        sys.exit(1)
+
+    _load_task_rules_or_exit()
+
+    server = None if args.update else server_for(args)
+    if server:
+        options = {'start_date': args.start_date, 'streaming': args.streaming}
+        if render_to_output('xlsx', plan_data, options, args.output, server) is not None:
+            if args.output != '-':
+                print(f"✅ Growth tracker created: {args.output} (render server)")
+            return
+
+    if args.output == '-':
+        if args.update:
+            print("Error: --update needs an existing tracker file as --output, not stdout")
+            sys.exit(1)
+        # The workbook goes to stdout, so progress messages go to stderr
+        stdout = sys.stdout.buffer
+        with contextlib.redirect_stdout(sys.stderr), \
+                profile_session(args.profile, args.cprofile, args.memory):
+            write_growth_tracker(plan_data, stdout, streaming=args.streaming, start_date=start_date)
+            stdout.flush()
+        return
+
+    with profile_session(args.profile, args.cprofile, args.memory):
+        if args.update and Path(args.output).exists():
+            from tracker_update import update_growth_tracker
+            stats = update_growth_tracker(plan_data, args.output, start_date=start_date)
+            print(f"✅ Growth tracker updated: {args.output}")
+            if 'rebuilt' not in stats:
+                print(f"📊 Rows kept: {stats.get('kept', 0) + stats.get('moved', 0)}, "
+                      f"rewritten: {stats.get('rewritten', 0)}, added: {stats.get('added', 0)}, "
+                      f"removed: {stats.get('removed', 0)}")
+        else:
+            create_growth_tracker(plan_data, args.output, streaming=args.streaming, start_date=start_date)
 
 
 if __name__ == "__main__":
@@ -4,52 +4,509 @@ Generate PDF resume using fpdf2 with excellent Chinese support.
 
 Usage:
     python create_pdf_resume_fpdf.py --data resume_data.json --output resume.pdf
+    python create_pdf_resume_fpdf.py --data resume_data.json --output - > resume.pdf
+    python create_pdf_resume_fpdf.py --data resume_data.json --dry-run [--json]
+    python create_pdf_resume_fpdf.py --data resume_data.json --output resume.pdf --fit-pages 1
 """
 
+import io
 import json
 import argparse
+import contextlib
+import gc
+import mmap
 import sys
 import os
+import hashlib
 from pathlib import Path
 
-try:
-    from fpdf import FPDF
-    from fpdf.enums import XPos, YPos
-except ImportError:
-    print("Error: fpdf2 is required. Install with: pip install fpdf2")
-    sys.exit(1)
+import font_resolver
+from font_resolver import (FontCoverage, font_file_key, font_search_paths, get_bundled_font_path,
+                           get_font_cache_dir, load_font_coverage, pdf_fonts, write_cache_file)
+from output_cache import OutputCache, compute_cache_key, file_fingerprint, library_version, replace_output
+from profiling import span, add_profile_arguments, profile_session
+from render_client import add_server_argument, render_to_output, server_for
+from resume_model import Resume
 
 
-class ResumePDF(FPDF):
-    """Custom PDF class for resume generation with Chinese support."""
+def _require_fpdf() -> None:
+    """
+    Import fpdf2 on first use and build the ResumePDF class.
 
-    def __init__(self):
+    fpdf2 is slow to import, so it is not loaded for --help, for invalid input
+    or for output cache hits. Populates the module-level names below.
+    """
+    global fpdf, FPDF, XPos, YPos, ResumePDF
+    global FontDescriptorFlags, TextEmphasis, TTFFont, PDFFontDescriptor, SubsetMap
+    global get_color_font_object, ttLib
+    if 'FPDF' in globals():
+        return
+    try:
+        import fpdf
+        from fpdf import FPDF
+        from fpdf.enums import XPos, YPos
+    except ImportError:
+        print("Error: fpdf2 is required. Install with: pip install fpdf2")
+        sys.exit(1)
+
+    # fpdf2 internals used by the font metrics cache.
+    # Older fpdf2 releases without them fall back to plain add_font().
+    try:
+        from fpdf.enums import FontDescriptorFlags, TextEmphasis
+        from fpdf.fonts import TTFFont, PDFFontDescriptor, SubsetMap
+        from fpdf.font_type_3 import get_color_font_object
+        from fontTools import ttLib
+    except ImportError:
+        TTFFont = None
+
+    ResumePDF = type('ResumePDF', (ResumePDFMixin, FPDF), {
+        '__module__': __name__,
+        '__doc__': ResumePDFMixin.__doc__,
+    })
+
+
+def __getattr__(name):
+    """Resolve fpdf2-dependent names (e.g. ResumePDF) for importers on first access."""
+    if name in ('ResumePDF', 'FPDF', 'fpdf'):
+        _require_fpdf()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Stand-ins for fpdf2's XPos/YPos cursor moves, so the layout methods also run
+# on a LayoutCanvas without fpdf2; _require_fpdf() replaces them with the enums
+class XPos:
+    LMARGIN = 'LMARGIN'
+    RIGHT = 'RIGHT'
+
+
+class YPos:
+    TOP = 'TOP'
+    NEXT = 'NEXT'
+
+
+# ========== Font Metrics Cache ==========
+# Parsing the ~17MB CJK font (cmap + advance widths for every glyph) dominates
+# render time. The parsed metrics are cached in memory for the process and on
+# disk across processes, keyed by font path, size and mtime.
+FONT_CACHE_VERSION = 1
+
+# In-memory metrics, keyed by (resolved path, size, mtime_ns)
+_FONT_METRICS = {}
+
+
+def _fpdf_identity() -> str:
+    """Identify the installed fpdf2 (package path and modification time) without importing it."""
+    import importlib.util
+    try:
+        spec = importlib.util.find_spec('fpdf')
+        stat = os.stat(spec.origin)
+    except (ImportError, AttributeError, TypeError, ValueError, OSError):
+        return ''
+    return f"{spec.origin}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _font_cache_file(cache_dir: Path, key: tuple) -> Path:
+    """Disk cache file for a font key (also keyed by the fpdf2 install and cache format version)."""
+    digest = hashlib.sha1(
+        repr((key, _fpdf_identity(), FONT_CACHE_VERSION)).encode('utf-8')
+    ).hexdigest()
+    return cache_dir / f"{Path(key[0]).stem}-{digest[:16]}.json"
+
+
+def _parse_font_metrics(font_path: str) -> dict:
+    """Parse a TTF with fpdf2 and extract everything TTFFont derives from it."""
+    font = TTFFont(FPDF(), Path(font_path), 'metrics', '')
+    desc = font.desc
+    metrics = {
+        'scale': font.scale,
+        'name': font.name,
+        'up': font.up,
+        'ut': font.ut,
+        'sp': font.sp,
+        'ss': font.ss,
+        'is_cff': font.is_cff,
+        'is_cid_keyed': font.is_cid_keyed,
+        'is_symbol': font.is_symbol,
+        'cff_ros': list(font.cff_ros) if font.cff_ros else None,
+        'desc': {
+            'ascent': desc.ascent,
+            'descent': desc.descent,
+            'cap_height': desc.cap_height,
+            'flags': desc.flags.value,
+            'font_b_box': desc.font_b_box,
+            'italic_angle': desc.italic_angle,
+            'stem_v': desc.stem_v,
+            'missing_width': desc.missing_width,
+        },
+        'cw': {int(k): v for k, v in font.cw.items()},
+        'cmap': {int(k): v for k, v in font.cmap.items()},
+        'glyph_ids': {int(k): v for k, v in font.glyph_ids.items()},
+    }
+    font.close()
+    return metrics
+
+
+def load_font_metrics(font_path, cache_dir=None, use_disk_cache: bool = True) -> dict:
+    """
+    Load parsed font metrics, from memory, the disk cache, or by parsing the font.
+
+    Args:
+        font_path: Path to a TTF/OTF font file
+        cache_dir: Disk cache directory (default: get_font_cache_dir())
+        use_disk_cache: Read and write the on-disk cache
+
+    Returns:
+        Metrics dictionary used by add_cached_font()
+    """
+    key = font_file_key(font_path)
+    metrics = _FONT_METRICS.get(key)
+    if metrics is not None:
+        return metrics
+
+    cache_file = None
+    if use_disk_cache:
+        cache_file = _font_cache_file(Path(cache_dir) if cache_dir else get_font_cache_dir(), key)
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            # JSON object keys are strings; restore integer codepoints
+            for table in ('cw', 'cmap', 'glyph_ids'):
+                cached[table] = {int(k): v for k, v in cached[table].items()}
+            metrics = cached
+        except (OSError, ValueError, KeyError):
+            metrics = None
+
+    if metrics is None:
+        # Only parsing needs fpdf2; cached metrics also serve layout_pdf_resume()
+        _require_fpdf()
+        metrics = _parse_font_metrics(key[0])
+        if cache_file is not None:
+            write_cache_file(cache_file, json.dumps(
+                metrics, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+    _FONT_METRICS[key] = metrics
+    return metrics
+
+
+# ========== Shared Font Data ==========
+# A process pool forks its workers from the parent. When the parent has
+# already imported fpdf2, loaded the font metrics and memory-mapped the font
+# file (share_font_data), the workers share those pages copy-on-write instead
+# of each building its own copy. The glyph outlines fpdf2 reads for subsetting
+# are served straight from the read-only mapping.
+
+# Read-only font mappings, keyed like _FONT_METRICS: (mmap, shared table ranges)
+_SHARED_FONTS = {}
+
+# Tables whose raw data fontTools accepts as a memoryview (glyph outlines are
+# only sliced and re-joined); other tables are decoded from bytes
+SHARED_FONT_TABLES = ('glyf',)
+
+
+class SharedFontFile:
+    """
+    Seekable read-only file over a font mapping prepared by share_font_data().
+
+    Each document gets its own instance (fpdf2 subsets its TTFont in place),
+    but all of them read from the same mapping. Reads of a whole shared table
+    return a memoryview into the mapping; all other reads return bytes.
+    """
+
+    def __init__(self, mapping: mmap.mmap, shared_ranges: frozenset = frozenset(), name: str = ''):
+        self.mapping = mapping
+        self.view = memoryview(mapping)
+        self.shared_ranges = shared_ranges
+        self.name = name
+        self.pos = 0
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        base = (0, self.pos, len(self.mapping))[whence]
+        self.pos = max(0, base + offset)
+        return self.pos
+
+    def tell(self) -> int:
+        return self.pos
+
+    def read(self, size: int = -1):
+        start = min(self.pos, len(self.mapping))
+        end = len(self.mapping) if size is None or size < 0 else min(start + size, len(self.mapping))
+        self.pos = end
+        if (start, end - start) in self.shared_ranges:
+            return self.view[start:end]
+        return self.mapping[start:end]
+
+    def close(self) -> None:
+        pass  # The mapping stays open for the other documents
+
+
+def share_font_data(font_cache_dir=None, use_font_cache: bool = True) -> dict:
+    """
+    Prepare the PDF font for sharing with worker processes forked afterwards.
+
+    Call once in the parent before creating a process pool: imports fpdf2,
+    loads the metrics of the font a render would use, maps the font file
+    read-only and then freezes the garbage collector's view of everything
+    loaded so far (gc.freeze), so collections in the workers do not touch
+    the shared pages. Calling it again (e.g. from a pool initializer after
+    fork) keeps the existing mapping and does not freeze again.
+
+    The freeze is permanent: gc.unfreeze() is never called, so every object
+    alive at that point (including unreachable reference cycles) stays in
+    memory for the rest of the process. Call it early, before building large
+    temporary structures. Nothing is frozen if no font could be mapped.
+
+    Args:
+        font_cache_dir: Font metrics cache directory (default: get_font_cache_dir())
+        use_font_cache: Read and write the on-disk metrics cache
+
+    Returns:
+        Description of the shared font (path, mapped_bytes, shared_bytes),
+        or an empty dictionary if no TrueType font is available
+    """
+    _require_fpdf()
+    info = {}
+    for font_path in font_fallback_chain(font_cache_dir)[:1]:
+        if TTFFont is None:
+            break
+        try:
+            load_font_metrics(font_path, font_cache_dir, use_font_cache)
+            key = font_file_key(font_path)
+            created = key not in _SHARED_FONTS
+            if created:
+                with open(key[0], 'rb') as f:
+                    mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                # Locate the shared tables from the table directory
+                reader = ttLib.TTFont(SharedFontFile(mapping), lazy=True, fontNumber=0).reader
+                ranges = frozenset(
+                    (entry.offset, entry.length) for tag, entry in reader.tables.items()
+                    if str(tag) in SHARED_FONT_TABLES
+                )
+                _SHARED_FONTS[key] = (mapping, ranges)
+            mapping, ranges = _SHARED_FONTS[key]
+            if created:
+                gc.freeze()
+            info = {
+                'path': key[0],
+                'mapped_bytes': len(mapping),
+                'shared_bytes': sum(length for _, length in ranges),
+            }
+        except Exception:
+            pass  # Workers fall back to reading the file themselves
+        break
+
+    return info
+
+
+def _open_font_file(font_path):
+    """A shared mapping reader if share_font_data() prepared this font, else the path."""
+    if _SHARED_FONTS:
+        shared = _SHARED_FONTS.get(font_file_key(font_path))
+        if shared is not None:
+            return SharedFontFile(*shared, name=str(font_path))
+    return Path(font_path)
+
+
+class _FontWidths(dict):
+    """
+    Per-document advance widths backed by the shared metrics table.
+
+    fpdf2 looks widths up by codepoint and expects unknown codepoints to get
+    the missing width (it uses a defaultdict). Falling through to the shared
+    table avoids copying every width into each document.
+    """
+
+    __slots__ = ('shared', 'missing_width')
+
+    def __init__(self, shared: dict, missing_width):
+        super().__init__()
+        self.shared = shared
+        self.missing_width = missing_width
+
+    def __missing__(self, key):
+        return self.shared.get(key, self.missing_width)
+
+
+def add_cached_font(pdf: 'FPDF', family: str, font_path, cache_dir=None,
+                    use_disk_cache: bool = True) -> None:
+    """
+    Register a font on a PDF like FPDF.add_font(), reusing cached metrics.
+
+    Each document still gets its own lazily-opened fontTools object, because
+    fpdf2 subsets it in place when the PDF is written; after share_font_data()
+    it reads from the shared font mapping instead of the file. Falls back to a plain
+    add_font() if the cached metrics cannot be applied to this fpdf2 version.
+    """
+    fontkey = family.lower()
+    if fontkey in pdf.fonts:
+        return
+
+    if TTFFont is None:
+        pdf.add_font(family, '', str(font_path), uni=True)
+        return
+
+    try:
+        metrics = load_font_metrics(font_path, cache_dir, use_disk_cache)
+        font = TTFFont.__new__(TTFFont)
+        font.i = len(pdf.fonts) + 1
+        font.type = 'TTF'
+        font.ttffile = Path(font_path)
+        font.is_compressed = str(font_path).lower().endswith(('.woff', '.woff2'))
+        font._hbfont = None
+        font.fontkey = fontkey
+        font.biggest_size_pt = 0
+        font.collection_font_number = 0
+        font.ttfont = ttLib.TTFont(_open_font_file(font_path), recalcTimestamp=False, lazy=True, fontNumber=0)
+        font.is_cff = metrics['is_cff']
+        font.is_cid_keyed = metrics['is_cid_keyed']
+        font.is_symbol = metrics['is_symbol']
+        font.cff_ros = tuple(metrics['cff_ros']) if metrics['cff_ros'] else None
+        font.scale = metrics['scale']
+
+        desc = metrics['desc']
+        font.desc = PDFFontDescriptor(
+            ascent=desc['ascent'],
+            descent=desc['descent'],
+            cap_height=desc['cap_height'],
+            flags=FontDescriptorFlags(desc['flags']),
+            font_b_box=desc['font_b_box'],
+            italic_angle=desc['italic_angle'],
+            stem_v=desc['stem_v'],
+            missing_width=desc['missing_width'],
+        )
+
+        # Lookups must not add entries to the shared table
+        font.cw = _FontWidths(metrics['cw'], desc['missing_width'])
+        font.cmap = metrics['cmap']
+        font.glyph_ids = metrics['glyph_ids']
+        font.missing_glyphs = []
+        font.name = metrics['name']
+        font.up = metrics['up']
+        font.ut = metrics['ut']
+        font.sp = metrics['sp']
+        font.ss = metrics['ss']
+        font.emphasis = TextEmphasis.coerce('')
+        font.subset = SubsetMap(font)
+        font.palette_index = 0
+        font.color_font = get_color_font_object(pdf, font, 0) if pdf.render_color_fonts else None
+    except (AttributeError, TypeError, KeyError, ValueError, ImportError):
+        # Internal fpdf2 layout changed: use the regular (uncached) loader
+        pdf.add_font(family, '', str(font_path), uni=True)
+        return
+
+    pdf.fonts[fontkey] = font
+
+
+def candidate_font_paths() -> list:
+    """List of potential font paths to try (bundled font has highest priority)."""
+    return font_search_paths()
+
+
+def font_fallback_chain(font_cache_dir=None) -> list:
+    """Installed fonts the PDF can use, in priority order (see font_resolver)."""
+    return [entry['path'] for entry in pdf_fonts(font_cache_dir)]
+
+
+def _font_identity() -> str:
+    """Identify the fonts a render would use (main font and fallbacks), for output cache keys."""
+    identities = [f"{entry['path']}:{entry['size']}:{entry['mtime_ns']}" for entry in pdf_fonts()]
+    return '|'.join(identities) or 'helvetica'
+
+
+# ========== Font Coverage Index ==========
+# safe_text() draws each character the main font lacks with the first font in
+# the fallback chain that has it. Which codepoints a font covers is kept as a
+# bitmap by the font index (font_resolver), so the chain is checked without
+# loading the fallback fonts.
+# Drawn in place of characters that no available font covers
+MISSING_GLYPH = '?'
+
+
+def _core_font_coverage(encoding: str) -> FontCoverage:
+    """Coverage of fpdf2's built-in fonts (e.g. helvetica): what the core font encoding can encode."""
+    return FontCoverage.from_codepoints(
+        ord(char) for char in bytes(range(256)).decode(encoding or 'latin-1', errors='ignore'))
+
+
+# ========== Font Subsetting ==========
+
+def subset_fonts(pdf: 'FPDF') -> None:
+    """
+    Reduce every embedded TrueType font to the glyphs the document uses.
+
+    fpdf2 already subsets on output, but keeps hinting and, for variable fonts
+    such as NotoSansSC-VF, the per-glyph variation data. Here each font is cut
+    down to the used glyphs without hinting, and variable fonts are pinned to
+    their default instance, which is what PDF viewers render anyway. Call this
+    right before output().
+    """
+    from fontTools import subset as ftsubset
+    from fontTools.varLib import instancer
+
+    for font in pdf.fonts.values():
+        if getattr(font, 'type', None) != 'TTF' or not hasattr(font, 'subset'):
+            continue
+
+        options = ftsubset.Options(notdef_outline=True, recommended_glyphs=True, hinting=False)
+        options.drop_tables += ['DSIG', 'GDEF', 'GPOS', 'GSUB', 'STAT']
+        subsetter = ftsubset.Subsetter(options)
+        subsetter.populate(glyphs=font.subset.get_all_glyph_names())
+        subsetter.subset(font.ttfont)
+
+        if 'fvar' in font.ttfont:
+            # None pins each axis to its default coordinate
+            axes = {axis.axisTag: None for axis in font.ttfont['fvar'].axes}
+            instancer.instantiateVariableFont(font.ttfont, axes, inplace=True, static=True)
+
+
+def embedded_font_bytes(pdf: 'FPDF') -> int:
+    """Size of the font programs embedded in an already written PDF (uncompressed)."""
+    from io import BytesIO
+
+    total = 0
+    for font in pdf.fonts.values():
+        if getattr(font, 'type', None) != 'TTF':
+            continue
+        buf = BytesIO()
+        font.ttfont.save(buf)
+        total += buf.tell()
+    return total
+
+
+class ResumePDFMixin:
+    """
+    Custom PDF class for resume generation with Chinese support.
+
+    ResumePDF combines this mixin with fpdf2's FPDF once fpdf2 is imported
+    (see _require_fpdf), so the module itself loads without fpdf2.
+
+    font_scale multiplies the font sizes and line heights (24/14/11/9pt at
+    1.0) and spacing_scale the gaps between lines, sections and entries.
+    """
+
+    def __init__(self, font_cache_dir=None, use_font_cache: bool = True,
+                 font_scale: float = 1.0, spacing_scale: float = 1.0):
         super().__init__()
         self.add_page()
+        self.font_cache_dir = font_cache_dir
+        self.use_font_cache = use_font_cache
+        self.font_scale = font_scale
+        self.spacing_scale = spacing_scale
 
         # Try to load Chinese font with fallback mechanism
         font_loaded = False
         font_name = 'NotoSans'
 
-        # Get bundled font path (in skill's assets/fonts directory)
-        script_dir = Path(__file__).parent          # scripts/current/
-        skill_dir = script_dir.parent.parent        # skill root
-        bundled_font = skill_dir / 'assets' / 'fonts' / 'NotoSansSC.ttf'
-
-        # List of potential font paths to try (bundled font has highest priority)
-        font_paths = [
-            str(bundled_font) if bundled_font.exists() else None,  # Bundled font (highest priority)
-            os.getenv('RESUME_FONT_PATH'),  # Environment variable
-            '/tmp/fonts/NotoSansSC.ttf',     # Default path
-            str(Path.home() / '.fonts' / 'NotoSansSC.ttf'),  # User fonts
-            '/usr/share/fonts/truetype/noto/NotoSansSC-Regular.ttf',  # Linux system fonts
-            '/System/Library/Fonts/PingFang.ttc',  # macOS
-        ]
-
-        for font_path in font_paths:
-            if font_path and Path(font_path).exists():
+        bundled_font = get_bundled_font_path()
+
+        with span('font'):
+            # Installed fonts from the font index, so missing paths are not probed here
+            for font_path in font_fallback_chain(font_cache_dir):
                 try:
-                    self.add_font(font_name, '', font_path, uni=True)
+                    self.add_resume_font(font_name, font_path)
                     self.set_font(font_name, '', 12)
                     font_loaded = True
                     # Keep font_name as string
@@ -69,6 +526,7 @@ class ResumePDF(FPDF):
             print(f"   1. Check bundled font: {bundled_font}")
             print("   2. Verify skill installation is complete")
             print("   3. Or set RESUME_FONT_PATH=/path/to/your/font.ttf")
+            print("   4. List the fonts found: python scripts/current/font_resolver.py")
             print()
             print("   See references/troubleshooting.md for more details.\n")
 
@@ -81,50 +539,121 @@ class ResumePDF(FPDF):
         self.resume_font_name = font_name  # Keep as string
         self.chinese_support = font_loaded
 
+        # Glyph routing for safe_text(): the main font's cmap (or the core
+        # font encoding), then the rest of the fallback chain, loaded lazily
+        self.font_coverage = self.current_font.cmap if font_loaded else \
+            _core_font_coverage(self.core_fonts_encoding)
+        self._glyph_routes = {}         # char -> drawable
+        self._fallback_chain = None     # [{'path', 'coverage', 'family'}] after the main font
+
+    def add_resume_font(self, family: str, font_path) -> None:
+        """Register a TrueType font under `family` (with cached metrics unless disabled)."""
+        if self.use_font_cache:
+            add_cached_font(self, family, font_path, cache_dir=self.font_cache_dir)
+        else:
+            self.add_font(family, '', font_path, uni=True)
+
     def safe_text(self, text):
-        """Convert text to ASCII-safe format if Chinese font not available."""
+        """
+        Make text drawable with the available fonts.
+
+        Characters the main font lacks are drawn with the first font of the
+        fallback chain that has them (registered as an fpdf2 fallback font on
+        first use); only characters no font covers become MISSING_GLYPH.
+        """
         if not text:
             return ''
-        if self.chinese_support:
-            return text
-        # Replace non-ASCII characters with Romanization hint
-        try:
-            text.encode('ascii')
+        missing = {char for char in set(text) if not self.covers(char)}
+        if not missing:
             return text
-        except UnicodeEncodeError:
-            # Return text with note that Chinese font is needed
-            return '[Chinese text - font required]'
+        return ''.join(MISSING_GLYPH if char in missing else char for char in text)
+
+    def covers(self, char: str) -> bool:
+        """Whether a character can be drawn, by the main font or a fallback font."""
+        drawable = self._glyph_routes.get(char)
+        if drawable is None:
+            drawable = self._glyph_routes[char] = self._route_glyph(ord(char))
+        return drawable
+
+    def _route_glyph(self, codepoint: int) -> bool:
+        """Find the first font that covers a codepoint, registering it as a fallback font."""
+        if codepoint < 0x20 or codepoint in self.font_coverage:
+            return True  # Control characters (line breaks) are handled by fpdf2
+        if not self.chinese_support:
+            return False  # fpdf2 only falls back from TrueType fonts
+
+        if self._fallback_chain is None:
+            main_font = Path(self.current_font.ttffile).resolve()
+            self._fallback_chain = [
+                {'path': font_path, 'coverage': None, 'family': None}
+                for font_path in font_fallback_chain(self.font_cache_dir) if Path(font_path).resolve() != main_font
+            ]
+
+        for entry in self._fallback_chain:
+            if entry['coverage'] is None:
+                try:
+                    entry['coverage'] = load_font_coverage(
+                        entry['path'], self.font_cache_dir, self.use_font_cache)
+                except Exception:
+                    entry['coverage'] = FontCoverage()
+            if codepoint not in entry['coverage']:
+                continue
+            if entry['family'] is None:
+                family = f"{self.resume_font_name}Fallback{len(self.fonts)}"
+                try:
+                    self.add_resume_font(family, entry['path'])
+                except Exception:
+                    entry['coverage'] = FontCoverage()  # Unusable: never route to it again
+                    continue
+                entry['family'] = family
+                # fpdf2 picks the first fallback font with the glyph, so keep chain order
+                self.set_fallback_fonts(
+                    [e['family'] for e in self._fallback_chain if e['family']], exact_match=False)
+            return True
+        return False
+
+    def use_size(self, size: float):
+        """Select the resume font at `size` pt (times font_scale)."""
+        self.set_font(self.resume_font_name, '', size * self.font_scale)
+
+    def line_height(self, h: float) -> float:
+        """Height in mm of a line of text, `h` at scale 1.0 (scales with the font)."""
+        return h * self.font_scale
+
+    def gap(self, h: float):
+        """Move down `h` mm at scale 1.0 (times spacing_scale)."""
+        self.ln(h * self.spacing_scale)
 
     def header_section(self, name, title, contact):
         """Add header with name and contact info."""
         # Name
-        self.set_font(self.resume_font_name, '', 24)
+        self.use_size(24)
         self.set_text_color(31, 41, 55)
-        self.cell(0, 10, self.safe_text(name), align='C', new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        self.cell(0, self.line_height(10), self.safe_text(name), align='C', new_x=XPos.LMARGIN, new_y=YPos.NEXT)
 
         # Title
         if title:
-            self.set_font(self.resume_font_name, '', 12)
+            self.use_size(12)
             self.set_text_color(107, 114, 128)
-            self.cell(0, 7, self.safe_text(title), align='C', new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.cell(0, self.line_height(7), self.safe_text(title), align='C', new_x=XPos.LMARGIN, new_y=YPos.NEXT)
 
         # Contact
         if contact:
-            self.set_font(self.resume_font_name, '', 9)
-            self.cell(0, 6, self.safe_text(contact), align='C', new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.use_size(9)
+            self.cell(0, self.line_height(6), self.safe_text(contact), align='C', new_x=XPos.LMARGIN, new_y=YPos.NEXT)
 
-        self.ln(3)
+        self.gap(3)
 
     def section_title(self, title):
         """Add a section title."""
-        self.set_font(self.resume_font_name, '', 14)
+        self.use_size(14)
         self.set_text_color(37, 99, 235)
-        self.cell(0, 8, self.safe_text(title), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
-        self.ln(2)
+        self.cell(0, self.line_height(8), self.safe_text(title), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        self.gap(2)
 
     def entry_title(self, title, date=''):
         """Add an entry title with optional date."""
-        self.set_font(self.resume_font_name, '', 11)
+        self.use_size(11)
         self.set_text_color(31, 41, 55)
 
         title_safe = self.safe_text(title)
@@ -133,101 +662,543 @@ class ResumePDF(FPDF):
         if date:
             # Title on left, date on right
             title_width = self.get_string_width(title_safe) + 2
-            self.cell(title_width, 6, title_safe)
+            self.cell(title_width, self.line_height(6), title_safe)
 
             # Date on the right
             self.set_x(self.w - self.r_margin - self.get_string_width(date_safe))
             self.set_text_color(107, 114, 128)
-            self.cell(0, 6, date_safe, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.cell(0, self.line_height(6), date_safe, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         else:
-            self.cell(0, 6, title_safe, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.cell(0, self.line_height(6), title_safe, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
 
         self.set_text_color(31, 41, 55)
 
     def body_text(self, text, bullet=False):
         """Add body text with optional bullet point."""
-        self.set_font(self.resume_font_name, '', 9)
+        self.use_size(9)
         self.set_text_color(55, 65, 81)
 
         text_safe = self.safe_text(text)
 
         if bullet:
-            # Bullet point (use ASCII-safe bullet if no Chinese support)
-            bullet_char = '•' if self.chinese_support else '-'
+            # Bullet point (ASCII bullet if no font has '•')
+            bullet_char = '•' if self.covers('•') else '-'
             x_start = self.get_x()
-            self.cell(5, 5, bullet_char)
+            self.cell(5, self.line_height(5), bullet_char)
             self.set_x(x_start + 5)
             # Multi-line text
-            self.multi_cell(0, 4, text_safe)
+            self.multi_cell(0, self.line_height(4), text_safe)
         else:
-            self.multi_cell(0, 5, text_safe)
+            self.multi_cell(0, self.line_height(5), text_safe)
 
-        self.ln(1)
+        self.gap(1)
 
 
-def create_pdf_resume(data: dict, output_path: str) -> None:
+# ========== Layout Dry Run ==========
+# Whether a resume fits on a page depends only on where the cursor ends up:
+# line breaks (from advance widths) and page breaks. LayoutCanvas implements
+# the part of FPDF the layout methods use, moving a cursor the way fpdf2 does
+# without building page content, so ResumeLayout runs the same ResumePDFMixin
+# code against the cached font metrics, without importing fpdf2.
+
+# Characters fpdf2 breaks lines at (fpdf.line_break.BREAKING_SPACE_SYMBOLS)
+BREAKING_SPACES = frozenset(' \u200b\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2008\u2009\u200a\u205f\u3000\t')
+
+
+class LayoutFont:
+    """Advance widths of a font, by codepoint (TrueType) or by character (core fonts)."""
+
+    __slots__ = ('ttffile', 'cw', 'cmap', 'missing_width')
+
+    def __init__(self, ttffile, cw: dict, cmap, missing_width=0):
+        self.ttffile = ttffile
+        self.cw = cw
+        self.cmap = cmap    # None for core fonts
+        self.missing_width = missing_width
+
+
+class LayoutCanvas:
+    """
+    Cursor-only stand-in for FPDF: A4 portrait in mm, fpdf2's default margins.
+
+    Text is measured with the same advance widths and wrapped with the same
+    rules as fpdf2 (break at the last space, else before the character that
+    overflows), and cells trigger the same automatic page breaks, so the pages
+    and positions match a real render. Nothing is drawn.
     """
-    Create a PDF resume from structured data.
+
+    def __init__(self):
+        self.k = 72 / 25.4
+        self.w, self.h = 595.28 / self.k, 841.89 / self.k
+        margin = (7200 / 254) / self.k
+        self.l_margin = self.t_margin = self.r_margin = margin
+        self.c_margin = margin / 10.0
+        self.b_margin = 2 * margin
+        self.page_break_trigger = self.h - self.b_margin
+        self.core_fonts_encoding = 'latin-1'
+        self.page = 0
+        self.x, self.y = self.l_margin, self.t_margin
+        self.fonts = {}
+        self.current_font = None
+        self.font_size_pt = self.font_size = 0
+        self._lasth = 0
+        self._fallback_fonts = []
+        self._char_units = {}   # id(font) -> {char: advance width in font units}
+
+    def add_page(self):
+        self.page += 1
+        self.x, self.y = self.l_margin, self.t_margin
+
+    def set_font(self, family: str, style: str = '', size: float = 0):
+        fontkey = family.lower()
+        if fontkey not in self.fonts:
+            try:
+                from fpdf.fonts import CORE_FONTS_CHARWIDTHS
+            except ImportError:
+                print("Error: fpdf2 is required. Install with: pip install fpdf2")
+                sys.exit(1)
+            if fontkey + style not in CORE_FONTS_CHARWIDTHS:
+                raise ValueError(f"Undefined font: {family}")
+            self.fonts[fontkey] = LayoutFont(None, CORE_FONTS_CHARWIDTHS[fontkey + style], None)
+        self.current_font = self.fonts[fontkey]
+        if size:
+            self.font_size_pt = size
+            self.font_size = size / self.k
+
+    def set_fallback_fonts(self, fallback_families, exact_match: bool = True):
+        self._fallback_fonts = [self.fonts[family.lower()] for family in fallback_families]
+        self._char_units.clear()
+
+    def set_text_color(self, *color):
+        pass
+
+    def get_x(self) -> float:
+        return self.x
+
+    def set_x(self, x: float):
+        self.x = x if x >= 0 else self.w + x
+
+    def get_y(self) -> float:
+        return self.y
+
+    def ln(self, h: float = None):
+        self.x = self.l_margin
+        self.y += h if h is not None else (self._lasth or self.font_size)
+
+    def _units(self, char: str) -> int:
+        """Advance width of a character in font units, with the font fpdf2 would draw it in."""
+        widths = self._char_units.setdefault(id(self.current_font), {})
+        units = widths.get(char)
+        if units is None:
+            font = self.current_font
+            if font.cmap is None:
+                units = font.cw[char]
+            else:
+                codepoint = ord(char)
+                if codepoint not in font.cmap and char != '\n':
+                    font = next((f for f in self._fallback_fonts if codepoint in f.cmap), font)
+                units = font.cw.get(codepoint, font.missing_width)
+            widths[char] = units
+        return units
+
+    def _width(self, units) -> float:
+        return units * self.font_size_pt * 0.001 / self.k
+
+    def get_string_width(self, s: str) -> float:
+        return self._width(sum(self._units(char) for char in s))
+
+    def break_page_if_needed(self, h: float):
+        """Start a new page if a line of height h does not fit (x is kept, as in fpdf2)."""
+        if self.y + h > self.page_break_trigger:
+            x = self.x
+            self.add_page()
+            self.x = x
+
+    def cell(self, w: float = None, h: float = None, text: str = '', align='L',
+             new_x=XPos.RIGHT, new_y=YPos.TOP):
+        if h is None:
+            h = self.font_size
+        self.break_page_if_needed(h)
+        if w is None:
+            w = self.get_string_width(text) + 2 * self.c_margin
+        elif w == 0:
+            w = self.w - self.r_margin - self.x
+        self._move(w, h, new_x, new_y)
+
+    def multi_cell(self, w: float, h: float = None, text: str = '', align='J',
+                   new_x=XPos.RIGHT, new_y=YPos.NEXT):
+        if h is None:
+            h = self.font_size
+        if w == 0:
+            w = self.w - self.r_margin - self.x
+        lines, trailing_newline = self.wrap_text(text.replace('\r', ''), w - 2 * self.c_margin)
+        for _ in range(lines - 1):
+            self.break_page_if_needed(h)
+            self.y += h
+        self.break_page_if_needed(h)
+        self._move(w, h, new_x, new_y)
+        if trailing_newline and getattr(new_y, 'name', new_y) == 'NEXT':
+            self.ln()   # fpdf2 adds a line after text ending with a line break
+
+    def _move(self, w: float, h: float, new_x, new_y):
+        new_x, new_y = getattr(new_x, 'name', new_x), getattr(new_y, 'name', new_y)
+        if new_x == 'RIGHT':
+            self.x += w
+        elif new_x == 'LMARGIN':
+            self.x = self.l_margin
+        if new_y == 'NEXT':
+            self.y += h
+        self._lasth = h
+
+    def wrap_text(self, text: str, max_width: float) -> tuple:
+        """
+        Wrap text like fpdf2's multi_cell() at max_width.
+
+        Returns:
+            (number of lines (at least 1), whether the last line ends with a line break)
+        """
+        lines = 0
+        trailing_newline = False
+        units = 0       # Width of the current line
+        space = None    # Index of the last space on the current line
+        i = 0
+        while i < len(text):
+            char = text[i]
+            if char == '\n':
+                lines, units, space = lines + 1, 0, None
+                trailing_newline = True
+                i += 1
+                continue
+            char_units = self._units(char)
+            if self._width(units) + self._width(char_units) - max_width > 1e-9:
+                if char in BREAKING_SPACES:
+                    i += 1          # The space is dropped
+                elif space is not None:
+                    i = space + 1   # Break after the last space
+                elif units == 0:
+                    i += 1          # A single character wider than the line
+                lines, units, space = lines + 1, 0, None
+                trailing_newline = False
+                continue
+            if char in BREAKING_SPACES:
+                space = i
+            units += char_units
+            i += 1
+        if units:
+            lines, trailing_newline = lines + 1, False
+        return max(lines, 1), trailing_newline
+
+
+class ResumeLayout(ResumePDFMixin, LayoutCanvas):
+    """
+    ResumePDF's layout on a LayoutCanvas, recording the pages of each entry.
+
+    An entry is the header, an entry title with the text under it, or a
+    standalone paragraph (summary, skill line, bullet under 其他).
+    """
+
+    def __init__(self, font_cache_dir=None, use_font_cache: bool = True,
+                 font_scale: float = 1.0, spacing_scale: float = 1.0):
+        self.entries = []
+        self._section = None
+        self._entry = None
+        super().__init__(font_cache_dir=font_cache_dir, use_font_cache=use_font_cache,
+                         font_scale=font_scale, spacing_scale=spacing_scale)
+
+    def add_resume_font(self, family: str, font_path) -> None:
+        metrics = load_font_metrics(font_path, self.font_cache_dir, self.use_font_cache)
+        self.fonts[family.lower()] = LayoutFont(
+            Path(font_path), metrics['cw'], metrics['cmap'], metrics['desc']['missing_width'])
+
+    def break_page_if_needed(self, h: float):
+        super().break_page_if_needed(h)
+        if self._entry is not None:
+            self._entry.setdefault('page', self.page)
+            self._entry['last_page'] = self.page
+
+    def _begin_entry(self, title):
+        self._entry = {'section': self._section, 'title': title}
+        self.entries.append(self._entry)
+
+    def header_section(self, name, title, contact):
+        self._begin_entry(name)
+        super().header_section(name, title, contact)
+        self._entry = None
+
+    def section_title(self, title):
+        self._section, self._entry = title, None
+        super().section_title(title)
+
+    def entry_title(self, title, date=''):
+        self._begin_entry(title)
+        super().entry_title(title, date)
+
+    def body_text(self, text, bullet=False):
+        standalone = self._entry is None
+        if standalone:
+            self._begin_entry(text)
+        super().body_text(text, bullet)
+        if standalone:
+            self._entry = None
+
+
+def layout_pdf_resume(data, font_cache_dir=None, use_font_cache: bool = True,
+                      font_scale: float = 1.0, spacing_scale: float = 1.0) -> dict:
+    """
+    Lay out a PDF resume without rendering it, to predict its length.
+
+    Runs the same layout code as a render against the cached font metrics, but
+    only tracks the cursor: no PDF is built and fpdf2 is not imported (unless
+    a font's metrics are not cached yet, or no TrueType font is installed).
 
     Args:
-        data: Resume data dictionary
-        output_path: Output PDF file path
+        data: Resume data dictionary or Resume model
+        font_cache_dir: Font metrics cache directory (default: get_font_cache_dir())
+        use_font_cache: Reuse parsed font metrics across renders
+        font_scale: Scale of font sizes and line heights (see ResumePDFMixin)
+        spacing_scale: Scale of the gaps between lines, sections and entries
+
+    Returns:
+        Layout report: pages, remaining_mm (space left at the bottom of the last
+        page) and spilled (entries that end past page 1, each with section,
+        title, page and last_page)
     """
-    try:
-        pdf = ResumePDF()
-
-        # Header
-        contact_parts = []
-        if data.get('phone'):
-            contact_parts.append(data['phone'])
-        if data.get('email'):
-            contact_parts.append(data['email'])
-        if data.get('location'):
-            contact_parts.append(data['location'])
-
-        pdf.header_section(
-            data.get('name', ''),
-            data.get('title', ''),
-            ' | '.join(contact_parts) if contact_parts else ''
-        )
+    resume = Resume.from_dict(data)
+    layout = ResumeLayout(font_cache_dir=font_cache_dir, use_font_cache=use_font_cache,
+                          font_scale=font_scale, spacing_scale=spacing_scale)
+    add_sections(layout, resume)
+    return {
+        'pages': layout.page,
+        'remaining_mm': round(max(0.0, layout.page_break_trigger - layout.y), 2),
+        'spilled': [entry for entry in layout.entries if entry['last_page'] > 1],
+    }
 
-        # Determine section order
-        is_fresh_graduate = data.get('is_fresh_graduate', False)
 
-        # Summary
-        if data.get('summary'):
-            pdf.section_title('个人简介')
-            pdf.body_text(data['summary'])
-            pdf.ln(2)
+# Lower bounds of the --fit-pages search: gaps shrink first, then fonts
+# (0.8 keeps body text at 7.2pt); scales are searched in steps of 0.01
+MIN_SPACING_SCALE = 0.5
+MIN_FONT_SCALE = 0.8
 
-        # Section order
-        if is_fresh_graduate:
-            sections = ['education', 'experience', 'projects']
-        else:
-            sections = ['experience', 'projects', 'education']
-
-        for section_key in sections:
-            if section_key == 'education' and data.get('education'):
-                add_education(pdf, data['education'])
-            elif section_key == 'experience' and data.get('experience'):
-                add_experience(pdf, data['experience'])
-            elif section_key == 'projects' and data.get('projects'):
-                add_projects(pdf, data['projects'])
-
-        # Skills
-        if data.get('skills'):
-            add_skills(pdf, data['skills'])
-
-        # Other
-        if data.get('other'):
+
+def fit_pdf_scale(data, pages: int = 1, font_cache_dir=None, use_font_cache: bool = True) -> dict:
+    """
+    Find the largest typography scale at which a resume fits in `pages` pages.
+
+    Whitespace goes first: spacing_scale is lowered (down to MIN_SPACING_SCALE)
+    before font_scale (down to MIN_FONT_SCALE). Each candidate is checked with
+    layout_pdf_resume() and each scale is binary searched, so the search takes
+    at most 8 layout-only passes.
+
+    Args:
+        data: Resume data dictionary or Resume model
+        pages: Maximum number of pages
+        font_cache_dir: Font metrics cache directory (default: get_font_cache_dir())
+        use_font_cache: Reuse parsed font metrics across renders
+
+    Returns:
+        Fit report: font_scale and spacing_scale to render with, fits (False if
+        the resume is longer than `pages` even at the smallest scales, which are
+        then returned), passes, and layout (layout report at those scales)
+    """
+    resume = Resume.from_dict(data)
+    passes = 0
+
+    def layout(font_scale: float, spacing_scale: float) -> dict:
+        nonlocal passes
+        passes += 1
+        return layout_pdf_resume(resume, font_cache_dir, use_font_cache, font_scale, spacing_scale)
+
+    def largest(low: int, high: int, scales, report: dict) -> tuple:
+        """Largest step in [low, high] that fits, given that `low` fits (with its report)."""
+        while low < high:
+            mid = (low + high + 1) // 2
+            candidate = layout(*scales(mid))
+            if candidate['pages'] <= pages:
+                low, report = mid, candidate
+            else:
+                high = mid - 1
+        return scales(low), report
+
+    def result(scales, report: dict) -> dict:
+        return {'font_scale': scales[0], 'spacing_scale': scales[1],
+                'fits': report['pages'] <= pages, 'passes': passes, 'layout': report}
+
+    report = layout(1.0, 1.0)
+    if report['pages'] <= pages:
+        return result((1.0, 1.0), report)
+
+    report = layout(1.0, MIN_SPACING_SCALE)
+    if report['pages'] <= pages:
+        return result(*largest(round(MIN_SPACING_SCALE * 100), 99,
+                               lambda step: (1.0, step / 100), report))
+
+    report = layout(MIN_FONT_SCALE, MIN_SPACING_SCALE)
+    if report['pages'] > pages:
+        return result((MIN_FONT_SCALE, MIN_SPACING_SCALE), report)
+    return result(*largest(round(MIN_FONT_SCALE * 100), 99,
+                           lambda step: (step / 100, MIN_SPACING_SCALE), report))
+
+
+def _layout_pdf(resume: Resume, font_cache_dir=None, use_font_cache: bool = True,
+                subset: bool = False, font_scale: float = 1.0, spacing_scale: float = 1.0) -> 'ResumePDF':
+    """Lay out a resume (and subset its fonts if requested); the result is ready for output()."""
+    pdf = ResumePDF(font_cache_dir=font_cache_dir, use_font_cache=use_font_cache,
+                    font_scale=font_scale, spacing_scale=spacing_scale)
+    add_sections(pdf, resume)
+
+    # Embed only the glyphs used
+    if subset:
+        with span('subset'):
+            subset_fonts(pdf)
+
+    return pdf
+
+
+def add_sections(pdf, resume: Resume):
+    """Lay out every resume section on a ResumePDF (or a ResumeLayout dry run)."""
+    # Header
+    with span('layout/header'):
+        pdf.header_section(resume.name, resume.title, resume.contact_line())
+
+    # Summary
+    if resume.summary:
+        with span('layout/summary'):
+            pdf.section_title('个人简介')
+            pdf.body_text(resume.summary)
+            pdf.gap(2)
+
+    # Sections in user-status order (education first for fresh graduates)
+    for section_key in resume.section_order:
+        if section_key == 'education' and resume.education:
+            with span('layout/education'):
+                add_education(pdf, resume.education)
+        elif section_key == 'experience' and resume.experience:
+            with span('layout/experience'):
+                add_experience(pdf, resume.experience)
+        elif section_key == 'projects' and resume.projects:
+            with span('layout/projects'):
+                add_projects(pdf, resume.projects)
+
+    # Skills
+    if resume.skills:
+        with span('layout/skills'):
+            add_skills(pdf, resume.skills)
+
+    # Other
+    if resume.other:
+        with span('layout/other'):
             pdf.section_title('其他')
-            for item in data['other']:
+            for item in resume.other:
                 pdf.body_text(item, bullet=True)
 
-        # Output
-        pdf.output(output_path)
+
+def write_pdf_resume(data, stream, font_cache_dir=None, use_font_cache: bool = True,
+                     subset: bool = False, font_scale: float = 1.0, spacing_scale: float = 1.0) -> dict:
+    """
+    Render a PDF resume into a binary stream, without touching the filesystem.
+
+    Args:
+        data: Resume data dictionary or Resume model
+        stream: Writable binary file object (e.g. io.BytesIO, sys.stdout.buffer)
+        font_cache_dir: Font metrics cache directory (default: get_font_cache_dir())
+        use_font_cache: Reuse parsed font metrics across renders
+        subset: Embed only the used glyphs, without hinting or variation data
+        font_scale: Scale of font sizes and line heights (see ResumePDFMixin)
+        spacing_scale: Scale of the gaps between lines, sections and entries
+
+    Returns:
+        Size report: output_bytes, and font_bytes when subset is enabled
+    """
+    resume = Resume.from_dict(data)
+    with span('import'):
+        _require_fpdf()
+
+    pdf = _layout_pdf(resume, font_cache_dir, use_font_cache, subset, font_scale, spacing_scale)
+    with span('write'):
+        content = pdf.output()
+        stream.write(content)
+
+    report = {'output_bytes': len(content)}
+    if subset:
+        report['font_bytes'] = embedded_font_bytes(pdf)
+    return report
+
+
+def render_pdf_resume(data, font_cache_dir=None, use_font_cache: bool = True,
+                      subset: bool = False, font_scale: float = 1.0, spacing_scale: float = 1.0) -> bytes:
+    """
+    Render a PDF resume to bytes (see write_pdf_resume).
+
+    Returns:
+        PDF file contents
+    """
+    buffer = io.BytesIO()
+    write_pdf_resume(data, buffer, font_cache_dir, use_font_cache, subset, font_scale, spacing_scale)
+    return buffer.getvalue()
+
+
+def create_pdf_resume(data, output_path: str, font_cache_dir=None,
+                      use_font_cache: bool = True, subset: bool = False,
+                      max_bytes: int = None, output_cache: OutputCache = None,
+                      font_scale: float = 1.0, spacing_scale: float = 1.0) -> dict:
+    """
+    Create a PDF resume from structured data.
+
+    Args:
+        data: Resume data dictionary or Resume model
+        output_path: Output PDF file path
+        font_cache_dir: Font metrics cache directory (default: get_font_cache_dir())
+        use_font_cache: Reuse parsed font metrics across renders
+        subset: Embed only the used glyphs, without hinting or variation data
+        max_bytes: Fail (exit 1) if the written PDF is larger than this
+        output_cache: Reuse a previously rendered file for identical input
+        font_scale: Scale of font sizes and line heights (see ResumePDFMixin)
+        spacing_scale: Scale of the gaps between lines, sections and entries
+
+    Returns:
+        Size report: output_bytes, cached (served from the output cache),
+        and font_bytes when subset is enabled
+    """
+    resume = Resume.from_dict(data)
+
+    cache_key = None
+    if output_cache is not None:
+        with span('cache'):
+            version = (f"{file_fingerprint(__file__, font_resolver.__file__)}:"
+                       f"{library_version('fpdf2')}:{_font_identity()}")
+            options = {'subset': subset}
+            if (font_scale, spacing_scale) != (1.0, 1.0):
+                options.update(font_scale=font_scale, spacing_scale=spacing_scale)
+            cache_key = compute_cache_key(resume.data, 'pdf', version, options)
+            hit = output_cache.get(cache_key, output_path)
+        if hit:
+            report = {'output_bytes': os.path.getsize(output_path), 'cached': True}
+            print(f"✅ PDF resume generated: {output_path} (cached)")
+            if max_bytes is not None and report['output_bytes'] > max_bytes:
+                print(f"❌ PDF size {report['output_bytes']} bytes exceeds limit of {max_bytes} bytes")
+                sys.exit(1)
+            return report
+
+    with span('import'):
+        _require_fpdf()
+
+    try:
+        pdf = _layout_pdf(resume, font_cache_dir, use_font_cache, subset, font_scale, spacing_scale)
+        with span('write'), replace_output(output_path) as tmp_path:
+            pdf.output(str(tmp_path))
+
+        report = {'output_bytes': os.path.getsize(output_path), 'cached': False}
+        if subset:
+            report['font_bytes'] = embedded_font_bytes(pdf)
+        if cache_key is not None:
+            with span('cache'):
+                output_cache.put(cache_key, output_path)
+
         print(f"✅ PDF resume generated: {output_path}")
         print(f"📄 Chinese characters fully supported with fpdf2!")
+        if subset:
+            print(f"📦 Size: {report['output_bytes'] / 1024:.1f} KB total, "
+                  f"{report['font_bytes'] / 1024:.1f} KB embedded font")
 
     except Exception as e:
         print(f"❌ Error generating PDF: {e}")
@@ -235,6 +1206,12 @@ def create_pdf_resume(data: dict, output_path: str) -> None:
         traceback.print_exc()
         sys.exit(1)
 
+    if max_bytes is not None and report['output_bytes'] > max_bytes:
+        print(f"❌ PDF size {report['output_bytes']} bytes exceeds limit of {max_bytes} bytes")
+        sys.exit(1)
+
+    return report
+
 
 def add_education(pdf, education):
     """Add education section."""
@@ -242,17 +1219,14 @@ def add_education(pdf, education):
 
     for edu in education:
         # School name and degree
-        title = f"{edu.get('school', '')} | {edu.get('degree', '')} · {edu.get('major', '')}"
-        date = f"{edu.get('startDate', '')} - {edu.get('endDate', '')}" if edu.get('startDate') or edu.get('endDate') else ''
+        pdf.entry_title(f"{edu.school} | {edu.degree} · {edu.major}", edu.date_range)
 
-        pdf.entry_title(title, date)
+        if edu.gpa:
+            pdf.body_text(f"GPA: {edu.gpa}")
 
-        if edu.get('gpa'):
-            pdf.body_text(f"GPA: {edu['gpa']}")
+        pdf.gap(2)
 
-        pdf.ln(2)
-
-    pdf.ln(2)
+    pdf.gap(2)
 
 
 def add_experience(pdf, experience):
@@ -261,19 +1235,15 @@ def add_experience(pdf, experience):
 
     for exp in experience:
         # Company and position
-        title = f"{exp.get('company', '')} | {exp.get('position', '')}"
-        date = f"{exp.get('startDate', '')} - {exp.get('endDate', '')}" if exp.get('startDate') or exp.get('endDate') else ''
-
-        pdf.entry_title(title, date)
+        pdf.entry_title(f"{exp.company} | {exp.position}", exp.date_range)
 
         # Achievements
-        if exp.get('achievements'):
-            for achievement in exp['achievements']:
-                pdf.body_text(achievement, bullet=True)
+        for achievement in exp.achievements:
+            pdf.body_text(achievement, bullet=True)
 
-        pdf.ln(2)
+        pdf.gap(2)
 
-    pdf.ln(2)
+    pdf.gap(2)
 
 
 def add_projects(pdf, projects):
@@ -282,27 +1252,21 @@ def add_projects(pdf, projects):
 
     for proj in projects:
         # Project name and role
-        title = proj.get('name', '')
-        if proj.get('role'):
-            title += f" | {proj['role']}"
-
-        date = proj.get('date', '')
+        title = f"{proj.name} | {proj.role}" if proj.role else proj.name
 
-        pdf.entry_title(title, date)
+        pdf.entry_title(title, proj.date)
 
         # Tech stack
-        if proj.get('tech'):
-            tech_list = proj['tech'] if isinstance(proj['tech'], list) else [proj['tech']]
-            pdf.body_text(f"技术栈: {', '.join(tech_list)}")
+        if proj.tech:
+            pdf.body_text(f"技术栈: {proj.tech_text}")
 
         # Details
-        if proj.get('details'):
-            for detail in proj['details']:
-                pdf.body_text(detail, bullet=True)
+        for detail in proj.details:
+            pdf.body_text(detail, bullet=True)
 
-        pdf.ln(2)
+        pdf.gap(2)
 
-    pdf.ln(2)
+    pdf.gap(2)
 
 
 def add_skills(pdf, skills):
@@ -310,16 +1274,89 @@ def add_skills(pdf, skills):
     pdf.section_title('技能清单')
 
     for skill in skills:
-        text = f"{skill.get('category', '')}: {skill.get('items', '')}"
-        pdf.body_text(text)
+        pdf.body_text(f"{skill.category}: {skill.items}")
 
-    pdf.ln(2)
+    pdf.gap(2)
+
+
+def fit_to_pages(data, args) -> dict:
+    """Run fit_pdf_scale() for --fit-pages and print the scales found."""
+    try:
+        fit = fit_pdf_scale(data, args.fit_pages, font_cache_dir=args.font_cache_dir,
+                            use_font_cache=not args.no_font_cache)
+    except Exception as e:
+        print(f"❌ Error laying out PDF: {e}")
+        sys.exit(1)
+
+    passes = f"{fit['passes']} layout pass{'es' if fit['passes'] > 1 else ''}"
+    if not fit['fits']:
+        print(f"❌ Does not fit in {args.fit_pages} page(s) even at font ×{fit['font_scale']:.2f}, "
+              f"spacing ×{fit['spacing_scale']:.2f} ({fit['layout']['pages']} pages); using these scales")
+    elif (fit['font_scale'], fit['spacing_scale']) == (1.0, 1.0):
+        print(f"📐 Fits in {args.fit_pages} page(s) at full size ({passes})")
+    else:
+        print(f"📐 Fit to {args.fit_pages} page(s): font ×{fit['font_scale']:.2f}, "
+              f"spacing ×{fit['spacing_scale']:.2f} ({passes})")
+    return fit
+
+
+def print_layout(data, args, fit: dict = None) -> None:
+    """Run layout_pdf_resume() for the CLI (or use the --fit-pages layout) and print its report."""
+    if fit is not None:
+        report = dict(fit['layout'], font_scale=fit['font_scale'], spacing_scale=fit['spacing_scale'])
+    else:
+        # With --json, stdout carries only the report
+        log = contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext()
+        with log:
+            try:
+                report = layout_pdf_resume(data, font_cache_dir=args.font_cache_dir,
+                                           use_font_cache=not args.no_font_cache)
+            except Exception as e:
+                print(f"❌ Error laying out PDF: {e}")
+                sys.exit(1)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    print(f"📐 Layout: {report['pages']} page(s), {report['remaining_mm']:.1f} mm left on the last page "
+          f"(no PDF written)")
+    if report['spilled']:
+        print("⚠️  Past page 1:")
+        for entry in report['spilled']:
+            title = ' '.join(entry['title'].split())
+            title = title if len(title) <= 40 else title[:39] + '…'
+            where = f"{entry['section']} › {title}" if entry['section'] else title
+            pages = f"page {entry['page']}" if entry['page'] == entry['last_page'] else \
+                f"pages {entry['page']}-{entry['last_page']}"
+            print(f"   - {where} ({pages})")
 
 
 def main():
     parser = argparse.ArgumentParser(description="Generate PDF resume from JSON data")
     parser.add_argument("--data", "-d", required=True, help="JSON file with resume data")
-    parser.add_argument("--output", "-o", default="resume.pdf", help="Output PDF file path")
+    parser.add_argument("--output", "-o", default="resume.pdf", help="Output PDF file path ('-' for stdout)")
+    parser.add_argument("--font-cache-dir", default=None,
+                        help="Font metrics cache directory (default: $RESUME_FONT_CACHE_DIR or ~/.cache/resume-assistant/fonts)")
+    parser.add_argument("--no-font-cache", action="store_true",
+                        help="Parse the font from scratch instead of using the metrics cache")
+    parser.add_argument("--subset-fonts", action="store_true",
+                        help="Embed only the glyphs used (no hinting/variation data) and report sizes")
+    parser.add_argument("--max-bytes", type=int, default=None,
+                        help="Exit with an error if the PDF is larger than this many bytes")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Output cache directory (default: $RESUME_OUTPUT_CACHE_DIR or ~/.cache/resume-assistant/outputs)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always render, bypassing the output cache")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Only lay out the resume: report pages, space left and entries past page 1 "
+                             "without writing a PDF")
+    parser.add_argument("--json", action="store_true", help="With --dry-run, print the layout report as JSON")
+    parser.add_argument("--fit-pages", type=int, default=None, metavar='N',
+                        help="Shrink spacing, then font sizes, to the largest scale that fits in N pages "
+                             "(layout-only passes, then a single render)")
+    add_server_argument(parser)
+    add_profile_arguments(parser)
 
     args = parser.parse_args()
 
@@ -336,7 +1373,70 @@ def main():
             print(f"Error: Invalid JSON in {args.data}: {e}")
             sys.exit(1)
 
-    create_pdf_resume(data, args.output)
+    if args.fit_pages is not None and args.fit_pages < 1:
+        print("Error: --fit-pages must be at least 1")
+        sys.exit(1)
+
+    fit = None
+    scales = {}
+    if args.fit_pages is not None:
+        # Messages go to stderr when stdout carries the PDF or the JSON report
+        quiet = args.json if args.dry_run else args.output == '-'
+        with contextlib.redirect_stdout(sys.stderr) if quiet else contextlib.nullcontext():
+            fit = fit_to_pages(data, args)
+        scales = {'font_scale': fit['font_scale'], 'spacing_scale': fit['spacing_scale']}
+
+    if args.dry_run:
+        with profile_session(args.profile, args.cprofile, args.memory):
+            print_layout(data, args, fit)
+        if fit is not None and not fit['fits']:
+            sys.exit(1)
+        return
+
+    server = server_for(args)
+    if server:
+        size = render_to_output('pdf', data, {'subset': args.subset_fonts, **scales}, args.output, server)
+        if size is not None:
+            log = sys.stderr if args.output == '-' else sys.stdout
+            if args.output != '-':
+                print(f"✅ PDF resume generated: {args.output} (render server)")
+            if args.max_bytes is not None and size > args.max_bytes:
+                print(f"❌ PDF size {size} bytes exceeds limit of {args.max_bytes} bytes", file=log)
+                sys.exit(1)
+            if fit is not None and not fit['fits']:
+                sys.exit(1)
+            return
+
+    if args.output == '-':
+        # The PDF goes to stdout, so progress and error messages go to stderr
+        stdout = sys.stdout.buffer
+        with contextlib.redirect_stdout(sys.stderr), \
+                profile_session(args.profile, args.cprofile, args.memory):
+            try:
+                report = write_pdf_resume(data, stdout, font_cache_dir=args.font_cache_dir,
+                                          use_font_cache=not args.no_font_cache, subset=args.subset_fonts,
+                                          **scales)
+            except Exception as e:
+                print(f"❌ Error generating PDF: {e}")
+                import traceback
+                traceback.print_exc()
+                sys.exit(1)
+            stdout.flush()
+            if args.max_bytes is not None and report['output_bytes'] > args.max_bytes:
+                print(f"❌ PDF size {report['output_bytes']} bytes exceeds limit of {args.max_bytes} bytes")
+                sys.exit(1)
+        if fit is not None and not fit['fits']:
+            sys.exit(1)
+        return
+
+    with profile_session(args.profile, args.cprofile, args.memory):
+        create_pdf_resume(data, args.output, font_cache_dir=args.font_cache_dir,
+                          use_font_cache=not args.no_font_cache, subset=args.subset_fonts,
+                          max_bytes=args.max_bytes,
+                          output_cache=None if args.no_cache else OutputCache(args.cache_dir),
+                          **scales)
+    if fit is not None and not fit['fits']:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
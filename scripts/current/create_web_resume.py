@@ -4,6 +4,9 @@ Generate web-based HTML resume from JSON data.
 
 Usage:
     python create_web_resume.py --data resume_data.json --output resume.html
+    python create_web_resume.py --data resume_data.json --output - > resume.html
+    python create_web_resume.py --batch resumes.jsonl --output-dir out/ --workers 8
+    cat resumes.jsonl | python create_web_resume.py --batch - --output-dir out/
 
 Features:
     - Modern responsive design
@@ -14,183 +17,444 @@ Features:
 
 import json
 import argparse
+import os
 import sys
 import re
 import html
+from collections import ChainMap
+from functools import lru_cache
 from pathlib import Path
 
+from output_cache import OutputCache, compute_cache_key, file_fingerprint, replace_output
+from profiling import span, add_profile_arguments, profile_session
+from render_client import add_server_argument, render_to_output, server_for
+from resume_model import Resume
+from validate_data import validate, format_errors
 
-def render_template(template_content: str, data: dict) -> str:
+
+# Template tokens: {{#each name}}, {{#if name}}, {{/each}}, {{/if}} and {{variable}}.
+# The variable branch mirrors the original substitution rule: anything that
+# does not start with '#' or '/'.
+_TOKEN_RE = re.compile(
+    r'\{\{(?:#each\s+(?P<each>\w+)|#if\s+(?P<if>\w+)|/(?P<end>each|if)|(?!#|/)(?P<var>[^\}]+))\}\}'
+)
+
+# Node kinds of the compiled render plan
+_TEXT, _VAR, _IF, _EACH = range(4)
+
+
+class CompiledTemplate:
     """
-    Template rendering with proper nested {{#each}} and {{#if}} support.
+    A template tokenized once into a node tree and rendered in a single pass.
 
-    Supports:
-    - {{variable}} - Simple variable substitution
-    - {{#if variable}} ... {{/if}} - Conditional blocks
-    - {{#each array}} ... {{/each}} - Array iteration (with nesting support)
+    Nodes are tuples:
+    - (_TEXT, text)
+    - (_VAR, name)
+    - (_IF, name, children)
+    - (_EACH, name, children)
     """
 
-    def find_matching_end(text, start_pos, start_tag, end_tag):
-        """Find the matching end tag for a given start tag, accounting for nesting."""
-        depth = 1
-        pos = start_pos
-
-        while depth > 0 and pos < len(text):
-            # Find next occurrence of either start or end tag
-            next_start = text.find(start_tag, pos)
-            next_end = text.find(end_tag, pos)
-
-            if next_end == -1:
-                return -1  # No matching end found
-
-            if next_start != -1 and next_start < next_end:
-                # Found nested start tag
-                depth += 1
-                pos = next_start + len(start_tag)
-            else:
-                # Found end tag
-                depth -= 1
-                if depth == 0:
-                    return next_end
-                pos = next_end + len(end_tag)
-
-        return -1
-
-    def process(text, ctx):
-        """Process template recursively."""
-        # Try to find {{#each}} blocks
-        each_start_pattern = r'\{\{#each\s+(\w+)\}\}'
-        each_match = re.search(each_start_pattern, text)
-
-        if each_match:
-            var_name = each_match.group(1)
-            content_start = each_match.end()
-
-            # Find matching {{/each}}
-            end_pos = find_matching_end(text, content_start, '{{#each', '{{/each}}')
-
-            if end_pos != -1:
-                content = text[content_start:end_pos]
-                array = ctx.get(var_name, [])
-
-                if isinstance(array, list) and len(array) > 0:
-                    parts = []
-                    for item in array:
-                        item_ctx = dict(ctx)
-                        if isinstance(item, dict):
-                            item_ctx.update(item)
-                        else:
-                            item_ctx['this'] = item
-
-                        rendered = process(content, item_ctx)
-                        parts.append(rendered)
-
-                    replacement = ''.join(parts)
-                else:
-                    replacement = ''
-
-                # Replace and continue
-                before = text[:each_match.start()]
-                after = text[end_pos + len('{{/each}}'):]
-                text = before + replacement + after
-                return process(text, ctx)
-
-        # Try to find {{#if}} blocks
-        if_start_pattern = r'\{\{#if\s+(\w+)\}\}'
-        if_match = re.search(if_start_pattern, text)
-
-        if if_match:
-            var_name = if_match.group(1)
-            content_start = if_match.end()
-
-            end_pos = find_matching_end(text, content_start, '{{#if', '{{/if}}')
-
-            if end_pos != -1:
-                content = text[content_start:end_pos]
-                value = ctx.get(var_name)
-
-                if value and (not isinstance(value, (list, str)) or len(value) > 0):
-                    replacement = process(content, ctx)
-                else:
-                    replacement = ''
-
-                before = text[:if_match.start()]
-                after = text[end_pos + len('{{/if}}'):]
-                text = before + replacement + after
-                return process(text, ctx)
-
-        # Replace variables with HTML escaping to prevent XSS
-        def replace_var(m):
-            var_name = m.group(1).strip()
-            value = ctx.get(var_name, '')
+    __slots__ = ('source', 'nodes')
+
+    def __init__(self, source: str):
+        self.source = source
+        self.nodes = _parse(source)
+
+    def render(self, data: dict) -> str:
+        """Render the template against a data dictionary."""
+        parts = []
+        _render_nodes(self.nodes, data, parts)
+        return ''.join(parts)
+
+
+def _parse(source: str) -> list:
+    """Tokenize the template and build the node tree with an explicit stack."""
+    root = []
+    # Each stack frame: (kind, name, opening tag text, children)
+    stack = []
+    children = root
+    pos = 0
+
+    for m in _TOKEN_RE.finditer(source):
+        if m.start() > pos:
+            children.append((_TEXT, source[pos:m.start()]))
+        pos = m.end()
+
+        if m.group('each') is not None:
+            stack.append((_EACH, m.group('each'), m.group(0), children))
+            children = []
+        elif m.group('if') is not None:
+            stack.append((_IF, m.group('if'), m.group(0), children))
+            children = []
+        elif m.group('end') is not None:
+            kind = _EACH if m.group('end') == 'each' else _IF
+            if not any(frame[0] == kind for frame in stack):
+                # Stray closing tag: keep it as literal text
+                children.append((_TEXT, m.group(0)))
+                continue
+            # Close the nearest matching block, flattening any unclosed ones in between
+            while True:
+                frame_kind, name, tag, parent = stack.pop()
+                if frame_kind == kind:
+                    parent.append((kind, name, children))
+                    children = parent
+                    break
+                parent.append((_TEXT, tag))
+                parent.extend(children)
+                children = parent
+        else:
+            children.append((_VAR, m.group('var').strip()))
+
+    if pos < len(source):
+        children.append((_TEXT, source[pos:]))
+
+    # Unclosed blocks at end of input are left as literal tags
+    while stack:
+        _, _, tag, parent = stack.pop()
+        parent.append((_TEXT, tag))
+        parent.extend(children)
+        children = parent
+
+    return root
+
+
+def _render_nodes(nodes: list, ctx, parts: list) -> None:
+    """Render a node list into parts, recursing only into block nesting."""
+    for node in nodes:
+        kind = node[0]
+
+        if kind == _TEXT:
+            parts.append(node[1])
+
+        elif kind == _VAR:
+            value = ctx.get(node[1], '')
             # HTML escape to prevent XSS attacks
             if value is not None:
-                return html.escape(str(value), quote=True)
-            return ''
+                parts.append(html.escape(str(value), quote=True))
+
+        elif kind == _IF:
+            value = ctx.get(node[1])
+            if value and (not isinstance(value, (list, str)) or len(value) > 0):
+                _render_nodes(node[2], ctx, parts)
+
+        else:  # _EACH
+            array = ctx.get(node[1], [])
+            if isinstance(array, list):
+                for item in array:
+                    if isinstance(item, dict):
+                        item_ctx = ChainMap(item, ctx)
+                    else:
+                        item_ctx = ChainMap({'this': item}, ctx)
+                    _render_nodes(node[2], item_ctx, parts)
 
-        text = re.sub(r'\{\{(?!#|/)([^\}]+)\}\}', replace_var, text)
 
-        return text
+@lru_cache(maxsize=32)
+def compile_template(template_content: str) -> CompiledTemplate:
+    """Compile template source into a reusable render plan."""
+    return CompiledTemplate(template_content)
 
-    return process(template_content, data)
 
+# Compiled templates keyed by (path, mtime_ns, size, fresh_graduate)
+_TEMPLATE_CACHE = {}
 
-def create_web_resume(data: dict, output_path: str, template: str = 'modern') -> None:
+
+def load_template(template_path, fresh_graduate: bool = False) -> CompiledTemplate:
     """
-    Create a web-based HTML resume from structured data.
+    Load and compile a template file, reusing the compiled plan while the
+    file is unchanged on disk.
 
     Args:
-        data: Resume data dictionary
-        output_path: Output HTML file path
-        template: Template name ('modern' or 'minimal')
+        template_path: Path to the HTML template
+        fresh_graduate: Apply the education-first section order before compiling
     """
+    template_path = Path(template_path)
+    stat = template_path.stat()
+    key = (str(template_path.resolve()), stat.st_mtime_ns, stat.st_size, fresh_graduate)
+
+    compiled = _TEMPLATE_CACHE.get(key)
+    if compiled is None:
+        with span('template/read'):
+            with open(template_path, 'r', encoding='utf-8') as f:
+                template_content = f.read()
+
+            if fresh_graduate:
+                template_content = reorder_sections_for_fresh_grad(template_content)
+
+        with span('template/parse'):
+            compiled = CompiledTemplate(template_content)
+        # Drop stale entries for the same file
+        for old_key in [k for k in _TEMPLATE_CACHE if k[0] == key[0] and k[3] == fresh_graduate]:
+            del _TEMPLATE_CACHE[old_key]
+        _TEMPLATE_CACHE[key] = compiled
+
+    return compiled
+
+
+def render_template(template_content: str, data: dict) -> str:
+    """
+    Template rendering with proper nested {{#each}} and {{#if}} support.
+
+    Supports:
+    - {{variable}} - Simple variable substitution
+    - {{#if variable}} ... {{/if}} - Conditional blocks
+    - {{#each array}} ... {{/each}} - Array iteration (with nesting support)
+
+    The template is compiled once (see compile_template) and rendered in a
+    single linear pass.
+    """
+    with span('template/parse'):
+        compiled = compile_template(template_content)
+    with span('template/render'):
+        return compiled.render(data)
+
+
+def get_template_path(template: str = 'modern') -> Path:
+    """Resolve a template name to its HTML file in assets/templates/."""
     # Get script directory and skill root directory
     # __file__ is at: scripts/current/create_web_resume.py
     # We need to go up two levels to get to skill root
     script_dir = Path(__file__).parent          # scripts/current/
     skill_dir = script_dir.parent.parent        # skill root (up two levels)
 
-    # Determine section order based on user status
-    # If user is fresh graduate, put education before work experience
-    is_fresh_graduate = data.get('is_fresh_graduate', False)
+    if template == 'modern':
+        return skill_dir / 'assets' / 'templates' / 'web-resume-modern.html'
+    # Fallback to modern if template not found
+    return skill_dir / 'assets' / 'templates' / 'web-resume-modern.html'
 
-    # Create section order hint for template (for informational purposes)
-    data['_section_order_hint'] = 'education_first' if is_fresh_graduate else 'experience_first'
 
-    # Load template
-    if template == 'modern':
-        template_path = skill_dir / 'assets' / 'templates' / 'web-resume-modern.html'
-    else:
-        # Fallback to modern if template not found
-        template_path = skill_dir / 'assets' / 'templates' / 'web-resume-modern.html'
+def render_web_resume(data, template: str = 'modern') -> str:
+    """
+    Render resume data to an HTML string.
 
+    Args:
+        data: Resume data dictionary or Resume model (not modified)
+        template: Template name ('modern' or 'minimal')
+
+    Returns:
+        Rendered HTML
+
+    Raises:
+        FileNotFoundError: If the template file does not exist
+    """
+    resume = Resume.from_dict(data)
+
+    template_path = get_template_path(template)
     if not template_path.exists():
-        print(f"Error: Template not found: {template_path}")
-        sys.exit(1)
+        raise FileNotFoundError(f"Template not found: {template_path}")
 
-    with open(template_path, 'r', encoding='utf-8') as f:
-        template_content = f.read()
+    # Load compiled template (cached per path and mtime).
+    # For fresh graduates the education section is moved before work experience.
+    compiled = load_template(template_path, fresh_graduate=resume.is_fresh_graduate)
 
-    # Adjust template section order based on user status
-    if is_fresh_graduate:
-        # Move education section before work experience for fresh graduates
-        template_content = reorder_sections_for_fresh_grad(template_content)
+    # Render template with normalized data (includes the section order hint)
+    with span('template/render'):
+        return compiled.render(resume.template_context())
 
-    # Render template with data
-    html_content = render_template(template_content, data)
 
-    # Write output
+def write_web_resume(data, stream, template: str = 'modern') -> None:
+    """
+    Render an HTML resume into a binary stream (UTF-8), without touching the filesystem.
+
+    Args:
+        data: Resume data dictionary or Resume model (not modified)
+        stream: Writable binary file object (e.g. io.BytesIO, sys.stdout.buffer)
+        template: Template name ('modern' or 'minimal')
+
+    Raises:
+        FileNotFoundError: If the template file does not exist
+    """
+    html_content = render_web_resume(data, template)
+    with span('write'):
+        stream.write(html_content.encode('utf-8'))
+
+
+def create_web_resume(data, output_path: str, template: str = 'modern',
+                      output_cache: OutputCache = None) -> bool:
+    """
+    Create a web-based HTML resume from structured data.
+
+    Args:
+        data: Resume data dictionary or Resume model
+        output_path: Output HTML file path
+        template: Template name ('modern' or 'minimal')
+        output_cache: Reuse a previously rendered file for identical input
+
+    Returns:
+        True if the file was served from the output cache
+    """
     output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_key = None
+    if output_cache is not None:
+        with span('cache'):
+            version = file_fingerprint(__file__, get_template_path(template))
+            cache_key = compute_cache_key(Resume.from_dict(data).data, 'html', version, {'template': template})
+            hit = output_cache.get(cache_key, output_file)
+        if hit:
+            print(f"✅ Web resume generated: {output_path} (cached)")
+            return True
+
+    try:
+        html_content = render_web_resume(data, template)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Write output
+    with span('write'):
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        with replace_output(output_file) as tmp_file:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(html_content)
+
+    if cache_key is not None:
+        with span('cache'):
+            output_cache.put(cache_key, output_file)
 
     print(f"✅ Web resume generated: {output_path}")
     print(f"💡 Open in browser: file://{output_file.absolute()}")
     print(f"📱 Responsive design: works on mobile and desktop")
     print(f"🌙 Dark mode: click the theme toggle button")
     print(f"📄 Export PDF: click 'Print/Export PDF' or use browser print (Ctrl+P / Cmd+P)")
+    return False
+
+
+# ========== Batch Mode ==========
+
+# Characters that are not safe in output file names
+_UNSAFE_NAME_RE = re.compile(r'[\\/:*?"<>|\s]+')
+
+
+def _batch_output_name(name_pattern: str, index: int, data: dict) -> str:
+    """Build an output file name from the naming pattern ({index}, {name}, {id})."""
+    fields = data if isinstance(data, dict) else {}
+    name = _UNSAFE_NAME_RE.sub('_', str(fields.get('name', '') or 'resume')).strip('_') or 'resume'
+    record_id = _UNSAFE_NAME_RE.sub('_', str(fields.get('id', index)))
+    return name_pattern.format(index=index, name=name, id=record_id)
+
+
+def _batch_worker_init(template: str) -> None:
+    """Warm the compiled template cache once per worker process."""
+    template_path = get_template_path(template)
+    if template_path.exists():
+        load_template(template_path, fresh_graduate=False)
+        load_template(template_path, fresh_graduate=True)
+
+
+def _batch_render_one(index: int, data: dict, output_path: str, template: str) -> dict:
+    """Render one batch record; errors are returned, never raised."""
+    try:
+        if not isinstance(data, dict):
+            raise ValueError(f"Record must be a JSON object, got {type(data).__name__}")
+        html_content = render_web_resume(data, template)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        return {'index': index, 'status': 'ok', 'output': output_path}
+    except Exception as e:
+        return {'index': index, 'status': 'error', 'error': f"{type(e).__name__}: {e}"}
+
+
+def create_web_resumes_batch(lines, output_dir: str, template: str = 'modern',
+                             workers: int = None, name_pattern: str = '{index:06d}.html',
+                             max_in_flight: int = None) -> dict:
+    """
+    Render many resumes from newline-delimited JSON records.
+
+    Records are parsed and validated in the parent process and rendered
+    across a process pool. Each worker compiles the template once. At most
+    max_in_flight records are queued at a time, so memory stays bounded for
+    large inputs.
+
+    Args:
+        lines: Iterable of JSONL lines (one resume object per line)
+        output_dir: Directory for rendered HTML files
+        template: Template name
+        workers: Number of worker processes (default: CPU count, 1 = no pool)
+        name_pattern: Output file name pattern; supports {index}, {name}, {id}
+        max_in_flight: Maximum queued records (default: workers * 4)
+
+    Returns:
+        Summary dictionary with per-record results
+    """
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+    results = []
+
+    def records():
+        """Yield (index, data, output_path) or an error result per non-blank line."""
+        index = 0
+        for line_no, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            index += 1
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield {'index': index, 'line': line_no, 'status': 'error',
+                       'error': f"JSONDecodeError: {e}"}
+                continue
+            # Reject invalid records before they take a worker slot
+            errors = validate(data, 'resume')
+            if errors:
+                messages = format_errors(errors)
+                yield {'index': index, 'line': line_no, 'status': 'error',
+                       'error': f"ValidationError: {messages[0]}" + (
+                           f" (+{len(messages) - 1} more)" if len(messages) > 1 else ''),
+                       'validation_errors': messages}
+                continue
+            output_name = _batch_output_name(name_pattern, index, data)
+            yield index, line_no, data, str(out_dir / output_name)
+
+    if workers <= 1:
+        _batch_worker_init(template)
+        for record in records():
+            if isinstance(record, dict):
+                results.append(record)
+                continue
+            index, line_no, data, output_path = record
+            result = _batch_render_one(index, data, output_path, template)
+            result['line'] = line_no
+            results.append(result)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_batch_worker_init,
+                                 initargs=(template,)) as pool:
+            pending = {}
+
+            def collect(done):
+                for future in done:
+                    line_no = pending.pop(future)
+                    result = future.result()
+                    result['line'] = line_no
+                    results.append(result)
+
+            for record in records():
+                if isinstance(record, dict):
+                    results.append(record)
+                    continue
+                index, line_no, data, output_path = record
+                if len(pending) >= max_in_flight:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                future = pool.submit(_batch_render_one, index, data, output_path, template)
+                pending[future] = line_no
+
+            if pending:
+                done, _ = wait(pending)
+                collect(done)
+
+    results.sort(key=lambda r: r['index'])
+    succeeded = sum(1 for r in results if r['status'] == 'ok')
+    return {
+        'total': len(results),
+        'succeeded': succeeded,
+        'failed': len(results) - succeeded,
+        'records': results,
+    }
 
 
 def reorder_sections_for_fresh_grad(template_html: str) -> str:
@@ -228,15 +492,62 @@ def reorder_sections_for_fresh_grad(template_html: str) -> str:
     return template_before_insert + '\n' + education_section + template_after_insert
 
 
+def run_batch(args) -> None:
+    """Run batch mode from the command line and write the summary file."""
+    if args.batch == '-':
+        summary = create_web_resumes_batch(sys.stdin, args.output_dir, args.template,
+                                           args.workers, args.name_pattern)
+    else:
+        batch_path = Path(args.batch)
+        if not batch_path.exists():
+            print(f"Error: Batch file not found: {args.batch}")
+            sys.exit(1)
+        with open(batch_path, 'r', encoding='utf-8') as f:
+            summary = create_web_resumes_batch(f, args.output_dir, args.template,
+                                               args.workers, args.name_pattern)
+
+    summary_path = Path(args.summary) if args.summary else Path(args.output_dir) / 'batch_summary.json'
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    print(f"✅ Batch complete: {summary['succeeded']}/{summary['total']} rendered to {args.output_dir}")
+    if summary['failed']:
+        print(f"⚠️  {summary['failed']} record(s) failed, see {summary_path}")
+    print(f"📋 Summary: {summary_path}")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate web-based HTML resume from JSON data")
-    parser.add_argument("--data", "-d", required=True, help="JSON file with resume data")
-    parser.add_argument("--output", "-o", default="resume.html", help="Output HTML file path")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--data", "-d", help="JSON file with resume data")
+    source.add_argument("--batch", "-b",
+                        help="JSONL file with one resume per line ('-' for stdin)")
+    parser.add_argument("--output", "-o", default="resume.html", help="Output HTML file path ('-' for stdout)")
     parser.add_argument("--template", "-t", default="modern", choices=['modern'],
                        help="Template style (default: modern)")
+    parser.add_argument("--output-dir", default="resumes",
+                        help="Batch mode: output directory (default: resumes)")
+    parser.add_argument("--workers", "-j", type=int, default=None,
+                        help="Batch mode: worker processes (default: CPU count)")
+    parser.add_argument("--name-pattern", default="{index:06d}.html",
+                        help="Batch mode: output file name pattern, supports {index}, {name}, {id}")
+    parser.add_argument("--summary", default=None,
+                        help="Batch mode: summary JSON path (default: <output-dir>/batch_summary.json)")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Output cache directory (default: $RESUME_OUTPUT_CACHE_DIR or ~/.cache/resume-assistant/outputs)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always render, bypassing the output cache")
+    add_server_argument(parser)
+    add_profile_arguments(parser)
 
     args = parser.parse_args()
 
+    if args.batch:
+        with profile_session(args.profile, args.cprofile, args.memory):
+            run_batch(args)
+        return
+
     # Load data
     data_path = Path(args.data)
     if not data_path.exists():
@@ -250,7 +561,26 @@ def main():
             print(f"Error: Invalid JSON in {args.data}: {e}")
             sys.exit(1)
 
-    create_web_resume(data, args.output, args.template)
+    server = server_for(args)
+    if server and render_to_output('html', data, {'template': args.template}, args.output, server) is not None:
+        if args.output != '-':
+            print(f"✅ Web resume generated: {args.output} (render server)")
+        return
+
+    if args.output == '-':
+        stdout = sys.stdout.buffer
+        with profile_session(args.profile, args.cprofile, args.memory):
+            try:
+                write_web_resume(data, stdout, args.template)
+            except FileNotFoundError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(1)
+            stdout.flush()
+        return
+
+    output_cache = None if args.no_cache else OutputCache(args.cache_dir)
+    with profile_session(args.profile, args.cprofile, args.memory):
+        create_web_resume(data, args.output, args.template, output_cache=output_cache)
 
 
 if __name__ == "__main__":
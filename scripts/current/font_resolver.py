@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Font discovery shared by the generators.
+
+The configured font locations (the bundled font, $RESUME_FONT_PATH and the
+usual install paths) are scanned once. Each font found is recorded with its
+family name, codepoint coverage and path in a small index, persisted in the
+font cache directory next to the font metrics. An entry is rescanned only
+when the font's size or modification time changes, so a render stats the
+configured paths once per process instead of loading every candidate to find
+one that works.
+
+- PDF:  main font and fallback chain (pdf_fonts), coverage bitmaps
+- DOCX: family name of the first CJK font, if asked for (preferred_family)
+
+Usage:
+    python font_resolver.py              # list the fonts found
+    python font_resolver.py --refresh    # rescan every font
+    python font_resolver.py --json
+"""
+
+import json
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+
+FONT_INDEX_VERSION = 1
+COVERAGE_CACHE_VERSION = 1
+FONT_INDEX_FILE = 'font-index.json'
+
+# A font counts as CJK when it covers at least this many CJK Unified
+# Ideographs (U+4E00-U+9FFF), roughly the commonly used characters
+CJK_IDEOGRAPHS = range(0x4E00, 0xA000)
+CJK_MIN_IDEOGRAPHS = 2500
+
+# In-process index, keyed by (search paths, cache directory)
+_FONT_INDEX = {}
+
+# Coverage bitmaps, keyed by font_file_key()
+_FONT_COVERAGE = {}
+
+
+def get_font_cache_dir() -> Path:
+    """Return the font cache directory ($RESUME_FONT_CACHE_DIR or the user cache dir)."""
+    cache_dir = os.getenv('RESUME_FONT_CACHE_DIR')
+    if cache_dir:
+        return Path(cache_dir)
+    base = os.getenv('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+    return Path(base) / 'resume-assistant' / 'fonts'
+
+
+def get_bundled_font_path() -> Path:
+    """Bundled font path (in skill's assets/fonts directory)."""
+    script_dir = Path(__file__).parent          # scripts/current/
+    skill_dir = script_dir.parent.parent        # skill root
+    return skill_dir / 'assets' / 'fonts' / 'NotoSansSC.ttf'
+
+
+def font_search_paths() -> list:
+    """Configured font locations in priority order (bundled font first; entries may be None)."""
+    return [
+        str(get_bundled_font_path()),  # Bundled font (highest priority)
+        os.getenv('RESUME_FONT_PATH'),  # Environment variable
+        '/tmp/fonts/NotoSansSC.ttf',     # Default path
+        str(Path.home() / '.fonts' / 'NotoSansSC.ttf'),  # User fonts
+        '/usr/share/fonts/truetype/noto/NotoSansSC-Regular.ttf',  # Linux system fonts
+        '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc',
+        '/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc',
+        '/System/Library/Fonts/PingFang.ttc',  # macOS
+        'C:\\Windows\\Fonts\\msyh.ttc',  # Windows (Microsoft YaHei)
+    ]
+
+
+def font_file_key(font_path) -> tuple:
+    """
+    Identify a font file by resolved path, size and modification time.
+
+    Raises:
+        OSError: If the file does not exist
+    """
+    path = Path(font_path).resolve()
+    stat = path.stat()
+    return (str(path), stat.st_size, stat.st_mtime_ns)
+
+
+def write_cache_file(cache_file: Path, content: bytes) -> None:
+    """Write a font cache file atomically, so concurrent workers never read a partial file."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        pass  # Cache is best-effort (e.g. read-only filesystem)
+
+
+# ========== Coverage ==========
+
+class FontCoverage:
+    """Codepoint coverage bitmap of a font: bit `cp` is set if the font has a glyph for it."""
+
+    __slots__ = ('bits',)
+
+    def __init__(self, bits: bytes = b''):
+        self.bits = bits
+
+    @classmethod
+    def from_codepoints(cls, codepoints) -> 'FontCoverage':
+        """Build the bitmap from an iterable of codepoints (e.g. a cmap dictionary)."""
+        codepoints = list(codepoints)
+        bits = bytearray((max(codepoints) >> 3) + 1 if codepoints else 0)
+        for codepoint in codepoints:
+            bits[codepoint >> 3] |= 1 << (codepoint & 7)
+        return cls(bytes(bits))
+
+    def __contains__(self, codepoint: int) -> bool:
+        index = codepoint >> 3
+        return index < len(self.bits) and bool(self.bits[index] >> (codepoint & 7) & 1)
+
+    def count(self, codepoints=None) -> int:
+        """Number of covered codepoints (of `codepoints`, or in total)."""
+        if codepoints is None:
+            return sum(bin(byte).count('1') for byte in self.bits)
+        return sum(1 for codepoint in codepoints if codepoint in self)
+
+
+def _coverage_file(cache_dir: Path, key: tuple) -> Path:
+    digest = hashlib.sha1(repr((key, COVERAGE_CACHE_VERSION)).encode('utf-8')).hexdigest()
+    return cache_dir / f"{Path(key[0]).stem}-{digest[:16]}.coverage"
+
+
+def load_font_coverage(font_path, cache_dir=None, use_disk_cache: bool = True,
+                       cmap: dict = None) -> FontCoverage:
+    """
+    Load a font's coverage bitmap, from memory, the disk cache, or the font's cmap.
+
+    Args:
+        font_path: Path to a TTF/OTF/TTC font file (the first font of a collection is used)
+        cache_dir: Disk cache directory (default: get_font_cache_dir())
+        use_disk_cache: Read and write the on-disk cache
+        cmap: The font's already parsed cmap (codepoint -> glyph), to avoid parsing it again
+
+    Returns:
+        FontCoverage of the font
+
+    Raises:
+        Exception: If the font cannot be read (fontTools errors vary by font)
+    """
+    key = font_file_key(font_path)
+    coverage = _FONT_COVERAGE.get(key)
+    if coverage is not None:
+        return coverage
+
+    cache_file = None
+    if use_disk_cache:
+        cache_file = _coverage_file(Path(cache_dir) if cache_dir else get_font_cache_dir(), key)
+        try:
+            coverage = FontCoverage(cache_file.read_bytes())
+        except OSError:
+            coverage = None
+
+    if coverage is None:
+        if cmap is None:
+            from fontTools import ttLib
+            font = ttLib.TTFont(key[0], lazy=True, fontNumber=0)
+            try:
+                cmap = font.getBestCmap() or {}
+            finally:
+                font.close()
+        coverage = FontCoverage.from_codepoints(cmap)
+        if cache_file is not None:
+            write_cache_file(cache_file, coverage.bits)
+
+    _FONT_COVERAGE[key] = coverage
+    return coverage
+
+
+# ========== Font Index ==========
+
+def _scan_font(key: tuple, cache_dir, use_disk_cache: bool) -> dict:
+    """Index entry for one font file (family, coverage summary, or the error reading it)."""
+    path, size, mtime_ns = key
+    entry = {'path': path, 'size': size, 'mtime_ns': mtime_ns}
+    try:
+        from fontTools import ttLib
+
+        with open(path, 'rb') as f:
+            entry['collection'] = f.read(4) == b'ttcf'
+        font = ttLib.TTFont(path, lazy=True, fontNumber=0)
+        try:
+            names = font['name']
+            entry['family'] = names.getBestFamilyName() or Path(path).stem
+            entry['full_name'] = names.getBestFullName() or entry['family']
+            entry['outlines'] = 'cff' if ('CFF ' in font or 'CFF2' in font) else 'glyf'
+            cmap = font.getBestCmap() or {}
+        finally:
+            font.close()
+        coverage = load_font_coverage(path, cache_dir, use_disk_cache, cmap=cmap)
+        entry['codepoints'] = len(cmap)
+        entry['cjk'] = coverage.count(CJK_IDEOGRAPHS) >= CJK_MIN_IDEOGRAPHS
+    except Exception as e:
+        entry['error'] = f"{type(e).__name__}: {e}"
+    return entry
+
+
+def load_font_index(cache_dir=None, use_disk_cache: bool = True, refresh: bool = False) -> list:
+    """
+    Fonts installed at the configured locations, in priority order.
+
+    The index is kept in memory for the process and in font-index.json in the
+    cache directory; an entry is rescanned when its file's size or mtime changes.
+
+    Args:
+        cache_dir: Cache directory for the index and coverage bitmaps (default: get_font_cache_dir())
+        use_disk_cache: Read and write the on-disk index
+        refresh: Rescan every font
+
+    Returns:
+        Index entries (dictionaries with path, size, mtime_ns, family, full_name,
+        collection, outlines, codepoints, cjk; or error if the font cannot be read)
+    """
+    search_paths = tuple(p for p in font_search_paths() if p)
+    memo_key = (search_paths, str(cache_dir))
+    if not refresh and memo_key in _FONT_INDEX:
+        return _FONT_INDEX[memo_key]
+
+    index_file = (Path(cache_dir) if cache_dir else get_font_cache_dir()) / FONT_INDEX_FILE
+    stored = {}
+    if use_disk_cache and not refresh:
+        try:
+            with open(index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') == FONT_INDEX_VERSION:
+                stored = {entry['path']: entry for entry in index['fonts']}
+        except (OSError, ValueError, KeyError, TypeError):
+            stored = {}
+
+    fonts, changed = [], False
+    for font_path in search_paths:
+        try:
+            key = font_file_key(font_path)
+        except OSError:
+            continue  # Not installed
+        if any(entry['path'] == key[0] for entry in fonts):
+            continue
+        entry = stored.get(key[0])
+        if entry is None or (entry['size'], entry['mtime_ns']) != key[1:]:
+            entry = _scan_font(key, cache_dir, use_disk_cache)
+            changed = True
+        fonts.append(entry)
+
+    if use_disk_cache and (changed or len(stored) != len(fonts)):
+        write_cache_file(index_file, json.dumps(
+            {'version': FONT_INDEX_VERSION, 'fonts': fonts}, ensure_ascii=False, indent=2).encode('utf-8'))
+
+    _FONT_INDEX[memo_key] = fonts
+    return fonts
+
+
+def pdf_fonts(cache_dir=None) -> list:
+    """Fonts the PDF generator can embed, in priority order (of a collection, the first font is used)."""
+    return [entry for entry in load_font_index(cache_dir) if 'error' not in entry]
+
+
+def preferred_family(default: str = None, cache_dir=None) -> str:
+    """Family name of the first installed CJK font, or `default` if there is none."""
+    for entry in load_font_index(cache_dir):
+        if 'error' not in entry and entry['cjk']:
+            return entry['family']
+    return default
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List the fonts the generators use")
+    parser.add_argument("--refresh", action="store_true", help="Rescan every font instead of using the index")
+    parser.add_argument("--json", action="store_true", help="Print the index as JSON")
+
+    args = parser.parse_args()
+
+    fonts = load_font_index(refresh=args.refresh)
+    if args.json:
+        print(json.dumps(fonts, ensure_ascii=False, indent=2))
+        return
+
+    if not fonts:
+        print("⚠️  No fonts found. Searched:")
+        for font_path in font_search_paths():
+            if font_path:
+                print(f"   {font_path}")
+        sys.exit(1)
+
+    print(f"📋 Font index: {get_font_cache_dir() / FONT_INDEX_FILE}")
+    for entry in fonts:
+        if 'error' in entry:
+            print(f"❌ {entry['path']}\n   {entry['error']}")
+            continue
+        uses = ['PDF']
+        if entry['cjk']:
+            uses.append('CJK')
+        print(f"✅ {entry['family']} ({entry['path']})")
+        print(f"   {entry['codepoints']} characters, {entry['size'] / 1024 / 1024:.1f} MB"
+              f"{', ' + ', '.join(uses) if uses else ''}")
+
+
+if __name__ == "__main__":
+    main()
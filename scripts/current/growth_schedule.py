@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+Week-by-week schedule of a growth plan.
+
+The plan's timeline ("6个月", "12周") is parsed once into a Schedule that
+holds each phase's week range, the weekly action items of every task and
+real calendar dates for their deadlines. The growth tracker sheets all read
+from the same Schedule, and it can be exported to JSON or CSV without
+building a workbook.
+
+Weeks are calendar weeks: week 1 is the Monday-to-Sunday week containing
+the start date, so a deadline such as "本周五" of week 3 is the Friday of
+that week.
+
+Usage:
+    python growth_schedule.py --plan growth_plan.json --format json --output schedule.json
+    python growth_schedule.py --plan growth_plan.json --format csv --start-date 2025-03-03
+"""
+
+import csv
+import json
+import argparse
+import os
+import re
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from validate_data import validate, format_errors
+
+
+DEFAULT_WEEKS = 12
+WEEKDAYS = {'一': 0, '二': 1, '三': 2, '四': 3, '五': 4, '六': 5, '日': 6, '天': 6}
+
+# "本周五", "下周三", "第3周日" (relative to the task's first week)
+_DEADLINE_RE = re.compile(r'^(本|下|第(\d+))周([一二三四五六日天])$')
+
+# Task classification rules and weekly subtask templates (override with RESUME_TASK_RULES)
+TASK_RULES_FILE = Path(__file__).parent.parent.parent / 'assets' / 'templates' / 'task_rules.json'
+
+CSV_FIELDS = ['phase_index', 'phase', 'week', 'week_start', 'task', 'action', 'hours',
+              'deadline', 'due_date']
+
+
+def parse_duration_weeks(timeline: str, default: int = DEFAULT_WEEKS) -> int:
+    """
+    Parse a plan timeline into weeks (支持"3个月"、"12周"等格式).
+
+    Returns:
+        Number of weeks, or `default` if the timeline has no usable number
+    """
+    digits = ''.join(filter(str.isdigit, timeline or ''))
+    if not digits or int(digits) <= 0:
+        return default
+    if '个月' in timeline:
+        return int(digits) * 4
+    if '周' in timeline:
+        return int(digits)
+    return default
+
+
+class TaskRules:
+    """
+    Compiled task classification rules (see assets/templates/task_rules.json).
+
+    A task belongs to the first category (in table order) that has a keyword
+    occurring in the lower-cased task name, or to "default" if none does.
+    All keywords are matched by one precompiled alternation; only when the
+    leftmost hit belongs to a later category are the earlier categories
+    checked, so table order still decides. A category's templates are tried
+    in order and the first with `min_weeks` <= weeks available is used (the
+    last one is the fallback); `{task_name}` in an action is replaced by the
+    task name. Selected templates are cached per (category, weeks).
+    """
+
+    def __init__(self, rules: dict):
+        categories = rules.get('categories', [])
+        self.names = [category['name'] for category in categories] + ['default']
+        self._templates = [category['templates'] for category in categories]
+        self._templates.append(rules['default']['templates'])
+        for name, templates in zip(self.names, self._templates):
+            if not templates:
+                raise ValueError(f"Task rule category '{name}' has no templates")
+
+        self._priority = {}
+        for priority, category in enumerate(categories):
+            for keyword in category['keywords']:
+                self._priority.setdefault(keyword.lower(), priority)
+        # Earlier categories first, longer keywords first within a category
+        keywords = sorted(self._priority, key=lambda kw: (self._priority[kw], -len(kw)))
+        self._pattern = re.compile('|'.join(map(re.escape, keywords))) if keywords else None
+        self._category_patterns = [
+            re.compile('|'.join(re.escape(kw.lower()) for kw in category['keywords']))
+            if category['keywords'] else None
+            for category in categories
+        ]
+        self._cache = {}
+
+    def classify(self, task_name: str) -> int:
+        """
+        Returns:
+            Index of the task's category in `names` (the last index is "default")
+        """
+        task_lower = task_name.lower()
+        match = self._pattern.search(task_lower) if self._pattern else None
+        if match is None:
+            return len(self.names) - 1
+        priority = self._priority[match.group(0)]
+        for earlier in range(priority):
+            pattern = self._category_patterns[earlier]
+            if pattern is not None and pattern.search(task_lower):
+                return earlier
+        return priority
+
+    def templates(self, category: int, weeks_available: int) -> tuple:
+        """Subtask templates of a category for a number of weeks, as (action, hours, deadline) tuples."""
+        key = (category, weeks_available)
+        selected = self._cache.get(key)
+        if selected is None:
+            templates = self._templates[category]
+            chosen = next((t for t in templates if weeks_available >= t.get('min_weeks', 0)), templates[-1])
+            selected = tuple((s['action'], s['hours'], s['deadline']) for s in chosen['subtasks'])
+            self._cache[key] = selected
+        return selected
+
+    def break_down(self, task_name: str, weeks_available: int) -> list:
+        """Weekly action items of a task: list of dicts with action, hours and deadline."""
+        return [
+            {'action': action.replace('{task_name}', task_name), 'hours': hours, 'deadline': deadline}
+            for action, hours, deadline in self.templates(self.classify(task_name), weeks_available)
+        ]
+
+
+_task_rules = None
+
+
+def load_task_rules(path: str = None) -> TaskRules:
+    """
+    Load and compile a task rule table.
+
+    Args:
+        path: Rule table JSON (default: RESUME_TASK_RULES, or the bundled table)
+
+    Returns:
+        Compiled TaskRules
+    """
+    path = Path(path or os.getenv('RESUME_TASK_RULES') or TASK_RULES_FILE)
+    with open(path, 'r', encoding='utf-8') as f:
+        rules = json.load(f)
+    try:
+        return TaskRules(rules)
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Invalid task rules in {path}: missing or malformed {e}") from e
+
+
+def default_task_rules() -> TaskRules:
+    """The task rule table used when none is given (loaded and compiled once per process)."""
+    global _task_rules
+    if _task_rules is None:
+        _task_rules = load_task_rules()
+    return _task_rules
+
+
+def _break_down_task(task_name: str, weeks_available: int, rules: TaskRules = None) -> list:
+    """
+    将主任务分解为具体的周度行动项。
+
+    Args:
+        task_name: 主任务名称
+        weeks_available: 可用的周数
+        rules: 任务分类规则 (default: default_task_rules())
+
+    Returns:
+        包含具体行动项的列表，每项包含action、hours、deadline
+    """
+    return (rules or default_task_rules()).break_down(task_name, weeks_available)
+
+
+class ScheduledSubtask:
+    """One weekly action item of a task."""
+
+    __slots__ = ('week', 'action', 'hours', 'deadline', 'due_date')
+
+    def __init__(self, week: int, action: str, hours: str, deadline: str, due_date):
+        self.week = week
+        self.action = action
+        self.hours = hours
+        self.deadline = deadline      # Relative text, e.g. "本周五"
+        self.due_date = due_date      # Calendar date, or None if the text is not a weekday
+
+    def to_dict(self) -> dict:
+        return {
+            'week': self.week,
+            'action': self.action,
+            'hours': self.hours,
+            'deadline': self.deadline,
+            'due_date': self.due_date.isoformat() if self.due_date else None,
+        }
+
+
+class ScheduledTask:
+    """A plan task with its weekly action items."""
+
+    __slots__ = ('name', 'deadline', 'resources', 'start_week', 'subtasks')
+
+    def __init__(self, name: str, deadline: str, resources: list, start_week: int, subtasks: list):
+        self.name = name
+        self.deadline = deadline      # Task deadline text from the plan
+        self.resources = resources
+        self.start_week = start_week
+        self.subtasks = subtasks
+
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'deadline': self.deadline,
+            'resources': self.resources,
+            'start_week': self.start_week,
+            'subtasks': [subtask.to_dict() for subtask in self.subtasks],
+        }
+
+
+class ScheduledPhase:
+    """A plan phase with its week range."""
+
+    __slots__ = ('index', 'name', 'milestone', 'start_week', 'end_week', 'end_date', 'tasks')
+
+    def __init__(self, index: int, name: str, milestone: str, start_week: int, end_week: int,
+                 end_date: date, tasks: list):
+        self.index = index
+        self.name = name
+        self.milestone = milestone
+        self.start_week = start_week
+        self.end_week = end_week
+        self.end_date = end_date      # Sunday of the last week (milestone check date)
+        self.tasks = tasks
+
+    def to_dict(self) -> dict:
+        return {
+            'index': self.index,
+            'name': self.name,
+            'milestone': self.milestone,
+            'start_week': self.start_week,
+            'end_week': self.end_week,
+            'end_date': self.end_date.isoformat(),
+            'tasks': [task.to_dict() for task in self.tasks],
+        }
+
+
+class Schedule:
+    """Week-by-week schedule of a growth plan (see build_schedule)."""
+
+    __slots__ = ('target_position', 'timeline', 'duration_weeks', 'weeks_per_phase',
+                 'start_date', 'phases')
+
+    def __init__(self, target_position: str, timeline: str, duration_weeks: int,
+                 weeks_per_phase: int, start_date: date, phases: list):
+        self.target_position = target_position
+        self.timeline = timeline
+        self.duration_weeks = duration_weeks
+        self.weeks_per_phase = weeks_per_phase
+        self.start_date = start_date
+        self.phases = phases
+
+    def week_start(self, week: int) -> date:
+        """Monday of a plan week (week 1 contains the start date)."""
+        monday = self.start_date - timedelta(days=self.start_date.weekday())
+        return monday + timedelta(weeks=week - 1)
+
+    def rows(self):
+        """Flat weekly rows (one per action item), as dictionaries with CSV_FIELDS keys."""
+        for phase in self.phases:
+            for task in phase.tasks:
+                for subtask in task.subtasks:
+                    yield {
+                        'phase_index': phase.index,
+                        'phase': phase.name,
+                        'week': subtask.week,
+                        'week_start': self.week_start(subtask.week).isoformat(),
+                        'task': task.name,
+                        'action': subtask.action,
+                        'hours': subtask.hours,
+                        'deadline': subtask.deadline,
+                        'due_date': subtask.due_date.isoformat() if subtask.due_date else '',
+                    }
+
+    def to_dict(self) -> dict:
+        return {
+            'target_position': self.target_position,
+            'timeline': self.timeline,
+            'duration_weeks': self.duration_weeks,
+            'weeks_per_phase': self.weeks_per_phase,
+            'start_date': self.start_date.isoformat(),
+            'phases': [phase.to_dict() for phase in self.phases],
+        }
+
+    def write_json(self, f) -> None:
+        json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+    def write_csv(self, f) -> None:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(self.rows())
+
+
+def due_date(schedule: Schedule, task_week: int, deadline: str):
+    """
+    Calendar date of a relative deadline ("本周五", "下周三", "第3周日"), or None.
+
+    Week 1 starts on the Monday before the start date, so a weekday of week 1
+    that has already passed when the plan starts (e.g. "本周五" for a Saturday
+    start) moves to the following week.
+    """
+    match = _DEADLINE_RE.match(deadline or '')
+    if not match:
+        return None
+    prefix, nth, weekday = match.groups()
+    offset = 0 if prefix == '本' else 1 if prefix == '下' else int(nth) - 1
+    due = schedule.week_start(task_week + offset) + timedelta(days=WEEKDAYS[weekday])
+    if due < schedule.start_date:
+        due += timedelta(weeks=1)
+    return due
+
+
+def build_schedule(plan_data: dict, start_date: date = None, rules: TaskRules = None) -> Schedule:
+    """
+    Compute the schedule of a growth plan.
+
+    Args:
+        plan_data: Growth plan dictionary (see references/data-formats.md)
+        start_date: First day of the plan (default: today)
+        rules: Task classification rules (default: default_task_rules())
+
+    Returns:
+        Schedule shared by all tracker sheets
+    """
+    start_date = start_date or date.today()
+    rules = rules or default_task_rules()
+    timeline = plan_data.get('timeline', '') or ''
+    duration_weeks = parse_duration_weeks(timeline)
+    plan_phases = plan_data.get('phases', []) or []
+    # 根据阶段数量计算周数 (at least one week per phase)
+    weeks_per_phase = max(1, duration_weeks // len(plan_phases)) if plan_phases else 4
+
+    schedule = Schedule(plan_data.get('target_position', ''), timeline, duration_weeks,
+                        weeks_per_phase, start_date, [])
+
+    for phase_idx, phase in enumerate(plan_phases, 1):
+        # 支持新格式的phase/title字段
+        phase_name = phase.get('title', phase.get('phase', ''))
+        start_week = (phase_idx - 1) * weeks_per_phase + 1
+        end_week = phase_idx * weeks_per_phase
+
+        tasks = []
+        for task in phase.get('tasks', []):
+            task_name = task.get('task', task.get('name', ''))
+
+            # 分解任务为具体行动项 (one per week, within the phase)
+            subtasks = []
+            for week_offset, info in enumerate(rules.break_down(task_name, weeks_per_phase)):
+                week = start_week + week_offset
+                if week > end_week:
+                    break
+                subtasks.append(ScheduledSubtask(week, info['action'], info['hours'], info['deadline'],
+                                                 due_date(schedule, start_week, info['deadline'])))
+
+            tasks.append(ScheduledTask(task_name, task.get('deadline', ''), task.get('resources', []),
+                                       start_week, subtasks))
+
+        end_date = schedule.week_start(end_week) + timedelta(days=6)
+        schedule.phases.append(ScheduledPhase(phase_idx, phase_name, phase.get('milestone', ''),
+                                              start_week, end_week, end_date, tasks))
+
+    return schedule
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the week-by-week schedule of a growth plan")
+    parser.add_argument("--plan", "-p", required=True, help="JSON file with growth plan data")
+    parser.add_argument("--format", "-f", choices=['json', 'csv'], default='json',
+                        help="Output format (default: json)")
+    parser.add_argument("--output", "-o", default='-', help="Output file (default: stdout)")
+    parser.add_argument("--start-date", default=None, help="Plan start date, YYYY-MM-DD (default: today)")
+
+    args = parser.parse_args()
+
+    plan_path = Path(args.plan)
+    if not plan_path.exists():
+        print(f"Error: Plan file not found: {args.plan}")
+        sys.exit(1)
+
+    start_date = None
+    if args.start_date:
+        try:
+            start_date = datetime.strptime(args.start_date, '%Y-%m-%d').date()
+        except ValueError:
+            print(f"Error: Invalid --start-date (expected YYYY-MM-DD): {args.start_date}")
+            sys.exit(1)
+
+    with open(plan_path, 'r', encoding='utf-8') as f:
+        try:
+            plan_data = json.load(f)
+        except json.JSONDecodeError as e:
+            print(f"Error: Invalid JSON in {args.plan}: {e}")
+            sys.exit(1)
+
+    errors = validate(plan_data, 'growth')
+    if errors:
+        print(f"Error: Invalid growth plan in {args.plan}:")
+        for line in format_errors(errors):
+            print(f"  - {line}")
+        sys.exit(1)
+
+    try:
+        rules = default_task_rules()
+    except (OSError, ValueError) as e:
+        print(f"Error: Cannot load task rules: {e}")
+        sys.exit(1)
+
+    schedule = build_schedule(plan_data, start_date, rules)
+    write = schedule.write_json if args.format == 'json' else schedule.write_csv
+
+    if args.output == '-':
+        write(sys.stdout)
+    else:
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            write(f)
+        print(f"✅ Schedule exported: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
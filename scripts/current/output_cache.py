@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for generated resume files.
+
+The HTML, PDF and DOCX generators hash the normalized input data together
+with the renderer version (script and template contents, library version)
+and options. If a file for that hash is already cached, it is copied to the
+requested output path instead of rendering again (as a reflink where the
+filesystem supports it, so the copy shares blocks until either file is
+changed). The output never shares an inode with the cache entry, so a user
+editing the generated file cannot alter what later hits return. The
+generators also write every rendered file through replace_output(), which
+swaps in a new file instead of overwriting the old one in place.
+
+The cache is bounded in size and evicts least-recently-used entries.
+Hit/miss counters are collected in memory and written to stats.json when an
+entry is stored and at process exit, so a hit costs no extra write.
+
+Usage:
+    python output_cache.py --stats
+    python output_cache.py --clear
+"""
+
+import json
+import argparse
+import atexit
+import hashlib
+import os
+import shutil
+import sys
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+
+
+CACHE_VERSION = 1
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256MB
+
+# stats.json path -> hit/miss counts not yet written, shared by all instances
+_pending_stats = {}
+_pending_lock = threading.Lock()
+
+
+def get_output_cache_dir() -> Path:
+    """Return the output cache directory ($RESUME_OUTPUT_CACHE_DIR or the user cache dir)."""
+    cache_dir = os.getenv('RESUME_OUTPUT_CACHE_DIR')
+    if cache_dir:
+        return Path(cache_dir)
+    base = os.getenv('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+    return Path(base) / 'resume-assistant' / 'outputs'
+
+
+@lru_cache(maxsize=64)
+def _hash_file(path: str, size: int, mtime_ns: int) -> str:
+    """Hash file contents (memoized while the file is unchanged)."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_fingerprint(*paths) -> str:
+    """Combined content hash of renderer files (scripts, templates); missing files hash as absent."""
+    parts = []
+    for path in paths:
+        path = Path(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            parts.append(f"{path.name}:missing")
+            continue
+        parts.append(f"{path.name}:{_hash_file(str(path), stat.st_size, stat.st_mtime_ns)}")
+    return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def library_version(distribution: str) -> str:
+    """Installed version of a renderer library, read from package metadata without importing it."""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:  # Python < 3.8
+        return ''
+    try:
+        return version(distribution)
+    except PackageNotFoundError:
+        return ''
+
+
+@contextmanager
+def replace_output(output_path):
+    """
+    Write a file next to output_path, then atomically move it into place.
+
+    Writing the output in place would also change a cache entry hardlinked to
+    it by an earlier hit (OutputCache(link=True)); replacing the directory
+    entry leaves that inode (and readers of the old file) untouched.
+
+    Yields:
+        Temporary path to write the output to (same directory as output_path)
+    """
+    output_path = Path(output_path)
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.urandom(6).hex()}.tmp")
+    try:
+        yield tmp_path
+        os.replace(tmp_path, output_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+# Linux FICLONE ioctl: share the source's blocks copy-on-write (btrfs, XFS, overlayfs on those)
+_FICLONE = 0x40049409
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    """
+    Create target as a copy-on-write clone of source.
+
+    Returns:
+        True if cloned; False if unsupported (the caller copies instead)
+    """
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        return False
+    try:
+        with open(source, 'rb') as src, open(target, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return True
+    except OSError:
+        return False
+
+
+def _add_stats(stats_path: Path, counts: dict) -> None:
+    """Add counters to stats.json (best-effort, not locked across processes)."""
+    import tempfile
+
+    try:
+        try:
+            with open(stats_path, 'r', encoding='utf-8') as f:
+                stats = json.load(f)
+        except (OSError, ValueError):
+            stats = {}
+        for counter, count in counts.items():
+            stats[counter] = stats.get(counter, 0) + count
+        stats_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=stats_path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(stats, f)
+        os.replace(tmp_path, stats_path)
+    except OSError:
+        pass
+
+
+def flush_stats(stats_path: Path = None) -> None:
+    """
+    Write hit/miss counts collected in this process to stats.json.
+
+    Args:
+        stats_path: Only flush this cache's counters (default: all caches)
+    """
+    with _pending_lock:
+        if stats_path is None:
+            pending = list(_pending_stats.items())
+            _pending_stats.clear()
+        else:
+            counts = _pending_stats.pop(stats_path, None)
+            pending = [(stats_path, counts)] if counts else []
+    for path, counts in pending:
+        _add_stats(path, counts)
+
+
+atexit.register(flush_stats)
+
+
+def compute_cache_key(data: dict, renderer: str, version: str, options: dict = None) -> str:
+    """
+    Stable hash of normalized input data, renderer identity/version and options.
+
+    Key order and JSON formatting of the input do not affect the key.
+    """
+    payload = json.dumps(
+        {
+            'cache_version': CACHE_VERSION,
+            'renderer': renderer,
+            'version': version,
+            'options': options or {},
+            'data': data,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(',', ':'),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class OutputCache:
+    """
+    Size-bounded LRU cache of rendered files.
+
+    Entries live in <cache_dir>/objects/<key><suffix>. Recency is tracked with
+    the entry's mtime, which is refreshed on every hit. Hit/miss counters are
+    kept per instance and accumulated in <cache_dir>/stats.json (see flush_stats).
+    """
+
+    def __init__(self, cache_dir=None, max_bytes: int = None, link: bool = False):
+        """
+        Args:
+            cache_dir: Cache directory (default: get_output_cache_dir())
+            max_bytes: Size bound for cached files (default: $RESUME_OUTPUT_CACHE_MAX_BYTES or 256MB)
+            link: Hardlink cached files to outputs when possible instead of copying;
+                only safe if outputs are never edited in place (an edit changes the entry)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else get_output_cache_dir()
+        self.objects_dir = self.cache_dir / 'objects'
+        if max_bytes is None:
+            max_bytes = int(os.getenv('RESUME_OUTPUT_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES))
+        self.max_bytes = max_bytes
+        self.link = link
+        self.stats_path = self.cache_dir / 'stats.json'
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, key: str, suffix: str) -> Path:
+        return self.objects_dir / f"{key}{suffix}"
+
+    def get(self, key: str, output_path) -> bool:
+        """
+        Materialize a cached file at output_path.
+
+        Returns:
+            True on a cache hit, False on a miss
+        """
+        output_path = Path(output_path)
+        entry = self._entry_path(key, output_path.suffix)
+        if not entry.exists():
+            self.misses += 1
+            self._record('misses')
+            return False
+
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._materialize(entry, output_path)
+            os.utime(entry)  # Mark as most recently used
+        except OSError:
+            self.misses += 1
+            self._record('misses')
+            return False
+
+        self.hits += 1
+        self._record('hits')
+        return True
+
+    def put(self, key: str, output_path) -> None:
+        """Store a freshly rendered file under its key, then enforce the size bound."""
+        import tempfile
+
+        output_path = Path(output_path)
+        entry = self._entry_path(key, output_path.suffix)
+        try:
+            self.objects_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.objects_dir, suffix='.tmp')
+            os.close(fd)
+            shutil.copy(output_path, tmp_path)  # Keep the output's permission bits
+            os.replace(tmp_path, entry)
+        except OSError:
+            return  # Cache is best-effort (e.g. read-only filesystem)
+        self.evict()
+        flush_stats(self.stats_path)
+
+    def _materialize(self, entry: Path, output_path: Path) -> None:
+        """Copy (reflink where possible) or hardlink the cache entry to output_path."""
+        if self.link:
+            if output_path.exists() or output_path.is_symlink():
+                output_path.unlink()
+            try:
+                os.link(entry, output_path)
+                return
+            except OSError:
+                pass  # Different filesystem or links unsupported
+        with replace_output(output_path) as tmp_path:
+            if not _reflink(entry, tmp_path):
+                shutil.copyfile(entry, tmp_path)
+
+    def evict(self) -> int:
+        """
+        Remove least-recently-used entries until the cache fits max_bytes.
+
+        Returns:
+            Number of entries removed
+        """
+        try:
+            entries = [(e.stat(), e) for e in self.objects_dir.iterdir() if not e.name.endswith('.tmp')]
+        except OSError:
+            return 0
+
+        total = sum(stat.st_size for stat, _ in entries)
+        removed = 0
+        for stat, entry in sorted(entries, key=lambda item: item[0].st_mtime):
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= stat.st_size
+            removed += 1
+        return removed
+
+    def _record(self, counter: str) -> None:
+        """Count a hit or miss; written to stats.json by flush_stats()."""
+        with _pending_lock:
+            counts = _pending_stats.setdefault(self.stats_path, {})
+            counts[counter] = counts.get(counter, 0) + 1
+
+    def stats(self) -> dict:
+        """Persistent counters plus current size and entry count."""
+        flush_stats(self.stats_path)
+        try:
+            with open(self.stats_path, 'r', encoding='utf-8') as f:
+                stats = json.load(f)
+        except (OSError, ValueError):
+            stats = {}
+        try:
+            sizes = [e.stat().st_size for e in self.objects_dir.iterdir() if not e.name.endswith('.tmp')]
+        except OSError:
+            sizes = []
+        hits, misses = stats.get('hits', 0), stats.get('misses', 0)
+        return {
+            'cache_dir': str(self.cache_dir),
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            'entries': len(sizes),
+            'bytes': sum(sizes),
+            'max_bytes': self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        """Remove all cached files and counters."""
+        with _pending_lock:
+            _pending_stats.pop(self.stats_path, None)
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear the resume output cache")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Cache directory (default: $RESUME_OUTPUT_CACHE_DIR or ~/.cache/resume-assistant/outputs)")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--stats", action="store_true", help="Print cache statistics as JSON")
+    action.add_argument("--clear", action="store_true", help="Delete all cached outputs")
+
+    args = parser.parse_args()
+    cache = OutputCache(args.cache_dir)
+
+    if args.clear:
+        cache.clear()
+        print(f"✅ Output cache cleared: {cache.cache_dir}")
+    else:
+        json.dump(cache.stats(), sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
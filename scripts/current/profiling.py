@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Lightweight per-phase timing and memory profiling for the generators.
+
+Generators wrap their phases (font loading, template parsing, section
+layout, file write, ...) in `span()` blocks. Spans nest, so a phase is
+reported under its parents, e.g. `pdf/layout/experience`. By default no
+profiler is active and `span()` returns a shared no-op context manager, so
+the instrumentation costs one function call per phase.
+
+In memory mode, allocations are traced with tracemalloc: each span also
+reports the net bytes it allocated, and the memory report gives the peak
+traced allocation, the process RSS high-water mark and the top allocation
+sites at the largest span boundary (where the workbook/PDF is fully built).
+
+Usage (from a generator's main()):
+    from profiling import add_profile_arguments, profile_session
+
+    add_profile_arguments(parser)            # adds --profile, --cprofile and --memory
+    args = parser.parse_args()
+    with profile_session(args.profile, args.cprofile, args.memory):
+        create_something(...)
+"""
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+
+TOP_ALLOCATIONS = 10
+
+
+class _NullSpan:
+    """No-op span used while profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Active span: measures wall and CPU time between enter and exit."""
+
+    __slots__ = ('profiler', 'name', 'wall', 'cpu', 'memory')
+
+    def __init__(self, profiler: 'Profiler', name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler._stack.append(self.name)
+        self.memory = self.profiler._traced_bytes()
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall = time.perf_counter() - self.wall
+        cpu = time.process_time() - self.cpu
+        profiler = self.profiler
+        allocated = profiler._traced_bytes() - self.memory
+        profiler._record('/'.join(profiler._stack), wall, cpu, allocated)
+        profiler._stack.pop()
+        return False
+
+
+class Profiler:
+    """Collects per-span counts and wall/CPU totals, keyed by nested span path."""
+
+    def __init__(self, memory: bool = False):
+        """
+        Args:
+            memory: Trace allocations with tracemalloc (slows rendering down;
+                timings taken in memory mode are inflated)
+        """
+        self._stack = []
+        self._spans = {}  # path -> [count, wall_s, cpu_s, allocated_bytes], in first-seen order
+        self.memory = memory
+        self._snapshot = None
+        self._snapshot_bytes = -1
+        if memory:
+            import tracemalloc
+            self._tracemalloc = tracemalloc
+            tracemalloc.start()
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+
+    def span(self, name: str) -> _Span:
+        return _Span(self, name)
+
+    def _traced_bytes(self) -> int:
+        return self._tracemalloc.get_traced_memory()[0] if self.memory else 0
+
+    def _record(self, path: str, wall: float, cpu: float, allocated: int) -> None:
+        entry = self._spans.get(path)
+        if entry is None:
+            self._spans[path] = [1, wall, cpu, allocated]
+        else:
+            entry[0] += 1
+            entry[1] += wall
+            entry[2] += cpu
+            entry[3] += allocated
+        if self.memory:
+            self._checkpoint()
+
+    def _checkpoint(self) -> None:
+        """Keep an allocation snapshot from the span boundary with the most live memory."""
+        current = self._tracemalloc.get_traced_memory()[0]
+        if current > self._snapshot_bytes:
+            self._snapshot = self._tracemalloc.take_snapshot()
+            self._snapshot_bytes = current
+
+    def stop(self) -> None:
+        """Stop tracing allocations (the memory report stays available)."""
+        if self.memory and self._tracemalloc.is_tracing():
+            self._checkpoint()
+            self._peak_bytes = self._tracemalloc.get_traced_memory()[1]
+            self._tracemalloc.stop()
+
+    def report(self) -> dict:
+        """
+        Timing report.
+
+        Returns:
+            {'wall_s', 'cpu_s', 'spans': [{'name', 'count', 'wall_s', 'cpu_s'}, ...]}
+            (spans also carry 'allocated_bytes' in memory mode)
+        """
+        spans = []
+        for path, (count, wall, cpu, allocated) in self._spans.items():
+            entry = {'name': path, 'count': count, 'wall_s': round(wall, 6), 'cpu_s': round(cpu, 6)}
+            if self.memory:
+                entry['allocated_bytes'] = allocated
+            spans.append(entry)
+        return {
+            'wall_s': round(time.perf_counter() - self._wall, 6),
+            'cpu_s': round(time.process_time() - self._cpu, 6),
+            'spans': spans,
+        }
+
+    def memory_report(self, top: int = TOP_ALLOCATIONS) -> dict:
+        """
+        Memory report (memory mode only; stops allocation tracing).
+
+        Returns:
+            {'peak_bytes': peak traced Python allocation,
+             'rss_peak_bytes': process RSS high-water mark (None if unavailable),
+             'top_allocations': [{'site', 'size_bytes', 'count'}, ...],
+             'spans': [{'name', 'allocated_bytes'}, ...]}
+        """
+        self.stop()
+        top_allocations = []
+        if self._snapshot is not None:
+            for stat in self._snapshot.statistics('lineno')[:top]:
+                frame = stat.traceback[0]
+                top_allocations.append({
+                    'site': f"{frame.filename}:{frame.lineno}",
+                    'size_bytes': stat.size,
+                    'count': stat.count,
+                })
+        return {
+            'peak_bytes': getattr(self, '_peak_bytes', 0),
+            'rss_peak_bytes': rss_peak_bytes(),
+            'top_allocations': top_allocations,
+            'spans': [{'name': path, 'allocated_bytes': entry[3]} for path, entry in self._spans.items()],
+        }
+
+
+def rss_peak_bytes():
+    """High-water mark of this process's resident set size, or None where unsupported."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+_profiler = None
+
+
+def span(name: str):
+    """Context manager timing one phase (a shared no-op unless profiling is enabled)."""
+    if _profiler is None:
+        return _NULL_SPAN
+    return _profiler.span(name)
+
+
+def enable(memory: bool = False) -> Profiler:
+    """Start collecting spans in a fresh profiler and return it."""
+    global _profiler
+    _profiler = Profiler(memory=memory)
+    return _profiler
+
+
+def disable() -> Profiler:
+    """Stop collecting spans (and allocation tracing); returns the profiler that was active (or None)."""
+    global _profiler
+    profiler, _profiler = _profiler, None
+    if profiler is not None:
+        profiler.stop()
+    return profiler
+
+
+def add_profile_arguments(parser) -> None:
+    """Add --profile [FILE], --cprofile FILE and --memory [FILE] to an argparse parser."""
+    parser.add_argument("--profile", nargs='?', const='-', default=None, metavar='FILE',
+                        help="Write per-phase wall/CPU times as JSON to FILE (default: stderr)")
+    parser.add_argument("--cprofile", default=None, metavar='FILE',
+                        help="Also dump cProfile statistics to FILE (for pstats/snakeviz)")
+    parser.add_argument("--memory", nargs='?', const='-', default=None, metavar='FILE',
+                        help="Trace allocations and write peak memory, RSS high-water mark and "
+                             "top allocation sites as JSON to FILE (default: stderr)")
+
+
+def _write_report(report: dict, path: str) -> None:
+    text = json.dumps(report, indent=2)
+    if path == '-':
+        print(text, file=sys.stderr)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+
+
+@contextmanager
+def profile_session(profile_path: str = None, cprofile_path: str = None, memory_path: str = None):
+    """
+    Profile the enclosed block if any output is requested.
+
+    The reports are written even if the block exits with an error
+    (including sys.exit), so failed renders can be diagnosed too.
+    """
+    if not profile_path and not cprofile_path and not memory_path:
+        yield None
+        return
+
+    profiler = enable(memory=bool(memory_path))
+    cprof = None
+    if cprofile_path:
+        import cProfile
+        cprof = cProfile.Profile()
+        cprof.enable()
+    try:
+        yield profiler
+    finally:
+        if cprof is not None:
+            cprof.disable()
+            cprof.dump_stats(cprofile_path)
+        disable()
+        if profile_path:
+            _write_report(profiler.report(), profile_path)
+        if memory_path:
+            _write_report(profiler.memory_report(), memory_path)
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Thin client for the local render server (render_server.py).
+
+When a render server address is configured (--server or RESUME_RENDER_SERVER),
+the generator CLIs send the JSON data to the server and write the returned
+bytes, instead of importing fpdf2/python-docx/openpyxl and loading fonts in
+a fresh process. If the server is unreachable or its queue is full, the CLI
+renders locally as usual.
+
+Addresses:
+    http://127.0.0.1:8765         localhost HTTP
+    unix:///tmp/resume-render.sock  Unix socket (a plain absolute path also works)
+
+Usage:
+    python render_client.py --health
+    python render_client.py --metrics --server unix:///tmp/resume-render.sock
+"""
+
+import json
+import argparse
+import os
+import sys
+from pathlib import Path
+
+
+SERVER_ENV = 'RESUME_RENDER_SERVER'
+DEFAULT_TIMEOUT = 120.0
+
+
+class RenderServerError(Exception):
+    """The render server rejected the request (e.g. invalid data) or failed to render it."""
+
+
+def server_address(server: str = None) -> str:
+    """Configured render server address (argument, then $RESUME_RENDER_SERVER), or None."""
+    return server or os.getenv(SERVER_ENV) or None
+
+
+def server_for(args) -> str:
+    """
+    Render server to use for a CLI invocation, or None to render locally.
+
+    Profiling runs always render locally, since profiling a client request
+    would not measure the renderer.
+    """
+    if any(getattr(args, name, None) for name in ('profile', 'cprofile', 'memory')):
+        return None
+    return server_address(getattr(args, 'server', None))
+
+
+def add_server_argument(parser) -> None:
+    """Add --server ADDRESS to an argparse parser."""
+    parser.add_argument("--server", default=None, metavar='ADDRESS',
+                        help=f"Render server (http://host:port or unix:///path; default: ${SERVER_ENV}); "
+                             "renders locally if it is not running")
+
+
+def _connection(server: str, timeout: float):
+    """HTTP connection to an http:// or unix:// server address."""
+    import http.client
+    import socket
+
+    if server.startswith('unix://') or server.startswith('/'):
+        path = server[len('unix://'):] if server.startswith('unix://') else server
+
+        class UnixHTTPConnection(http.client.HTTPConnection):
+            def connect(self):
+                self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self.sock.settimeout(self.timeout)
+                self.sock.connect(path)
+
+        return UnixHTTPConnection('localhost', timeout=timeout)
+
+    from urllib.parse import urlsplit
+    parts = urlsplit(server if '://' in server else f"http://{server}")
+    return http.client.HTTPConnection(parts.hostname or '127.0.0.1', parts.port or 80, timeout=timeout)
+
+
+def request(server: str, method: str, path: str, body: bytes = None, timeout: float = DEFAULT_TIMEOUT):
+    """
+    Send one request to the render server.
+
+    Returns:
+        (status, headers dict, body bytes)
+
+    Raises:
+        OSError: If the server cannot be reached
+    """
+    import http.client
+
+    conn = _connection(server, timeout)
+    try:
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        conn.request(method, path, body=body, headers=headers)
+        response = conn.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    except http.client.HTTPException as e:
+        raise OSError(f"Bad response from render server: {e}") from e
+    finally:
+        conn.close()
+
+
+def render_remote(fmt: str, data, options: dict = None, server: str = None,
+                  timeout: float = DEFAULT_TIMEOUT) -> bytes:
+    """
+    Render data on the render server.
+
+    Args:
+        fmt: 'pdf', 'docx', 'html' or 'xlsx'
+        data: Resume or growth plan dictionary
+        options: Render options sent as query parameters (e.g. {'subset': True})
+        server: Server address (default: $RESUME_RENDER_SERVER)
+        timeout: Socket timeout in seconds
+
+    Returns:
+        Rendered file contents, or None if no server is configured, it is
+        unreachable or its queue is full (the caller renders locally)
+
+    Raises:
+        RenderServerError: If the server rejected the data or failed to render it
+    """
+    server = server_address(server)
+    if not server:
+        return None
+
+    from urllib.parse import urlencode
+    query = {key: ('1' if value is True else value) for key, value in (options or {}).items()
+             if value not in (None, False)}
+    path = f"/render/{fmt}" + (f"?{urlencode(query)}" if query else '')
+    body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+    try:
+        status, _, content = request(server, 'POST', path, body, timeout)
+    except OSError:
+        return None
+
+    if status == 200:
+        return content
+    if status == 503:
+        return None
+    try:
+        error = json.loads(content)
+    except ValueError:
+        error = {'error': content.decode('utf-8', 'replace')}
+    message = error.get('error', f"HTTP {status}")
+    for line in error.get('validation_errors', [])[1:]:
+        message += f"\n  - {line}"
+    raise RenderServerError(message)
+
+
+def write_output(content: bytes, output_path: str) -> None:
+    """Write rendered bytes to a file path, or to stdout for '-'."""
+    if output_path == '-':
+        sys.stdout.buffer.write(content)
+        sys.stdout.buffer.flush()
+        return
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(content)
+
+
+def render_to_output(fmt: str, data, options: dict, output_path: str, server: str) -> int:
+    """
+    Render on the server and write the result to output_path ('-' for stdout).
+
+    Exits with an error message if the server rejects the data.
+
+    Returns:
+        Number of bytes written, or None if the caller should render locally
+    """
+    try:
+        content = render_remote(fmt, data, options, server)
+    except RenderServerError as e:
+        print(f"Error: Render server: {e}", file=sys.stderr if output_path == '-' else sys.stdout)
+        sys.exit(1)
+    if content is None:
+        return None
+    write_output(content, output_path)
+    return len(content)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the local render server")
+    query = parser.add_mutually_exclusive_group(required=True)
+    query.add_argument("--health", action="store_true", help="Print server health as JSON")
+    query.add_argument("--metrics", action="store_true", help="Print per-format latency metrics as JSON")
+    parser.add_argument("--server", default=None, metavar='ADDRESS',
+                        help=f"Render server (http://host:port or unix:///path; default: ${SERVER_ENV})")
+
+    args = parser.parse_args()
+
+    server = server_address(args.server)
+    if not server:
+        print(f"Error: No render server configured (use --server or ${SERVER_ENV})")
+        sys.exit(1)
+
+    try:
+        status, _, content = request(server, 'GET', '/health' if args.health else '/metrics', timeout=10)
+    except OSError as e:
+        print(f"Error: Render server not reachable at {server}: {e}")
+        sys.exit(1)
+
+    print(json.dumps(json.loads(content), ensure_ascii=False, indent=2))
+    if status != 200:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Local render server that keeps libraries, fonts and templates warm.
+
+Starting a generator script imports fpdf2/python-docx/openpyxl, loads the
+CJK font and compiles the HTML template on every call. The server does this
+once per worker process and then renders resume and growth plan JSON to
+bytes on request, over localhost HTTP or a Unix socket:
+
+    POST /render/pdf     resume JSON -> PDF      (?subset=1&font_scale=0.9&spacing_scale=0.5)
+    POST /render/docx    resume JSON -> DOCX
+    POST /render/html    resume JSON -> HTML     (?template=modern)
+    POST /render/xlsx    plan JSON   -> tracker  (?start_date=YYYY-MM-DD&streaming=1)
+    GET  /health         status, uptime, workers, queue
+    GET  /metrics        per-format request counts and latency percentiles
+
+Requests are rendered by a pool of worker processes. At most
+workers + queue requests are accepted at a time; beyond that the server
+answers 503 and clients render locally. A render that outlives --timeout
+is answered with 504, but keeps its slot until the worker is done with it. The generator CLIs use the server
+when --server or RESUME_RENDER_SERVER points at it (see render_client.py).
+
+Usage:
+    python render_server.py --port 8765 --workers 4 --queue 16
+    python render_server.py --socket /tmp/resume-render.sock
+    RESUME_RENDER_SERVER=http://127.0.0.1:8765 python create_pdf_resume.py --data resume.json
+"""
+
+import json
+import argparse
+import os
+import signal
+import socketserver
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit, parse_qs
+
+
+FORMATS = {
+    'pdf': 'application/pdf',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'html': 'text/html; charset=utf-8',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+MAX_BODY_BYTES = 16 * 1024 * 1024
+LATENCY_SAMPLES = 1024  # Most recent requests kept per format for percentiles
+
+
+# ========== Worker Side ==========
+
+def warm() -> dict:
+    """
+    Import the renderers and load fonts, templates and task rules.
+
+    Runs once in the server process (forked workers inherit the warm state)
+    and as the pool initializer (a no-op after fork, needed for spawn). The
+    PDF font is mapped and everything loaded is frozen last, so the workers
+    share it copy-on-write (see share_font_data).
+
+    Returns:
+        Description of what was loaded, for /health
+    """
+    from create_pdf_resume import _require_fpdf, _font_identity, share_font_data
+    from create_docx_resume import _require_docx, get_font_name
+    from create_web_resume import get_template_path, load_template
+    from create_growth_tracker import _batch_worker_init
+
+    _require_fpdf()
+    from create_pdf_resume import ResumePDF
+    ResumePDF()  # Parses (or loads cached) font metrics into the in-process cache
+    _require_docx()
+    template_path = get_template_path('modern')
+    load_template(template_path, fresh_graduate=False)
+    load_template(template_path, fresh_graduate=True)
+    _batch_worker_init()
+    shared = share_font_data()
+    return {'pdf_font': _font_identity(), 'pdf_font_shared_bytes': shared.get('mapped_bytes', 0),
+            'docx_font': get_font_name(), 'template': str(template_path)}
+
+
+def render(fmt: str, data: dict, options: dict) -> tuple:
+    """
+    Render one request in a worker.
+
+    Returns:
+        (content bytes, render start, render end) with time.monotonic() timestamps
+    """
+    started = time.monotonic()
+    if fmt == 'pdf':
+        from create_pdf_resume import render_pdf_resume
+        content = render_pdf_resume(data, subset=options.get('subset', False),
+                                    font_scale=options.get('font_scale', 1.0),
+                                    spacing_scale=options.get('spacing_scale', 1.0))
+    elif fmt == 'docx':
+        from create_docx_resume import render_docx_resume
+        content = render_docx_resume(data)
+    elif fmt == 'html':
+        from create_web_resume import render_web_resume
+        content = render_web_resume(data, options.get('template', 'modern')).encode('utf-8')
+    else:
+        from create_growth_tracker import render_growth_tracker
+        content = render_growth_tracker(data, streaming=options.get('streaming', False),
+                                        start_date=options.get('start_date'))
+    return content, started, time.monotonic()
+
+
+# ========== Server Side ==========
+
+class Metrics:
+    """Thread-safe request counters and recent latencies per format."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.formats = {
+            fmt: {'requests': 0, 'errors': 0, 'rejected': 0, 'timeouts': 0,
+                  'total_ms': deque(maxlen=LATENCY_SAMPLES), 'queue_ms': deque(maxlen=LATENCY_SAMPLES)}
+            for fmt in FORMATS
+        }
+
+    def record(self, fmt: str, outcome: str, total_ms: float = None, queue_ms: float = None) -> None:
+        with self.lock:
+            entry = self.formats[fmt]
+            entry['requests'] += 1
+            if outcome != 'ok':
+                entry[outcome] += 1
+            if total_ms is not None:
+                entry['total_ms'].append(total_ms)
+                entry['queue_ms'].append(queue_ms)
+
+    @staticmethod
+    def _percentiles(samples) -> dict:
+        if not samples:
+            return {}
+        ordered = sorted(samples)
+
+        def at(fraction):
+            return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 2)
+
+        return {'p50': at(0.5), 'p95': at(0.95), 'p99': at(0.99), 'max': round(ordered[-1], 2),
+                'mean': round(sum(ordered) / len(ordered), 2)}
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                fmt: {
+                    'requests': entry['requests'],
+                    'errors': entry['errors'],
+                    'rejected': entry['rejected'],
+                    'timeouts': entry['timeouts'],
+                    'latency_ms': self._percentiles(entry['total_ms']),
+                    'queue_ms': self._percentiles(entry['queue_ms']),
+                }
+                for fmt, entry in self.formats.items()
+            }
+
+
+class RenderTimeout(Exception):
+    """A render did not finish within the service timeout (the worker may still be running it)."""
+
+
+class RenderService:
+    """Worker pool, admission control and metrics shared by all request handlers."""
+
+    def __init__(self, workers: int, queue: int, timeout: float):
+        self.workers = workers
+        self.queue = queue
+        self.timeout = timeout
+        self.metrics = Metrics()
+        self.slots = threading.BoundedSemaphore(max(1, workers) + queue)
+        self.in_flight = 0
+        self.counter_lock = threading.Lock()
+        self.render_lock = threading.Lock()     # Serializes in-process rendering (workers=0)
+        self.warm_info = warm()
+        self.pool = None
+        if workers > 0:
+            from concurrent.futures import ProcessPoolExecutor
+            self.pool = ProcessPoolExecutor(max_workers=workers, initializer=warm)
+
+    def health(self) -> dict:
+        return {
+            'status': 'ok',
+            'pid': os.getpid(),
+            'uptime_s': round(time.time() - self.metrics.started, 1),
+            'workers': self.workers,
+            'queue_limit': self.queue,
+            'in_flight': self.in_flight,
+            'formats': sorted(FORMATS),
+            'warm': self.warm_info,
+        }
+
+    def submit(self, fmt: str, data: dict, options: dict) -> tuple:
+        """
+        Render a request, waiting for a worker.
+
+        Returns:
+            (content, total ms, queue ms), or None if the queue is full
+
+        Raises:
+            RenderTimeout: If a worker did not finish within self.timeout
+        """
+        if not self.slots.acquire(blocking=False):
+            return None
+        accepted = time.monotonic()
+        with self.counter_lock:
+            self.in_flight += 1
+
+        if self.pool is None:
+            try:
+                with self.render_lock:
+                    content, started, finished = render(fmt, data, options)
+            finally:
+                self._release()
+            return content, (finished - accepted) * 1000, (started - accepted) * 1000
+
+        # The slot belongs to the render, not to this request: a timed-out
+        # render keeps its worker busy, so the slot is freed when it finishes
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+        try:
+            future = self.pool.submit(render, fmt, data, options)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        try:
+            content, started, finished = future.result(self.timeout)
+        except FutureTimeoutError:
+            future.cancel()  # Frees the slot at once if the render has not started yet
+            raise RenderTimeout(f"Render did not finish within {self.timeout:g}s")
+        return content, (finished - accepted) * 1000, (started - accepted) * 1000
+
+    def _release(self) -> None:
+        with self.counter_lock:
+            self.in_flight -= 1
+        self.slots.release()
+
+    def close(self) -> None:
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+
+def _parse_options(fmt: str, query: dict) -> dict:
+    """Render options from query parameters (raises ValueError on bad values)."""
+    def flag(name):
+        return query.get(name, [''])[-1].lower() in ('1', 'true', 'yes')
+
+    if fmt == 'pdf':
+        options = {'subset': flag('subset')}
+        for name in ('font_scale', 'spacing_scale'):
+            if query.get(name):
+                value = query[name][-1]
+                try:
+                    options[name] = float(value)
+                except ValueError:
+                    raise ValueError(f"Invalid {name} (expected a number): {value}")
+                if not 0 < options[name] <= 2:
+                    raise ValueError(f"Invalid {name} (expected a number in (0, 2]): {value}")
+        return options
+    if fmt == 'html':
+        return {'template': query.get('template', ['modern'])[-1]}
+    if fmt == 'xlsx':
+        options = {'streaming': flag('streaming')}
+        if query.get('start_date'):
+            try:
+                options['start_date'] = datetime.strptime(query['start_date'][-1], '%Y-%m-%d').date()
+            except ValueError:
+                raise ValueError(f"Invalid start_date (expected YYYY-MM-DD): {query['start_date'][-1]}")
+        return options
+    return {}
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    """HTTP handler: /render/<format>, /health and /metrics."""
+
+    server_version = 'ResumeRenderServer/1'
+    protocol_version = 'HTTP/1.1'
+    service = None   # RenderService, set by serve()
+    verbose = False
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict = None) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: dict, headers: dict = None) -> None:
+        self._send(status, json.dumps(payload, ensure_ascii=False).encode('utf-8'),
+                   'application/json; charset=utf-8', headers)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == '/health':
+            self._send_json(200, self.service.health())
+        elif path == '/metrics':
+            self._send_json(200, self.service.metrics.snapshot())
+        else:
+            self._send_json(404, {'error': f"Not found: {path}"})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        fmt = url.path[len('/render/'):] if url.path.startswith('/render/') else None
+        if fmt not in FORMATS:
+            self._send_json(404, {'error': f"Unknown render path: {url.path} "
+                                           f"(use /render/{{{','.join(sorted(FORMATS))}}})"})
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            self._send_json(413, {'error': f"Request body over {MAX_BODY_BYTES} bytes"})
+            self.service.metrics.record(fmt, 'errors')
+            return
+
+        try:
+            data = json.loads(self.rfile.read(length))
+            options = _parse_options(fmt, parse_qs(url.query))
+        except ValueError as e:
+            self._send_json(400, {'error': f"Invalid request: {e}"})
+            self.service.metrics.record(fmt, 'errors')
+            return
+
+        from validate_data import validate, format_errors
+        errors = validate(data, 'growth' if fmt == 'xlsx' else 'resume')
+        if errors:
+            messages = format_errors(errors)
+            self._send_json(400, {'error': f"Invalid {'growth plan' if fmt == 'xlsx' else 'resume data'}: "
+                                           f"{messages[0]}", 'validation_errors': messages})
+            self.service.metrics.record(fmt, 'errors')
+            return
+
+        try:
+            result = self.service.submit(fmt, data, options)
+        except RenderTimeout as e:
+            self._send_json(504, {'error': str(e)})
+            self.service.metrics.record(fmt, 'timeouts')
+            return
+        except Exception as e:
+            self._send_json(500, {'error': f"{type(e).__name__}: {e}"})
+            self.service.metrics.record(fmt, 'errors')
+            return
+        if result is None:
+            self._send_json(503, {'error': 'Render queue is full'}, {'Retry-After': '1'})
+            self.service.metrics.record(fmt, 'rejected')
+            return
+
+        content, total_ms, queue_ms = result
+        self._send(200, content, FORMATS[fmt],
+                   {'X-Render-Ms': f"{total_ms:.1f}", 'X-Queue-Ms': f"{queue_ms:.1f}"})
+        self.service.metrics.record(fmt, 'ok', total_ms, queue_ms)
+
+    def address_string(self) -> str:
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'unix'
+
+    def log_message(self, format, *args):
+        if self.verbose:
+            super().log_message(format, *args)
+
+
+class HTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server with a listen backlog sized for bursts of CLI clients."""
+
+    request_queue_size = 128
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTPServer equivalent on a Unix socket."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def serve(host: str = '127.0.0.1', port: int = 8765, socket_path: str = None, workers: int = None,
+          queue: int = None, timeout: float = 120.0, verbose: bool = False) -> None:
+    """
+    Warm up and serve render requests until interrupted (Ctrl+C or SIGTERM).
+
+    Args:
+        host: Interface for HTTP (ignored with socket_path)
+        port: TCP port for HTTP (ignored with socket_path)
+        socket_path: Serve on this Unix socket instead of TCP
+        workers: Worker processes (default: CPU count; 0 = render in the server process)
+        queue: Requests accepted beyond those being rendered (default: workers * 4)
+        timeout: Seconds to wait for a single render
+        verbose: Log every request to stderr
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    queue = max(1, workers) * 4 if queue is None else queue
+
+    start = time.perf_counter()
+    service = RenderService(workers, queue, timeout)
+    handler = type('Handler', (RenderHandler,), {'service': service, 'verbose': verbose})
+
+    if socket_path:
+        if Path(socket_path).exists():
+            Path(socket_path).unlink()
+        httpd = UnixHTTPServer(socket_path, handler)
+        address = f"unix://{socket_path}"
+    else:
+        httpd = HTTPServer((host, port), handler)
+        address = f"http://{host}:{httpd.server_address[1]}"
+
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=httpd.shutdown).start())
+    print(f"✅ Render server ready at {address} ({workers} worker(s), queue {queue}, "
+          f"warm-up {time.perf_counter() - start:.2f}s)")
+    print(f"💡 Use it from the CLIs with: export RESUME_RENDER_SERVER={address}")
+    sys.stdout.flush()
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        service.close()
+        if socket_path and Path(socket_path).exists():
+            Path(socket_path).unlink()
+        print("👋 Render server stopped")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve resume and growth tracker rendering from warm workers")
+    parser.add_argument("--host", default="127.0.0.1", help="HTTP interface (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="HTTP port (default: 8765, 0 = any free port)")
+    parser.add_argument("--socket", default=None, help="Serve on this Unix socket instead of HTTP")
+    parser.add_argument("--workers", "-j", type=int, default=None,
+                        help="Worker processes (default: CPU count, 0 = render in the server process)")
+    parser.add_argument("--queue", type=int, default=None,
+                        help="Requests accepted beyond those being rendered (default: workers * 4)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds per render (default: 120)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Log every request")
+
+    args = parser.parse_args()
+
+    if args.workers is not None and args.workers < 0:
+        print("Error: --workers must be 0 or more")
+        sys.exit(1)
+    if args.queue is not None and args.queue < 0:
+        print("Error: --queue must be 0 or more")
+        sys.exit(1)
+    if args.socket and not hasattr(socketserver, 'UnixStreamServer'):
+        print("Error: Unix sockets are not supported on this platform, use --port")
+        sys.exit(1)
+
+    try:
+        serve(args.host, args.port, args.socket, args.workers, args.queue, args.timeout, args.verbose)
+    except OSError as e:
+        print(f"Error: Cannot start render server: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
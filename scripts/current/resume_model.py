@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Normalized in-memory resume model shared by the PDF, DOCX and HTML renderers.
+
+The raw resume_data.json dictionary is traversed once: missing or null
+fields become empty strings, `tech` is always a list, date ranges are
+pre-formatted, and the section order for fresh graduates is decided up
+front. Renderers read plain attributes instead of repeating dict.get()
+chains, and one model can be handed to every renderer (e.g. by
+build_resume.py).
+
+Usage:
+    from resume_model import Resume
+    resume = Resume.from_dict(data)
+"""
+
+# Section order by user status
+# Fresh graduates: Education → Work Experience → Projects
+# Experienced professionals: Work Experience → Projects → Education
+FRESH_GRADUATE_SECTIONS = ('education', 'experience', 'projects')
+EXPERIENCED_SECTIONS = ('experience', 'projects', 'education')
+
+
+def _text(value) -> str:
+    """Coerce a scalar field to text; missing/null becomes ''."""
+    if value is None:
+        return ''
+    return value if isinstance(value, str) else str(value)
+
+
+def _text_list(value) -> list:
+    """Coerce a list-or-string field to a list of non-empty texts."""
+    if not value:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [_text(item) for item in value if item is not None and item != '']
+    return [_text(value)]
+
+
+def _date_range(start: str, end: str) -> str:
+    """Format 'start - end', or '' when both are empty."""
+    return f"{start} - {end}" if start or end else ''
+
+
+class Education:
+    """One education entry."""
+
+    __slots__ = ('school', 'degree', 'major', 'start_date', 'end_date', 'date_range', 'gpa', 'raw')
+
+    def __init__(self, raw: dict):
+        self.raw = raw
+        self.school = _text(raw.get('school'))
+        self.degree = _text(raw.get('degree'))
+        self.major = _text(raw.get('major'))
+        self.start_date = _text(raw.get('startDate'))
+        self.end_date = _text(raw.get('endDate'))
+        self.date_range = _date_range(self.start_date, self.end_date)
+        self.gpa = _text(raw.get('gpa'))
+
+
+class Experience:
+    """One work experience entry."""
+
+    __slots__ = ('company', 'position', 'start_date', 'end_date', 'date_range',
+                 'achievements', 'tech', 'raw')
+
+    def __init__(self, raw: dict):
+        self.raw = raw
+        self.company = _text(raw.get('company'))
+        self.position = _text(raw.get('position'))
+        self.start_date = _text(raw.get('startDate'))
+        self.end_date = _text(raw.get('endDate'))
+        self.date_range = _date_range(self.start_date, self.end_date)
+        self.achievements = _text_list(raw.get('achievements'))
+        self.tech = _text_list(raw.get('tech'))
+
+
+class Project:
+    """One project entry."""
+
+    __slots__ = ('name', 'role', 'date', 'tech', 'tech_text', 'details', 'raw')
+
+    def __init__(self, raw: dict):
+        self.raw = raw
+        self.name = _text(raw.get('name'))
+        self.role = _text(raw.get('role'))
+        self.date = _text(raw.get('date'))
+        self.tech = _text_list(raw.get('tech'))
+        self.tech_text = ', '.join(self.tech)
+        self.details = _text_list(raw.get('details'))
+
+
+class Skill:
+    """One skill category."""
+
+    __slots__ = ('category', 'items', 'raw')
+
+    def __init__(self, raw: dict):
+        self.raw = raw
+        self.category = _text(raw.get('category'))
+        self.items = _text(raw.get('items'))
+
+
+class Resume:
+    """
+    Normalized resume document.
+
+    Attributes mirror resume_data.json (see references/data-formats.md) with
+    snake_case names. `data` keeps the original dictionary, e.g. for output
+    cache keys and for template fields the model does not know about.
+    """
+
+    __slots__ = ('data', 'name', 'title', 'phone', 'email', 'location', 'linkedin', 'github',
+                 'summary', 'is_fresh_graduate', 'section_order',
+                 'education', 'experience', 'projects', 'skills', 'other')
+
+    def __init__(self, data: dict):
+        self.data = data
+        self.name = _text(data.get('name'))
+        self.title = _text(data.get('title'))
+        self.phone = _text(data.get('phone'))
+        self.email = _text(data.get('email'))
+        self.location = _text(data.get('location'))
+        self.linkedin = _text(data.get('linkedin'))
+        self.github = _text(data.get('github'))
+        self.summary = _text(data.get('summary'))
+        self.is_fresh_graduate = bool(data.get('is_fresh_graduate', False))
+        self.section_order = FRESH_GRADUATE_SECTIONS if self.is_fresh_graduate else EXPERIENCED_SECTIONS
+
+        self.education = [Education(item) for item in data.get('education') or [] if isinstance(item, dict)]
+        self.experience = [Experience(item) for item in data.get('experience') or [] if isinstance(item, dict)]
+        self.projects = [Project(item) for item in data.get('projects') or [] if isinstance(item, dict)]
+        self.skills = [Skill(item) for item in data.get('skills') or [] if isinstance(item, dict)]
+        self.other = _text_list(data.get('other'))
+
+    @classmethod
+    def from_dict(cls, data) -> 'Resume':
+        """Build a model from a resume dictionary (a Resume is returned unchanged)."""
+        if isinstance(data, cls):
+            return data
+        return cls(data)
+
+    def contact_line(self, fields=('phone', 'email', 'location'), separator: str = ' | ') -> str:
+        """Join the non-empty contact fields, e.g. '139-1234-5678 | a@b.com | 上海'."""
+        return separator.join(value for value in (getattr(self, field) for field in fields) if value)
+
+    def template_context(self) -> dict:
+        """
+        Context for the HTML templates: the original data with normalized
+        list fields (`tech` is always a list) and the section order hint.
+        """
+        context = dict(self.data)
+        context['is_fresh_graduate'] = self.is_fresh_graduate
+        context['_section_order_hint'] = 'education_first' if self.is_fresh_graduate else 'experience_first'
+        if self.projects:
+            context['projects'] = [dict(p.raw, tech=p.tech, details=p.details) for p in self.projects]
+        if self.experience:
+            context['experience'] = [dict(e.raw, tech=e.tech, achievements=e.achievements)
+                                     for e in self.experience]
+        return context
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Read progress back from filled-in growth trackers.
+
+Parses the "每周任务" and "里程碑" sheets written by create_growth_tracker.py
+and reports, per tracker and per phase:
+
+- completion: action items marked done (完成状态 ✓ / 已完成) out of all items
+- estimated vs. actual hours: 预计工时 ranges ("7-10h", midpoint used) of
+  all and of completed items, against the 实际用时 the user entered
+- milestone status: 达成状态 and 实际日期 of each phase milestone
+
+Sheets are streamed row by row from the xlsx with ElementTree.iterparse
+(openpyxl is not used), so each tracker is read in one pass with bounded
+memory. Directories are processed in parallel worker processes and
+summarized into one JSON or CSV file.
+
+Usage:
+    python tracker_progress.py tracker.xlsx
+    python tracker_progress.py trackers/ --output summary.json
+    python tracker_progress.py trackers/ --format csv --output summary.csv --workers 8
+"""
+
+import csv
+import json
+import argparse
+import os
+import re
+import sys
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from datetime import date, timedelta
+from pathlib import Path
+
+from tracker_update import _NS, _IS, _V, _column_index, _sheet_parts, _shared_strings, _text
+
+
+WEEKLY_SHEET = "每周任务"
+MILESTONE_SHEET = "里程碑"
+OVERVIEW_SHEET = "总览"
+ALL_PHASES = "全部"
+
+CSV_FIELDS = ['file', 'target_position', 'phase', 'items', 'done', 'completion',
+              'estimated_hours', 'estimated_hours_done', 'actual_hours',
+              'milestones', 'milestones_achieved', 'error']
+
+_WEEK_RE = re.compile(r'^第\d+周$')
+_HOURS_RE = re.compile(r'(\d+(?:\.\d+)?)(?:\s*[-~～]\s*(\d+(?:\.\d+)?))?')
+_ROW = f'{_NS}row'
+
+
+# ========== Reading ==========
+
+def _iter_rows(archive: zipfile.ZipFile, part: str, shared_strings: list):
+    """Stream a worksheet as column -> value dictionaries (non-empty cells only), one per <row>."""
+    with archive.open(part) as f:
+        for _, row in ET.iterparse(f):
+            if row.tag != _ROW:
+                continue
+            values = {}
+            for cell in row:
+                kind = cell.get('t')
+                if kind == 'inlineStr':
+                    inline = cell.find(_IS)
+                    value = _text(inline) if inline is not None else ''
+                else:
+                    value = cell.findtext(_V) or ''
+                    if kind == 's' and value:
+                        value = shared_strings[int(value)]
+                    elif kind in (None, 'n') and value:
+                        value = float(value)
+                if value != '':
+                    values[_column_index(cell.get('r', 'A').rstrip('0123456789'))] = value
+            row.clear()
+            yield values
+
+
+def _is_done(status) -> bool:
+    """完成状态/达成状态 cell marked as done ("✓ 已完成", "已达成", "✔", ...)."""
+    status = str(status or '')
+    return '✓' in status or '✔' in status or \
+        (('完成' in status or '达成' in status) and '未' not in status)
+
+
+def _estimated_hours(text) -> float:
+    """Midpoint of a 预计工时 range such as "7-10h" (0 if there is none)."""
+    match = _HOURS_RE.search(str(text or ''))
+    if not match:
+        return 0.0
+    low = float(match.group(1))
+    high = float(match.group(2)) if match.group(2) else low
+    return (low + high) / 2
+
+
+def _actual_hours(value) -> float:
+    """实际用时 as a number ("3", 3.5, "2.5h", ...; 0 if empty)."""
+    if isinstance(value, float):
+        return value
+    match = _HOURS_RE.search(str(value or ''))
+    return float(match.group(1)) if match else 0.0
+
+
+def _date_text(value) -> str:
+    """Date cell as text (dates entered in Excel are stored as serial numbers)."""
+    if isinstance(value, float):
+        return (date(1899, 12, 30) + timedelta(days=int(value))).isoformat()
+    return value
+
+
+def _new_phase(name: str) -> dict:
+    return {'phase': name, 'items': 0, 'done': 0, 'completion': 0.0,
+            'estimated_hours': 0.0, 'estimated_hours_done': 0.0, 'actual_hours': 0.0,
+            'milestones': 0, 'milestones_achieved': 0}
+
+
+def _finish(phase: dict) -> dict:
+    phase['completion'] = round(100 * phase['done'] / phase['items'], 1) if phase['items'] else 0.0
+    for key in ('estimated_hours', 'estimated_hours_done', 'actual_hours'):
+        phase[key] = round(phase[key], 2)
+    return phase
+
+
+def read_tracker(path: str) -> dict:
+    """
+    Read progress from one tracker.
+
+    Args:
+        path: Tracker (.xlsx) written by create_growth_tracker.py
+
+    Returns:
+        Summary with overall and per-phase completion, hours and milestones
+        (or {'file', 'error'} if the file is not a readable tracker)
+    """
+    summary = {'file': str(path)}
+    try:
+        with zipfile.ZipFile(path) as archive:
+            parts = _sheet_parts(archive)
+            if WEEKLY_SHEET not in parts:
+                raise ValueError(f"no {WEEKLY_SHEET} sheet")
+            shared_strings = _shared_strings(archive)
+
+            if OVERVIEW_SHEET in parts:
+                for values in _iter_rows(archive, parts[OVERVIEW_SHEET], shared_strings):
+                    if values.get(1) == '目标职位':
+                        summary['target_position'] = values.get(2, '')
+                    elif values.get(1) == '开始日期':
+                        summary['start_date'] = _date_text(values.get(2, ''))
+
+            phases = {}
+            phase = None
+            for index, values in enumerate(_iter_rows(archive, parts[WEEKLY_SHEET], shared_strings)):
+                if not index:
+                    continue  # header
+                # The phase name is only written on a task's first row
+                phase = values.get(2, phase)
+                if not (values.get(4) and _WEEK_RE.match(str(values.get(1, '')))):
+                    continue
+                stats = phases.get(phase)
+                if stats is None:
+                    stats = phases[phase] = _new_phase(phase)
+                estimated = _estimated_hours(values.get(5))
+                stats['items'] += 1
+                stats['estimated_hours'] += estimated
+                stats['actual_hours'] += _actual_hours(values.get(8))
+                if _is_done(values.get(7)):
+                    stats['done'] += 1
+                    stats['estimated_hours_done'] += estimated
+
+            milestones = []
+            if MILESTONE_SHEET in parts:
+                for index, values in enumerate(_iter_rows(archive, parts[MILESTONE_SHEET], shared_strings)):
+                    if not index or not (values.get(2) or values.get(3)):
+                        continue
+                    achieved = _is_done(values.get(4))
+                    milestones.append({
+                        'week': values.get(1, ''),
+                        'phase': values.get(2, ''),
+                        'milestone': values.get(3, ''),
+                        'achieved': achieved,
+                        'date': _date_text(values.get(5, '')),
+                    })
+                    stats = phases.get(values.get(2))
+                    if stats is None:
+                        stats = phases[values.get(2)] = _new_phase(values.get(2))
+                    stats['milestones'] += 1
+                    stats['milestones_achieved'] += achieved
+    except (OSError, zipfile.BadZipFile, KeyError, ValueError, ET.ParseError) as e:
+        summary['error'] = f"{type(e).__name__}: {e}"
+        return summary
+
+    total = _new_phase(ALL_PHASES)
+    for stats in phases.values():
+        for key in ('items', 'done', 'estimated_hours', 'estimated_hours_done', 'actual_hours',
+                    'milestones', 'milestones_achieved'):
+            total[key] += stats[key]
+    summary['total'] = _finish(total)
+    summary['phases'] = [_finish(stats) for stats in phases.values()]
+    summary['milestones'] = milestones
+    return summary
+
+
+# ========== Directory Mode ==========
+
+def find_trackers(paths: list, pattern: str = '*.xlsx') -> list:
+    """Tracker files among `paths` (directories are searched recursively, Excel lock files skipped)."""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(p for p in path.rglob(pattern) if not p.name.startswith('~$')))
+        else:
+            files.append(path)
+    return files
+
+
+def read_trackers(files: list, workers: int = None) -> list:
+    """
+    Read many trackers, in parallel worker processes when workers > 1.
+
+    Returns:
+        Summaries in the order of `files`
+    """
+    workers = workers or os.cpu_count() or 1
+    files = [str(f) for f in files]
+    if workers == 1 or len(files) < 2:
+        return [read_tracker(f) for f in files]
+    from concurrent.futures import ProcessPoolExecutor
+    # Large chunks keep inter-process overhead small when trackers are small
+    chunksize = max(1, len(files) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(read_tracker, files, chunksize=chunksize))
+
+
+def aggregate(summaries: list) -> dict:
+    """Totals over all readable trackers."""
+    readable = [s for s in summaries if 'error' not in s]
+    total = _new_phase(ALL_PHASES)
+    for summary in readable:
+        for key in ('items', 'done', 'estimated_hours', 'estimated_hours_done', 'actual_hours',
+                    'milestones', 'milestones_achieved'):
+            total[key] += summary['total'][key]
+    result = _finish(total)
+    del result['phase']
+    completions = [s['total']['completion'] for s in readable]
+    result.update({
+        'trackers': len(summaries),
+        'errors': len(summaries) - len(readable),
+        'mean_completion': round(sum(completions) / len(completions), 1) if completions else 0.0,
+    })
+    return result
+
+
+def write_csv(summaries: list, f) -> None:
+    """One row per tracker and phase, plus a 全部 (all phases) row per tracker."""
+    writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction='ignore')
+    writer.writeheader()
+    for summary in summaries:
+        base = {'file': summary['file'], 'target_position': summary.get('target_position', '')}
+        if 'error' in summary:
+            writer.writerow({**base, 'error': summary['error']})
+            continue
+        for stats in [summary['total']] + summary['phases']:
+            writer.writerow({**base, **stats})
+
+
+def _print_summary(summary: dict) -> None:
+    if 'error' in summary:
+        print(f"❌ {summary['file']}: {summary['error']}")
+        return
+    total = summary['total']
+    print(f"📊 {summary['file']}: {total['done']}/{total['items']} 行动项完成 ({total['completion']}%), "
+          f"工时 {total['actual_hours']:g}h 实际 / {total['estimated_hours_done']:g}h 预计（已完成项）, "
+          f"里程碑 {total['milestones_achieved']}/{total['milestones']}")
+    for stats in summary['phases']:
+        print(f"   {stats['phase']}: {stats['done']}/{stats['items']} ({stats['completion']}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize progress from filled-in growth trackers")
+    parser.add_argument("paths", nargs='+', help="Tracker files or directories (searched recursively)")
+    parser.add_argument("--output", "-o", default=None, help="Write the summary to this file ('-' for stdout)")
+    parser.add_argument("--format", "-f", choices=['json', 'csv'], default=None,
+                        help="Summary format (default: from --output suffix, else json)")
+    parser.add_argument("--workers", "-w", type=int, default=None,
+                        help="Parallel worker processes (default: CPU count)")
+    parser.add_argument("--pattern", default='*.xlsx', help="File pattern in directories (default: *.xlsx)")
+
+    args = parser.parse_args()
+
+    missing = [p for p in args.paths if not Path(p).exists()]
+    if missing:
+        print(f"Error: Not found: {', '.join(missing)}")
+        sys.exit(1)
+
+    files = find_trackers(args.paths, args.pattern)
+    if not files:
+        print(f"Error: No trackers matching {args.pattern} found")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    summaries = read_trackers(files, args.workers)
+    elapsed = time.perf_counter() - start
+    totals = aggregate(summaries)
+
+    fmt = args.format or ('csv' if args.output and args.output.endswith('.csv') else 'json')
+    if args.output:
+        report = {'aggregate': totals, 'trackers': summaries}
+        if args.output == '-':
+            if fmt == 'csv':
+                write_csv(summaries, sys.stdout)
+            else:
+                print(json.dumps(report, ensure_ascii=False, indent=2))
+            return
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            if fmt == 'csv':
+                write_csv(summaries, f)
+            else:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if len(summaries) == 1:
+        _print_summary(summaries[0])
+    else:
+        rate = len(summaries) / elapsed if elapsed > 0 else 0
+        print(f"📊 {totals['trackers']} trackers in {elapsed:.2f}s ({rate:,.0f}/s): "
+              f"{totals['done']}/{totals['items']} 行动项完成 ({totals['completion']}%), "
+              f"平均完成度 {totals['mean_completion']}%, "
+              f"里程碑 {totals['milestones_achieved']}/{totals['milestones']}")
+        for summary in summaries:
+            if 'error' in summary:
+                print(f"❌ {summary['file']}: {summary['error']}")
+    if args.output:
+        print(f"📋 Summary: {args.output}")
+    if totals['errors']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+"""
+Update an existing growth tracker after the plan changes, keeping progress.
+
+Users fill in 完成状态, 实际用时 and 备注 on the weekly sheet (and 达成状态,
+实际日期 on the milestone sheet). When the plan is revised, the tracker is
+regenerated row by row and matched against the existing workbook:
+
+- a row that holds progress is matched by a stable key (task name, action
+  item and occurrence, or the milestone's phase), so it keeps the user's cells
+  even if it moves to another week or row;
+- rows whose content is unchanged are copied as they are (including any
+  formatting the user added), only renumbered if they moved;
+- changed and new rows are rewritten, with the user's cells carried over.
+
+The update edits the worksheet XML inside the xlsx directly instead of
+loading the workbook with openpyxl, so a small plan edit costs a fraction
+of a full rebuild. Workbooks the fast path cannot patch safely (sheets
+renamed or missing, shared formulas, unknown cell styles) are rebuilt with
+openpyxl and the progress merged in.
+
+Usage (from create_growth_tracker.py):
+    python create_growth_tracker.py --plan growth_plan.json --output tracker.xlsx --update
+"""
+
+import os
+import posixpath
+import re
+import tempfile
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import Counter, defaultdict, deque
+from datetime import date, datetime, timedelta
+from html import escape, unescape
+
+from create_growth_tracker import SHEET_LAYOUT, sheet_rows, _require_openpyxl, _write_sheet
+from growth_schedule import build_schedule
+from profiling import span
+
+
+# Sheet title -> columns the user fills in (1-based). Columns to the right of
+# the generated ones are treated as user columns as well.
+USER_COLUMNS = {
+    "每周任务": (7, 8, 9),   # 完成状态, 实际用时, 备注
+    "里程碑": (4, 5),        # 达成状态, 实际日期
+}
+
+_WEEK_RE = re.compile(r'^第\d+周$')
+_ROW_RE = re.compile(r'<row\b[^>]*?(?:/>|>.*?</row>)', re.S)
+_REF_RE = re.compile(r'( r="[A-Z]*)\d+"')  # row and cell references
+_DIMENSION_RE = re.compile(r'<dimension ref="[^"]*"\s*/>')
+_SHEET_RE = re.compile(r'<sheet\b[^>]*?/>')
+_RELATIONSHIP_RE = re.compile(r'<Relationship\b[^>]*?/>')
+
+_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_T, _V, _IS, _SI, _RUN = (f'{_NS}{tag}' for tag in ('t', 'v', 'is', 'si', 'r'))
+
+
+class _Fallback(Exception):
+    """The workbook cannot be patched in place; rebuild it instead."""
+
+
+# ========== Reading ==========
+
+def _column_index(letters: str) -> int:
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - 64
+    return index
+
+
+def _column_letter(index: int) -> str:
+    letters = ''
+    while index:
+        index, rest = divmod(index - 1, 26)
+        letters = chr(65 + rest) + letters
+    return letters
+
+
+def _attribute(tag: str, name: str) -> str:
+    match = re.search(rf'\b{name}="([^"]*)"', tag)
+    return unescape(match.group(1)) if match else None
+
+
+def _text(element) -> str:
+    """Text of an inline string or shared string item (rich text runs joined, phonetic runs skipped)."""
+    text = element.findtext(_T)
+    if text is not None:
+        return text
+    return ''.join(run.findtext(_T) or '' for run in element.iter(_RUN))
+
+
+class _Row:
+    """One <row> of an existing sheet."""
+
+    __slots__ = ('number', 'xml', 'styles', 'values')
+
+    def __init__(self, number: int, xml: str, styles: dict, values: dict):
+        self.number = number
+        self.xml = xml
+        self.styles = styles    # column -> style index, for every cell in the row
+        self.values = values    # column -> text (non-empty cells only)
+
+    def cell_xml(self, column: int) -> str:
+        ref = _column_letter(column) + str(self.number)
+        return re.search(rf'<c\b[^>]*?\br="{ref}"[^>]*?(?:/>|>.*?</c>)', self.xml, re.S).group(0)
+
+
+def _parse_rows(sheet_xml: str, shared_strings: list) -> tuple:
+    """
+    Split a worksheet into rows.
+
+    Values are read with ElementTree (expat decodes the character references
+    openpyxl writes for non-ASCII text much faster than Python can); the raw
+    XML of each row is kept so unchanged rows can be copied as they are.
+
+    Returns:
+        (rows, sheetData span in sheet_xml)
+    """
+    begin = sheet_xml.find('<sheetData')
+    end = sheet_xml.find('</sheetData>', begin) + len('</sheetData>')
+    if begin < 0 or end < len('</sheetData>'):
+        if '<sheetData/>' not in sheet_xml:
+            raise _Fallback("no sheetData")
+        begin = sheet_xml.find('<sheetData/>')
+        end = begin + len('<sheetData/>')
+    row_sources = _ROW_RE.findall(sheet_xml, begin, end)
+    sheet_data = ET.fromstring(sheet_xml.encode('utf-8')).find(f'{_NS}sheetData')
+    row_elements = list(sheet_data) if sheet_data is not None else []
+    if len(row_sources) != len(row_elements):
+        raise _Fallback("unexpected sheet markup")
+
+    rows = []
+    for row_xml, row in zip(row_sources, row_elements):
+        number = row.get('r')
+        if number is None:
+            raise _Fallback("row without a row number")
+        styles = {}
+        values = {}
+        for cell in row:
+            ref = cell.get('r')
+            if ref is None:
+                raise _Fallback("cell without a reference")
+            column = _column_index(ref.rstrip('0123456789'))
+            styles[column] = cell.get('s')
+            kind = cell.get('t')
+            if kind == 'inlineStr':
+                inline = cell.find(_IS)
+                text = _text(inline) if inline is not None else ''
+            else:
+                text = cell.findtext(_V) or ''
+                if kind == 's' and text:
+                    text = shared_strings[int(text)]
+            if text:
+                values[column] = text
+        rows.append(_Row(int(number), row_xml, styles, values))
+    return rows, (begin, end)
+
+
+def _shared_strings(archive: zipfile.ZipFile) -> list:
+    try:
+        xml = archive.read('xl/sharedStrings.xml')
+    except KeyError:
+        return []
+    return [_text(item) for item in ET.fromstring(xml).iter(_SI)]
+
+
+def _sheet_parts(archive: zipfile.ZipFile) -> dict:
+    """Sheet title -> worksheet part name in the archive."""
+    workbook = archive.read('xl/workbook.xml').decode('utf-8')
+    rels = archive.read('xl/_rels/workbook.xml.rels').decode('utf-8')
+    targets = {}
+    for tag in _RELATIONSHIP_RE.findall(rels):
+        target = _attribute(tag, 'Target')
+        if target.startswith('/'):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join('xl', target))
+        targets[_attribute(tag, 'Id')] = target
+    parts = {}
+    for tag in _SHEET_RE.findall(workbook):
+        parts[_attribute(tag, 'name')] = targets.get(_attribute(tag, 'r:id'))
+    return parts
+
+
+def _start_date(rows: list):
+    """Plan start date shown on the overview sheet (开始日期), or None."""
+    for row in rows:
+        if row.values.get(1) == '开始日期':
+            value = row.values.get(2, '')
+            try:
+                return datetime.strptime(value, '%Y-%m-%d').date()
+            except ValueError:
+                pass
+            try:  # Excel date serial number (the user re-entered the date)
+                return date(1899, 12, 30) + timedelta(days=int(float(value)))
+            except ValueError:
+                return None
+    return None
+
+
+def _row_keys(title: str, rows: list) -> list:
+    """
+    Stable key of each row that holds user progress (None for other rows).
+
+    Args:
+        title: Sheet title
+        rows: Column -> value dictionaries, one per row (row 1 is the header)
+    """
+    keys = []
+    seen = Counter()
+    task = None
+    for index, values in enumerate(rows):
+        key = None
+        if index and title == "每周任务":
+            task = values.get(3) or task  # the task name is only written on its first row
+            if values.get(4) and _WEEK_RE.match(str(values.get(1, ''))):
+                key = (task, values[4])
+        elif index and title == "里程碑" and (values.get(2) or values.get(3)):
+            key = (values.get(2),)  # the phase; its milestone text may be revised
+        if key is not None:
+            seen[key] += 1
+            key += (seen[key],)
+        keys.append(key)
+    return keys
+
+
+# ========== Writing ==========
+
+def _item_value(item):
+    return item[0] if isinstance(item, tuple) else item
+
+
+def _row_values(row: list) -> dict:
+    """Column -> value of a generated row (non-empty cells only)."""
+    return {column: value for column, value in
+            ((column, _item_value(item)) for column, item in enumerate(row, 1))
+            if value not in (None, '')}
+
+
+def _cell_xml(ref: str, value, style) -> str:
+    style = f' s="{style}"' if style is not None else ''
+    if value in (None, ''):
+        return f'<c r="{ref}"{style}/>' if style else ''
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f'<c r="{ref}"{style}><v>{value}</v></c>'
+    return f'<c r="{ref}"{style} t="inlineStr"><is><t xml:space="preserve">{escape(str(value), quote=False)}</t></is></c>'
+
+
+def _renumber(xml: str, number: int) -> str:
+    """Move a row (or cell) to another row number."""
+    if '<f' in xml:
+        raise _Fallback("formula in a moved row")
+    suffix = f'{number}"'
+    return _REF_RE.sub(lambda match: match.group(1) + suffix, xml)
+
+
+class _SheetPatch:
+    """Diff of a sheet's generated rows against its existing rows."""
+
+    def __init__(self, title: str, rows: list, existing: list):
+        self.title = title
+        self.rows = rows
+        self.existing = existing
+        self.width = max(_column_index(letter) for letter in SHEET_LAYOUT[title][0])
+        self.user_columns = set(USER_COLUMNS.get(title, ()))
+        self.stats = Counter()
+
+    def _plan_values(self, values: dict, keyed: bool) -> dict:
+        """Values of the columns generated from the plan (user columns excluded on keyed rows)."""
+        return {column: value for column, value in values.items()
+                if column <= self.width and not (keyed and column in self.user_columns)}
+
+    def _is_user_column(self, column: int) -> bool:
+        return column in self.user_columns or column > self.width
+
+    def build(self) -> str:
+        """
+        Patched sheetData content, or None if the sheet is unchanged.
+
+        Raises:
+            _Fallback: A generated style has no counterpart in the existing sheet
+        """
+        existing = self.existing
+        by_key = {}
+        by_content = defaultdict(deque)
+        for key, row in zip(_row_keys(self.title, [row.values for row in existing]), existing):
+            if key is not None:
+                by_key[key] = row
+            else:
+                by_content[tuple(sorted(self._plan_values(row.values, False).items()))].append(row)
+
+        generated = [_row_values(row) for row in self.rows]
+        keys = _row_keys(self.title, generated)
+
+        # Pair every generated row with the existing row it replaces
+        plan = []
+        styles = defaultdict(Counter)
+        for row, values, key in zip(self.rows, generated, keys):
+            if not row:
+                plan.append((row, None, False))
+                continue
+            if key is not None:
+                old = by_key.pop(key, None)
+                same = old is not None and \
+                    self._plan_values(old.values, True) == self._plan_values(values, True)
+            else:
+                queue = by_content.get(tuple(sorted(self._plan_values(values, False).items())))
+                old = queue.popleft() if queue else None
+                same = old is not None
+            if same:
+                # Learn this workbook's style index for each generated style
+                for column, item in enumerate(row, 1):
+                    if isinstance(item, tuple) and column in old.styles and not \
+                            (key is not None and self._is_user_column(column)):
+                        styles[item[1]][old.styles[column]] += 1
+            plan.append((row, old, same))
+        self.styles = {name: counts.most_common(1)[0][0] for name, counts in styles.items()}
+
+        parts = []
+        number = 0
+        changed = len(existing) != sum(1 for row, _, _ in plan if row)
+        for row, old, same in plan:
+            number += 1
+            if not row:
+                continue
+            if same:
+                if old.number == number:
+                    parts.append(old.xml)
+                    self.stats['kept'] += 1
+                else:
+                    parts.append(_renumber(old.xml, number))
+                    self.stats['moved'] += 1
+                    changed = True
+                continue
+            parts.append(self._row_xml(row, number, old))
+            self.stats['rewritten' if old is not None else 'added'] += 1
+            changed = True
+        # Rows that are not in the plan any more (empty rows left by other writers are not counted)
+        leftover = list(by_key.values()) + [row for queue in by_content.values() for row in queue]
+        self.stats['removed'] = sum(1 for row in leftover if row.values)
+        self.rows_written = number
+        return ''.join(parts) if changed or leftover else None
+
+    def _row_xml(self, row: list, number: int, old) -> str:
+        """XML of a generated row; the user's cells are carried over from `old` (if it had progress)."""
+        cells = {}
+        for column, item in enumerate(row, 1):
+            value, style = (item[0], item[1]) if isinstance(item, tuple) else (item, None)
+            if style is not None:
+                if style not in self.styles:
+                    raise _Fallback(f"style {style} not found in sheet {self.title}")
+                style = self.styles[style]
+            cells[column] = _cell_xml(f"{_column_letter(column)}{number}", value, style)
+        if old is not None and self.user_columns:
+            for column in old.styles:
+                if self._is_user_column(column):
+                    cells[column] = _renumber(old.cell_xml(column), number)
+        body = ''.join(cells[column] for column in sorted(cells))
+        return f'<row r="{number}">{body}</row>'
+
+
+def _patch_archive(path: str, plan_data: dict, start_date: date) -> tuple:
+    """
+    Patch the worksheets of an existing tracker.
+
+    Returns:
+        (replaced parts {name: bytes}, row statistics)
+    """
+    with zipfile.ZipFile(path) as archive:
+        names = set(archive.namelist())
+        if 'xl/calcChain.xml' in names:
+            raise _Fallback("workbook has formulas")
+        parts = _sheet_parts(archive)
+        if any(parts.get(title) not in names for title in SHEET_LAYOUT):
+            raise _Fallback("tracker sheets renamed or missing")
+        shared_strings = _shared_strings(archive)
+        sheets = {}
+        for title in SHEET_LAYOUT:
+            xml = archive.read(parts[title]).decode('utf-8')
+            if 't="shared"' in xml:
+                raise _Fallback("shared formulas")
+            sheets[title] = (xml,) + _parse_rows(xml, shared_strings)
+
+    if start_date is None:
+        start_date = _start_date(sheets["总览"][1])
+    schedule = build_schedule(plan_data, start_date)
+
+    replaced = {}
+    stats = Counter()
+    for title, rows in sheet_rows(schedule).items():
+        xml, existing, (begin, end) = sheets[title]
+        patch = _SheetPatch(title, list(rows), existing)
+        content = patch.build()
+        stats.update(patch.stats)
+        if content is None:
+            continue
+        last_column = max([patch.width] + [max(row.styles, default=1) for row in existing])
+        dimension = f'<dimension ref="A1:{_column_letter(last_column)}{max(patch.rows_written, 1)}"/>'
+        xml = xml[:begin] + f'<sheetData>{content}</sheetData>' + xml[end:]
+        replaced[parts[title]] = _DIMENSION_RE.sub(dimension, xml, count=1).encode('utf-8')
+    return replaced, stats
+
+
+def _write_archive(source: str, output_path: str, replaced: dict) -> None:
+    """Copy the archive with some parts replaced (atomically, via a temporary file)."""
+    directory = os.path.dirname(os.path.abspath(output_path))
+    fd, tmp_path = tempfile.mkstemp(suffix='.xlsx', dir=directory)
+    os.close(fd)
+    try:
+        with zipfile.ZipFile(source) as zin, zipfile.ZipFile(tmp_path, 'w') as zout:
+            for info in zin.infolist():
+                data = replaced.get(info.filename)
+                zout.writestr(info, data if data is not None else zin.read(info.filename))
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+# ========== Rebuild Fallback ==========
+
+def _read_progress(path: str) -> tuple:
+    """
+    Read user progress with openpyxl.
+
+    Returns:
+        (sheet title -> {row key: {column: value}}, start date or None)
+    """
+    import openpyxl
+    wb = openpyxl.load_workbook(path, read_only=True)
+    progress = {}
+    start_date = None
+    try:
+        if "总览" in wb.sheetnames:
+            for label, value, *_ in wb["总览"].iter_rows(min_col=1, max_col=2, values_only=True):
+                if label == '开始日期':
+                    if isinstance(value, datetime):
+                        start_date = value.date()
+                    elif isinstance(value, str):
+                        try:
+                            start_date = datetime.strptime(value, '%Y-%m-%d').date()
+                        except ValueError:
+                            pass
+        for title, columns in USER_COLUMNS.items():
+            if title not in wb.sheetnames:
+                continue
+            rows = [{column: value for column, value in enumerate(row, 1) if value not in (None, '')}
+                    for row in wb[title].iter_rows(values_only=True)]
+            progress[title] = {key: {column: values.get(column) for column in columns}
+                               for key, values in zip(_row_keys(title, rows), rows) if key is not None}
+    finally:
+        wb.close()
+    return progress, start_date
+
+
+def _rebuild(plan_data: dict, path: str, output_path: str, start_date: date) -> None:
+    _require_openpyxl()
+    import openpyxl
+    progress, saved_start = _read_progress(path)
+    schedule = build_schedule(plan_data, start_date or saved_start)
+
+    wb = openpyxl.Workbook()
+    wb.remove(wb['Sheet'])
+    for title, rows in sheet_rows(schedule).items():
+        rows = list(rows)
+        sheet_progress = progress.get(title, {})
+        if sheet_progress:
+            for row, key in zip(rows, _row_keys(title, [_row_values(row) for row in rows])):
+                for column, value in sheet_progress.get(key, {}).items():
+                    item = row[column - 1]
+                    row[column - 1] = (value, item[1]) if isinstance(item, tuple) else value
+        widths, merged = SHEET_LAYOUT[title]
+        _write_sheet(wb, title, widths, rows, merged)
+    wb.save(output_path)
+
+
+# ========== Public API ==========
+
+def update_growth_tracker(plan_data: dict, tracker_path: str, output_path: str = None,
+                          start_date: date = None) -> dict:
+    """
+    Update a tracker to a revised plan, keeping the user's progress.
+
+    Args:
+        plan_data: Revised growth plan dictionary
+        tracker_path: Existing tracker (.xlsx) written by create_growth_tracker
+        output_path: Where to write the result (default: update tracker_path in place)
+        start_date: New plan start date (default: the 开始日期 shown in the tracker)
+
+    Returns:
+        Row statistics: kept, moved, rewritten, added, removed (and 'rebuilt' if
+        the workbook had to be rebuilt)
+    """
+    output_path = output_path or tracker_path
+    try:
+        with span('update/patch'):
+            replaced, stats = _patch_archive(tracker_path, plan_data, start_date)
+    except _Fallback as e:
+        with span('update/rebuild'):
+            _rebuild(plan_data, tracker_path, output_path, start_date)
+        print(f"⚠️  Tracker rebuilt instead of patched ({e}); progress was carried over")
+        return {'rebuilt': 1}
+
+    with span('update/write'):
+        if replaced or output_path != tracker_path:
+            _write_archive(tracker_path, output_path, replaced)
+    return dict(stats)
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Validate resume_data.json and growth_plan.json against the documented schemas.
+
+The schemas in references/data-formats.md are declared below as plain
+dictionaries and compiled once into nested checker functions, so validating
+a record is a single pass over its fields. All errors are collected with
+their field path (e.g. `skills[2].category`) instead of stopping at the first.
+
+Usage:
+    python validate_data.py resume_data.json
+    python validate_data.py --kind growth growth_plan.json
+    python validate_data.py --batch resumes.jsonl --summary summary.json
+"""
+
+import json
+import argparse
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+
+# ========== Schemas ==========
+# type: JSON type name, or a tuple of accepted names
+# required: field must be present (and not null)
+# required_any: (objects) at least one of these fields must be present
+# nonempty: strings must not be blank, arrays must not be empty
+
+_STRING = {'type': 'string'}
+_STRING_LIST = {'type': 'array', 'items': {'type': 'string'}}
+
+RESUME_SCHEMA = {
+    'type': 'object',
+    'fields': {
+        'name': {'type': 'string', 'required': True, 'nonempty': True},
+        'title': _STRING,
+        'phone': _STRING,
+        'email': _STRING,
+        'location': _STRING,
+        'linkedin': _STRING,
+        'github': _STRING,
+        'is_fresh_graduate': {'type': 'boolean'},
+        'summary': _STRING,
+        'education': {'type': 'array', 'items': {
+            'type': 'object',
+            'fields': {
+                'school': {'type': 'string', 'required': True, 'nonempty': True},
+                'degree': _STRING,
+                'major': _STRING,
+                'startDate': _STRING,
+                'endDate': _STRING,
+                'gpa': {'type': ('string', 'number')},
+            },
+        }},
+        'projects': {'type': 'array', 'items': {
+            'type': 'object',
+            'fields': {
+                'name': {'type': 'string', 'required': True, 'nonempty': True},
+                'role': _STRING,
+                'date': _STRING,
+                'tech': {'type': ('array', 'string'), 'items': {'type': 'string'}},
+                'details': _STRING_LIST,
+            },
+        }},
+        'experience': {'type': 'array', 'items': {
+            'type': 'object',
+            'fields': {
+                'company': {'type': 'string', 'required': True, 'nonempty': True},
+                'position': _STRING,
+                'startDate': _STRING,
+                'endDate': _STRING,
+                'tech': {'type': ('array', 'string'), 'items': {'type': 'string'}},
+                'achievements': _STRING_LIST,
+            },
+        }},
+        'skills': {'type': 'array', 'items': {
+            'type': 'object',
+            'fields': {
+                'category': {'type': 'string', 'required': True, 'nonempty': True},
+                'items': {'type': 'string', 'required': True},
+            },
+        }},
+        'other': _STRING_LIST,
+    },
+}
+
+GROWTH_PLAN_SCHEMA = {
+    'type': 'object',
+    'fields': {
+        'target_position': {'type': 'string', 'required': True, 'nonempty': True},
+        'current_level': {'type': 'string', 'required': True},
+        'timeline': {'type': 'string', 'required': True, 'nonempty': True},
+        'phases': {'type': 'array', 'required': True, 'nonempty': True, 'items': {
+            'type': 'object',
+            'required_any': ('phase', 'title'),
+            'fields': {
+                'phase': _STRING,
+                'title': _STRING,
+                'goals': _STRING_LIST,
+                'tasks': {'type': 'array', 'required': True, 'items': {
+                    'type': 'object',
+                    'fields': {
+                        'task': {'type': 'string', 'required': True, 'nonempty': True},
+                        'deadline': _STRING,
+                        'resources': _STRING_LIST,
+                        'deliverable': _STRING,
+                    },
+                }},
+                'milestone': {'type': 'string', 'required': True},
+            },
+        }},
+    },
+}
+
+SCHEMAS = {
+    'resume': RESUME_SCHEMA,
+    'growth': GROWTH_PLAN_SCHEMA,
+}
+
+_JSON_TYPES = {
+    'string': str,
+    'number': (int, float),
+    'boolean': bool,
+    'object': dict,
+    'array': list,
+}
+
+_INDEX_RE = re.compile(r'\[\d+\]')
+
+
+# ========== Compilation ==========
+
+def _json_type(value) -> str:
+    """JSON type name of a parsed value (for error messages)."""
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, (int, float)):
+        return 'number'
+    for name, py_type in _JSON_TYPES.items():
+        if isinstance(value, py_type):
+            return name
+    return type(value).__name__
+
+
+def _join(parent: str, key) -> str:
+    """Field path of `key` below `parent`, e.g. ('skills', 2) -> 'skills[2]'."""
+    if isinstance(key, int):
+        return f"{parent}[{key}]"
+    return f"{parent}.{key}" if parent else key
+
+
+def compile_schema(schema: dict):
+    """
+    Compile a schema dictionary into a checker function.
+
+    The checker is called as check(value, parent_path, key, errors) and appends
+    (path, code, message) tuples to `errors`. Paths are only built when an error
+    is reported or when descending into an object/array, so valid scalar fields
+    cost one isinstance() call.
+
+    Error codes: 'required', 'type', 'empty'.
+    """
+    names = schema['type'] if isinstance(schema['type'], tuple) else (schema['type'],)
+    py_types = tuple(t for name in names for t in
+                     (_JSON_TYPES[name] if isinstance(_JSON_TYPES[name], tuple) else (_JSON_TYPES[name],)))
+    allow_bool = 'boolean' in names
+    expected = ' or '.join(names)
+    nonempty = schema.get('nonempty', False)
+    fields = [(key, compile_schema(sub), sub.get('required', False))
+              for key, sub in schema.get('fields', {}).items()]
+    required_any = schema.get('required_any', ())
+    check_item = compile_schema(schema['items']) if 'items' in schema else None
+
+    def check_type(value, parent, key, errors) -> bool:
+        # bool is a subclass of int; only accept it where booleans are expected
+        if not isinstance(value, py_types) or (value.__class__ is bool and not allow_bool):
+            errors.append((_join(parent, key), 'type', f"expected {expected}, got {_json_type(value)}"))
+            return False
+        if nonempty and not (value.strip() if isinstance(value, str) else value):
+            errors.append((_join(parent, key), 'empty', "must not be empty"))
+        return True
+
+    # Specialize the checker by shape so scalar fields skip the container logic
+    if not fields and check_item is None:
+        if nonempty or 'number' in names:
+            check = check_type
+        else:
+            def check(value, parent, key, errors):
+                if not isinstance(value, py_types):
+                    check_type(value, parent, key, errors)
+    elif fields:
+        def check(value, parent, key, errors):
+            if not check_type(value, parent, key, errors) or not isinstance(value, dict):
+                return
+            path = _join(parent, key)
+            get = value.get
+            for field, check_field, required in fields:
+                field_value = get(field)
+                if field_value is None:
+                    if required:
+                        errors.append((_join(path, field), 'required', "required field is missing"))
+                    continue
+                check_field(field_value, path, field, errors)
+            if required_any and all(get(field) is None for field in required_any):
+                errors.append((path, 'required', f"one of {', '.join(required_any)} is required"))
+    else:
+        def check(value, parent, key, errors):
+            if not check_type(value, parent, key, errors) or not isinstance(value, list):
+                return
+            path = _join(parent, key)
+            for index, item in enumerate(value):
+                check_item(item, path, index, errors)
+
+    return check
+
+
+_VALIDATORS = {kind: compile_schema(schema) for kind, schema in SCHEMAS.items()}
+
+
+# ========== Validation API ==========
+
+def detect_kind(data) -> str:
+    """Guess whether a record is a growth plan or resume data."""
+    if isinstance(data, dict) and 'phases' in data and 'name' not in data:
+        return 'growth'
+    return 'resume'
+
+
+def validate(data, kind: str = 'resume') -> list:
+    """
+    Validate one parsed record.
+
+    Args:
+        data: Parsed JSON data
+        kind: 'resume', 'growth' or 'auto'
+
+    Returns:
+        List of {'path', 'code', 'message'} dictionaries (empty if valid)
+    """
+    if kind == 'auto':
+        kind = detect_kind(data)
+    errors = []
+    _VALIDATORS[kind](data, '', '', errors)
+    return [{'path': path or '(root)', 'code': code, 'message': message}
+            for path, code, message in errors]
+
+
+def format_errors(errors: list) -> list:
+    """Format validation errors as 'path: message' lines."""
+    return [f"{error['path']}: {error['message']}" for error in errors]
+
+
+def error_pattern(error: dict) -> str:
+    """Error type for summaries: code plus path without indexes, e.g. 'required skills[].category'."""
+    return f"{error['code']} {_INDEX_RE.sub('[]', error['path'])}"
+
+
+def validate_jsonl(lines, kind: str = 'auto') -> dict:
+    """
+    Validate newline-delimited JSON records.
+
+    Args:
+        lines: Iterable of JSONL lines (blank lines are skipped)
+        kind: 'resume', 'growth' or 'auto' (detected per record)
+
+    Returns:
+        Summary with totals, per-error-type counts and the invalid records
+    """
+    loads = json.loads
+    total = valid = 0
+    by_code = Counter()
+    by_pattern = Counter()
+    invalid = []
+
+    for line_no, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        total += 1
+        try:
+            data = loads(line)
+        except json.JSONDecodeError as e:
+            errors = [{'path': '(root)', 'code': 'json', 'message': f"invalid JSON: {e}"}]
+        else:
+            errors = validate(data, kind)
+        if not errors:
+            valid += 1
+            continue
+        for error in errors:
+            by_code[error['code']] += 1
+            by_pattern[error_pattern(error)] += 1
+        invalid.append({'line': line_no, 'errors': errors})
+
+    return {
+        'total': total,
+        'valid': valid,
+        'invalid': total - valid,
+        'error_codes': dict(by_code.most_common()),
+        'error_types': dict(by_pattern.most_common()),
+        'records': invalid,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate resume/growth plan JSON against the documented schema")
+    parser.add_argument("file", help="JSON file, or JSONL file with --batch ('-' for stdin)")
+    parser.add_argument("--kind", "-k", choices=['auto', 'resume', 'growth'], default='auto',
+                        help="Data format (default: auto-detect)")
+    parser.add_argument("--batch", "-b", action="store_true",
+                        help="Validate a JSONL file with one record per line")
+    parser.add_argument("--summary", default=None,
+                        help="Batch mode: write the summary and per-record errors as JSON to this file")
+    parser.add_argument("--top", type=int, default=20,
+                        help="Batch mode: number of error types to print (default: 20)")
+
+    args = parser.parse_args()
+
+    if args.file != '-' and not Path(args.file).exists():
+        print(f"Error: File not found: {args.file}")
+        sys.exit(1)
+
+    if args.batch:
+        start = time.perf_counter()
+        if args.file == '-':
+            summary = validate_jsonl(sys.stdin, args.kind)
+        else:
+            with open(args.file, 'r', encoding='utf-8') as f:
+                summary = validate_jsonl(f, args.kind)
+        elapsed = time.perf_counter() - start
+        summary['seconds'] = round(elapsed, 4)
+
+        if args.summary:
+            with open(args.summary, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, ensure_ascii=False, indent=2)
+
+        rate = summary['total'] / elapsed if elapsed > 0 else 0
+        mark = '✅' if not summary['invalid'] else '❌'
+        print(f"{mark} {summary['total']} records in {elapsed:.3f}s ({rate:,.0f} records/s): "
+              f"{summary['valid']} valid, {summary['invalid']} invalid")
+        if summary['error_types']:
+            print("Error types:")
+            for pattern, count in list(summary['error_types'].items())[:args.top]:
+                print(f"  {count:>8}  {pattern}")
+        if summary['invalid']:
+            sys.exit(1)
+        return
+
+    with open(args.file, 'r', encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            print(f"Error: Invalid JSON in {args.file}: {e}")
+            sys.exit(1)
+
+    kind = detect_kind(data) if args.kind == 'auto' else args.kind
+    errors = validate(data, kind)
+    label = 'growth plan' if kind == 'growth' else 'resume data'
+    if errors:
+        print(f"❌ {args.file}: {len(errors)} error(s) in {label}")
+        for line in format_errors(errors):
+            print(f"  - {line}")
+        sys.exit(1)
+    print(f"✅ {args.file}: valid {label}")
+
+
+if __name__ == "__main__":
+    main()
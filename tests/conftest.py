@@ -0,0 +1,7 @@
+"""Make the scripts in scripts/current importable from the tests."""
+
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / 'scripts' / 'current'))
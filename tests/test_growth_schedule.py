@@ -0,0 +1,38 @@
+"""Deadline dates of the growth plan schedule."""
+
+import json
+from datetime import date
+from pathlib import Path
+
+from growth_schedule import build_schedule
+
+EXAMPLE = Path(__file__).resolve().parent.parent / 'examples' / 'growth_plan_example.json'
+
+
+def _plan() -> dict:
+    with open(EXAMPLE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _due_dates(schedule) -> list:
+    return [row['due_date'] for row in schedule.rows() if row['due_date']]
+
+
+def test_weekend_start_never_has_deadlines_before_the_start_date():
+    start = date(2026, 10, 17)  # Saturday
+    schedule = build_schedule(_plan(), start)
+    assert _due_dates(schedule)
+    assert min(_due_dates(schedule)) >= start.isoformat()
+
+
+def test_this_friday_moves_to_next_week_when_already_past():
+    schedule = build_schedule(_plan(), date(2026, 10, 17))
+    first = next(row for row in schedule.rows() if row['deadline'] == '本周五')
+    assert first['week'] == 1
+    assert first['due_date'] == '2026-10-23'
+
+
+def test_monday_start_keeps_this_week_deadlines():
+    schedule = build_schedule(_plan(), date(2026, 10, 12))
+    first = next(row for row in schedule.rows() if row['deadline'] == '本周五')
+    assert first['due_date'] == '2026-10-16'
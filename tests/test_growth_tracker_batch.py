@@ -0,0 +1,51 @@
+"""Error handling of the growth tracker batch and cohort modes."""
+
+import json
+import shutil
+from datetime import date
+from pathlib import Path
+
+from create_growth_tracker import create_cohort_tracker, create_growth_trackers_batch
+
+EXAMPLE = Path(__file__).resolve().parent.parent / 'examples' / 'growth_plan_example.json'
+START = date(2026, 10, 12)
+
+
+def _plan_dir(tmp_path: Path) -> Path:
+    plans = tmp_path / 'plans'
+    plans.mkdir()
+    shutil.copy(EXAMPLE, plans / 'a_valid.json')
+    (plans / 'b_latin1.json').write_bytes('{"target_position": "后端"}'.encode('gbk'))
+    (plans / 'c_broken.json').write_text('{"target_position": ', encoding='utf-8')
+    (plans / 'd_invalid.json').write_text(json.dumps({'phases': []}), encoding='utf-8')
+    return plans
+
+
+def _errors(summary: dict) -> dict:
+    return {Path(r['file']).name: r['error'].split(':')[0]
+            for r in summary['records'] if r['status'] == 'error'}
+
+
+def test_batch_reports_bad_files_and_writes_the_rest(tmp_path):
+    summary = create_growth_trackers_batch(_plan_dir(tmp_path), tmp_path / 'out', workers=1,
+                                           start_date=START)
+    assert (summary['total'], summary['succeeded'], summary['failed']) == (4, 1, 3)
+    assert _errors(summary) == {'b_latin1.json': 'UnicodeDecodeError',
+                                'c_broken.json': 'JSONDecodeError',
+                                'd_invalid.json': 'ValidationError'}
+    assert (tmp_path / 'out' / '000001.xlsx').exists()
+
+
+def test_cohort_reports_bad_files_and_writes_the_rest(tmp_path):
+    output = tmp_path / 'cohort.xlsx'
+    summary = create_cohort_tracker(_plan_dir(tmp_path), str(output), START)
+    assert (summary['succeeded'], summary['failed']) == (1, 3)
+    assert 'b_latin1.json' in _errors(summary)
+    assert output.exists()
+
+
+def test_jsonl_lines_are_reported_by_line_number(tmp_path):
+    lines = [EXAMPLE.read_text(encoding='utf-8').replace('\n', ' '), '{not json', '']
+    summary = create_growth_trackers_batch(lines, tmp_path / 'out', workers=1, start_date=START)
+    assert summary['succeeded'] == 1
+    assert [(r['line'], r['status']) for r in summary['records']] == [(1, 'ok'), (2, 'error')]
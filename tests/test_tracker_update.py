@@ -0,0 +1,75 @@
+"""Progress is kept when a tracker is updated, on the fast path and on the rebuild fallback."""
+
+import copy
+import json
+from datetime import date
+from pathlib import Path
+
+import openpyxl
+
+from create_growth_tracker import create_growth_tracker
+from tracker_update import update_growth_tracker
+
+EXAMPLE = Path(__file__).resolve().parent.parent / 'examples' / 'growth_plan_example.json'
+START = date(2026, 10, 12)
+WEEKLY = "每周任务"
+
+
+def _plan() -> dict:
+    with open(EXAMPLE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _revised(plan: dict) -> dict:
+    """One task inserted near the top, so every later row moves down."""
+    plan = copy.deepcopy(plan)
+    plan['phases'][0]['tasks'].insert(1, {'task': '学习Kafka消息队列', 'deadline': '第3周',
+                                          'resources': ['《Kafka权威指南》']})
+    return plan
+
+
+def _fill_last_row(path: Path, note) -> tuple:
+    """Mark the last action item done (with a note); returns its (task, action) key."""
+    wb = openpyxl.load_workbook(path)
+    ws = wb[WEEKLY]
+    row = max(r for r in range(2, ws.max_row + 1) if ws.cell(r, 4).value)
+    ws.cell(row, 7).value = '✓'
+    ws.cell(row, 9).value = note
+    key = (ws.cell(row, 3).value, ws.cell(row, 4).value)
+    wb.save(path)
+    return key
+
+
+def _progress(path: Path, key: tuple) -> list:
+    """(完成状态, 备注) of every row with this (task, action), in sheet order."""
+    ws = openpyxl.load_workbook(path)[WEEKLY]
+    return [(ws.cell(r, 7).value, ws.cell(r, 9).value) for r in range(2, ws.max_row + 1)
+            if (ws.cell(r, 3).value, ws.cell(r, 4).value) == key]
+
+
+def test_update_patches_and_keeps_progress(tmp_path):
+    path = tmp_path / 'tracker.xlsx'
+    create_growth_tracker(_plan(), str(path), start_date=START)
+    key = _fill_last_row(path, '已完成')
+    before = _progress(path, key)
+
+    stats = update_growth_tracker(_revised(_plan()), str(path))
+
+    assert 'rebuilt' not in stats
+    assert stats['added'] > 0
+    assert ('✓', '已完成') in before
+    assert _progress(path, key) == before
+
+
+def test_update_falls_back_to_rebuild_and_keeps_progress(tmp_path):
+    path = tmp_path / 'tracker.xlsx'
+    create_growth_tracker(_plan(), str(path), start_date=START)
+    # A formula in a row that moves cannot be patched in place
+    key = _fill_last_row(path, '=1+1')
+    before = _progress(path, key)
+
+    stats = update_growth_tracker(_revised(_plan()), str(path))
+
+    assert stats == {'rebuilt': 1}
+    assert ('✓', '=1+1') in before
+    assert _progress(path, key) == before
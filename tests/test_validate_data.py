@@ -0,0 +1,22 @@
+import copy
+import json
+from pathlib import Path
+
+from validate_data import validate
+
+
+PLAN = json.loads((Path(__file__).resolve().parents[1] / 'examples' / 'growth_plan_example.json')
+                  .read_text(encoding='utf-8'))
+
+
+def test_phase_needs_only_phase_or_title():
+    plan = copy.deepcopy(PLAN)
+    for phase in plan['phases']:
+        phase.pop('title')
+        phase.pop('goals')
+    assert validate(plan, 'growth') == []
+
+    plan['phases'][1].pop('phase')
+    assert validate(plan, 'growth') == [
+        {'path': 'phases[1]', 'code': 'required', 'message': 'one of phase, title is required'},
+    ]